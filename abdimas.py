@@ -4,6 +4,7 @@ import plotly.express as px
 
 # Import our enhanced modules
 from data_manager import get_val, set_val
+from indicator_registry import get_component
 
 def main():
     # Set page config without conflicting with main app
@@ -17,20 +18,9 @@ def main():
     st.markdown("Masukkan data pengabdian pada tabel di kiri. Input PM7 dalam Juta Rupiah.")
     st.divider()
 
-    # --- KONSTANTA RUMUS ---
-    PEMBAGI_NORMALISASI_COM = 447937.99   # Angka pembagi sesuai request
-
-    # --- DATA COMMUNITY SERVICE ---
-    # Format: (Kode, Nama Item, Bobot, Nilai Default from UPN Veteran Yogyakarta profile)
-    data_com = [
-        ("PM1", "JUMLAH PENGABDIAN MASYARAKAT INTERNASIONAL (KETUA)", 40, 0.0),
-        ("PM2", "JUMLAH PENGABDIAN MASYARAKAT INTERNASIONAL (ANGGOTA)", 10, 0.0),
-        ("PM3", "JUMLAH PENGABDIAN MASYARAKAT NASIONAL/EKSTERNAL (KETUA)", 30, 9.0),
-        ("PM4", "JUMLAH PENGABDIAN MASYARAKAT NASIONAL/EKSTERNAL (ANGGOTA)", 10, 0.0),
-        ("PM5", "JUMLAH PENGABDIAN MASYARAKAT LOKAL/INTERNAL INSTITUSI (KETUA)", 15, 96.0),
-        ("PM6", "JUMLAH PENGABDIAN MASYARAKAT LOKAL/INTERNAL INSTITUSI (ANGGOTA)", 5, 8.0),
-        ("PM7", "JUMLAH RUPIAH PENGABDIAN MASYARAKAT (JUTA RUPIAH)", 0.05, 3351.79),
-    ]
+    # --- DATA ABDIMAS ---
+    # Kode, nama, bobot, nilai default dan pembagi normalisasi dari indicator_registry
+    component = get_component("Abdimas")
 
     # --- LAYOUT SETUP ---
     col_left, col_right = st.columns([1.6, 1], gap="large")
@@ -53,7 +43,7 @@ def main():
         h5.markdown("**Total**")
         st.markdown("---")
 
-        for kode, nama, bobot, default_val in data_com:
+        for _, kode, nama, bobot, default_val in component.rows:
             r1, r2, r3, r4, r5 = st.columns([0.6, 3.5, 0.6, 1.2, 1])
 
             with r1: st.write(f"**{kode}**")
@@ -66,7 +56,7 @@ def main():
                 val = st.number_input(
                     f"v_{kode}",
                     value=float(current_val),
-                    step=1.0 if kode != "PM7" else 0.01, # Step kecil khusus Rupiah
+                    step=component.step(kode), # Step kecil khusus Rupiah (PM7)
                     format="%.2f",
                     label_visibility="collapsed"
                 )
@@ -87,11 +77,8 @@ def main():
         st.markdown("### 📊 Analisis Skor")
 
         # --- RUMUS PERHITUNGAN ---
-        # (Total Score / 447.937,99) * 100
-        if total_score_raw > 0:
-            score_ternormal = (total_score_raw / PEMBAGI_NORMALISASI_COM) * 100
-        else:
-            score_ternormal = 0.0
+        # (Total Score / max(pembagi normalisasi, Total Score)) * 100
+        score_ternormal = component.normalize(component.adjusted(total_score_raw))
 
         # --- TAMPILAN KARTU SKOR ---
 
@@ -114,8 +101,8 @@ def main():
         # Card 3: Ternormalisasi (Hasil Akhir)
         st.markdown(f"""
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
-            <h2 style="color: #234e52; margin:0;">{score_ternormal * 0.15:,.2f}</h2>
-            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal (15%)</b></p>
+            <h2 style="color: #234e52; margin:0;">{score_ternormal * component.weight:,.2f}</h2>
+            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal ({component.weight:.0%})</b></p>
         </div>
         """, unsafe_allow_html=True)
 
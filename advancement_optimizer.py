@@ -0,0 +1,164 @@
+"""
+Advancement Optimizer Module for SINTA Cluster Predictor
+
+This module finds the cheapest mix of indicator increases that lifts the
+simulated total score to a target. Each indicator unit adds a fixed number
+of points (indicator weight x adjustment x component weight / normalizer)
+until its component reaches the 100 cap, so the continuous problem is a
+fractional knapsack: taking indicators in order of cost per point gained,
+skipping saturated components, is optimal. Costs and caps per indicator
+are supplied by the planner; integer steps round the increases up.
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from indicator_registry import IndicatorRegistry, get_registry
+
+DEFAULT_COST = 1.0  # biaya per unit indikator bila tidak diisi
+
+
+class OptimizationResult:
+    """
+    Plan produced by the optimizer.
+
+    Attributes:
+        steps: One dict per increased indicator, in the order chosen: Kode,
+            Nama, Komponen, Key, Tambahan, Nilai Baru, Biaya and Kenaikan Skor.
+        start_total: Total score before the plan.
+        final_total: Total score after the plan.
+        target: Requested total score.
+        total_cost: Sum of the step costs.
+    """
+
+    def __init__(self, steps: List[Dict[str, Any]], start_total: float, final_total: float,
+                 target: float, total_cost: float):
+        self.steps = steps
+        self.start_total = start_total
+        self.final_total = final_total
+        self.target = target
+        self.total_cost = total_cost
+
+    @property
+    def reached(self) -> bool:
+        """Whether the plan reaches the target (within rounding)."""
+        return self.final_total >= self.target - 1e-9
+
+
+class AdvancementOptimizer:
+    """Greedy minimum-cost planner over the registry's indicators."""
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None):
+        """
+        Args:
+            registry: Indicator registry (default the global registry).
+        """
+        self.registry = registry or get_registry()
+        # Komponen dan bobot mentah (bobot x faktor penyesuaian) per indikator
+        self.component_of = np.concatenate([
+            np.full(len(component), k) for k, component in enumerate(self.registry.components.values())
+        ])
+        self.raw_weights = self.registry.weight_matrix[np.arange(len(self.registry.codes)), self.component_of]
+
+    def optimize(self, values: np.ndarray, target: float,
+                 costs: Optional[Dict[str, float]] = None,
+                 caps: Optional[Dict[str, Optional[float]]] = None,
+                 steps: Optional[Dict[str, float]] = None) -> OptimizationResult:
+        """
+        Plan the cheapest increases that reach a target total.
+
+        Args:
+            values: Current indicator values, in registry code order.
+            target: Total score to reach.
+            costs: Cost of one unit per indicator code (default DEFAULT_COST).
+                Indicators with cost None or <= 0 are left untouched.
+            caps: Largest allowed increase per indicator code (None = no cap).
+            steps: Increase granularity per code, e.g. 1 for whole papers.
+
+        Returns:
+            The plan; if the target cannot be reached within the caps, the
+            plan gets as close as possible.
+        """
+        costs, caps, steps = costs or {}, caps or {}, steps or {}
+        registry = self.registry
+        values = np.asarray(values, dtype=float)
+        raw = values @ registry.weight_matrix
+        normalizers, weights = registry.normalizers, registry.component_weights
+
+        def total_of(raw_scores):
+            return float((np.minimum(raw_scores, normalizers) / normalizers * 100 * weights).sum())
+
+        start_total = total_of(raw)
+        # Poin total per unit indikator selama komponennya belum jenuh (skor < 100)
+        gain_per_unit = self.raw_weights * (weights * 100 / normalizers)[self.component_of]
+        unit_costs = np.array([costs.get(code, DEFAULT_COST) for code in registry.codes], dtype=object)
+        usable = [i for i in range(len(registry.codes))
+                  if gain_per_unit[i] > 0 and unit_costs[i] is not None and unit_costs[i] > 0
+                  and (caps.get(registry.codes[i]) is None or caps[registry.codes[i]] > 0)]
+        order = sorted(usable, key=lambda i: unit_costs[i] / gain_per_unit[i])
+
+        plan, total, total_cost = [], start_total, 0.0
+        for i in order:
+            gap = target - total
+            if gap <= 1e-12:
+                break
+            code, k = registry.codes[i], self.component_of[i]
+            headroom = normalizers[k] - raw[k]
+            if headroom <= 0:
+                continue  # komponen sudah jenuh: tambahan tidak menaikkan skor
+
+            cap = caps.get(code)
+            units = min(gap / gain_per_unit[i], headroom / self.raw_weights[i], math.inf if cap is None else cap)
+            step = steps.get(code)
+            if step:
+                units = math.ceil(units / step - 1e-9) * step
+                if cap is not None and units > cap:
+                    units = math.floor(cap / step) * step
+            if units <= 0:
+                continue
+
+            raw[k] += units * self.raw_weights[i]
+            new_total = total_of(raw)
+            name = registry.names[k]
+            index = registry.component(name).index[code]
+            plan.append({
+                "Kode": code,
+                "Nama": registry.component(name).names[index],
+                "Komponen": name,
+                "Key": registry.storage_keys[i],
+                "Tambahan": units,
+                "Nilai Baru": values[i] + units,
+                "Biaya": units * unit_costs[i],
+                "Kenaikan Skor": new_total - total
+            })
+            total_cost += units * unit_costs[i]
+            total = new_total
+
+        return OptimizationResult(plan, start_total, total, target, total_cost)
+
+
+# Global instance of the advancement optimizer
+advancement_optimizer = AdvancementOptimizer()
+
+
+def get_advancement_optimizer() -> AdvancementOptimizer:
+    """Get the global advancement optimizer instance."""
+    return advancement_optimizer
+
+
+def plan_cheapest_path(get: Callable[[str, float], float], target: float,
+                       costs: Optional[Dict[str, float]] = None,
+                       caps: Optional[Dict[str, Optional[float]]] = None,
+                       steps: Optional[Dict[str, float]] = None) -> OptimizationResult:
+    """
+    Convenience function: plan from the current simulation values.
+
+    Args:
+        get: Lookup function such as data_manager.get_val(key, default).
+        target: Total score to reach.
+        costs, caps, steps: See AdvancementOptimizer.optimize.
+    """
+    values = advancement_optimizer.registry.read_values(get)
+    return advancement_optimizer.optimize(values, target, costs, caps, steps)
@@ -0,0 +1,269 @@
+"""
+Batch Scoring Module for SINTA Cluster Predictor
+
+This module scores a whole cohort of institutions at once. Scraped metrics
+are packed into an institutions x indicators matrix, and the raw,
+normalized and weighted component scores plus the totals are computed with
+a handful of NumPy operations instead of one get_val call per indicator per
+institution. Weights and normalizers come from the indicator registry, the
+same tables ClusterPredictor uses.
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from indicator_registry import IndicatorRegistry, get_registry
+from scrape_output import OUTPUT_PREFIX, iter_records, latest_output
+
+def parse_number(text: Any) -> float:
+    """
+    Convert a scraped metric value to float.
+
+    The parser turns decimal commas into dots, so a value such as
+    "37.077,71" arrives as "37.077.71"; every dot except the last one is a
+    thousands separator.
+
+    Args:
+        text: Value as scraped (string or number).
+
+    Returns:
+        The numeric value, or 0.0 if it cannot be read.
+    """
+    if isinstance(text, (int, float)):
+        return float(text)
+    text = str(text).strip().replace(' ', '')
+    if text.count('.') > 1:
+        head, _, tail = text.rpartition('.')
+        text = head.replace('.', '') + '.' + tail
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+def record_values(record: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Extract indicator values from a scrape record.
+
+    Args:
+        record: Record with a 'Metrics' dictionary of sections.
+
+    Returns:
+        Dictionary of indicator code to value.
+    """
+    values = {}
+    for items in (record.get('Metrics') or {}).values():
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            if isinstance(item, dict) and item.get('code'):
+                values[item['code']] = parse_number(item.get('value', 0))
+    return values
+
+
+class Cohort:
+    """
+    Institutions x indicators matrix with its row and column labels.
+
+    Attributes:
+        ids: Sinta IDs, one per row.
+        names: Institution names, one per row.
+        klaster: Official SINTA cluster labels, one per row.
+        codes: Indicator codes, one per column.
+        matrix: Array of shape (len(ids), len(codes)); float64, or a read-only
+            float32 memmap when loaded from a matrix file.
+    """
+
+    def __init__(self, ids: List[Any], names: List[str], klaster: List[str],
+                 codes: List[str], matrix: np.ndarray):
+        self.ids = ids
+        self.names = names
+        self.klaster = klaster
+        self.codes = codes
+        self.matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]],
+                     codes: Optional[List[str]] = None) -> "Cohort":
+        """
+        Build a cohort from scrape records.
+
+        Records sharing a Sinta ID (duplicated CSV rows) are collapsed into
+        one row, keeping the last record. Missing indicators are 0.
+
+        Args:
+            records: Scrape records (e.g. scrape_output.iter_records(path)).
+            codes: Column order; defaults to every code in the indicator registry.
+
+        Returns:
+            The cohort.
+        """
+        codes = list(codes or all_codes())
+        column = {code: j for j, code in enumerate(codes)}
+        rows: Dict[str, int] = {}
+        ids, names, klaster, data = [], [], [], []
+
+        for record in records:
+            key = str(record.get('Sinta ID'))
+            values = np.zeros(len(codes))
+            for code, value in record_values(record).items():
+                j = column.get(code)
+                if j is not None:
+                    values[j] = value
+            if key in rows:
+                i = rows[key]
+                names[i], klaster[i], data[i] = record.get('Nama Institusi'), record.get('Klaster'), values
+                continue
+            rows[key] = len(ids)
+            ids.append(record.get('Sinta ID'))
+            names.append(record.get('Nama Institusi'))
+            klaster.append(record.get('Klaster'))
+            data.append(values)
+
+        matrix = np.vstack(data) if data else np.zeros((0, len(codes)))
+        return cls(ids, names, klaster, codes, matrix)
+
+
+def all_codes() -> List[str]:
+    """Indicator codes used by the scoring, in component order."""
+    return list(get_registry().codes)
+
+
+class BatchScorer:
+    """
+    Vectorized SINTA scoring for many institutions at once.
+
+    The per-indicator weights are compiled into a (codes x components) matrix,
+    so raw component scores for the whole cohort are one matrix product.
+    """
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None):
+        """
+        Args:
+            registry: Indicator registry (default the global registry).
+        """
+        self.registry = registry or get_registry()
+        self.components = list(self.registry.names)
+        self.codes = list(self.registry.codes)
+        self.weight_matrix = self.registry.weight_matrix
+        self.component_weights = self.registry.component_weights
+
+    def _align(self, matrix: np.ndarray, codes: Optional[List[str]]) -> np.ndarray:
+        """Reorder (or zero-fill) matrix columns to the scorer's code order."""
+        if codes is None or list(codes) == self.codes:
+            return matrix
+        aligned = np.zeros((matrix.shape[0], len(self.codes)))
+        source = {code: j for j, code in enumerate(codes)}
+        for j, code in enumerate(self.codes):
+            if code in source:
+                aligned[:, j] = matrix[:, source[code]]
+        return aligned
+
+    def score_matrix(self, matrix: np.ndarray, codes: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Score every row of an institutions x indicators matrix.
+
+        Args:
+            matrix: Array of shape (n, len(codes)).
+            codes: Column codes of matrix; defaults to the scorer's own order.
+
+        Returns:
+            Dictionary with 'raw', 'normalized' and 'weighted' arrays of
+            shape (n, components) and 'total' of shape (n,).
+        """
+        matrix = self._align(np.asarray(matrix, dtype=float), codes)
+        return self.registry.score_matrix(matrix)
+
+    def score_cohort(self, cohort: Cohort) -> pd.DataFrame:
+        """
+        Score and rank a cohort.
+
+        Args:
+            cohort: Cohort to score.
+
+        Returns:
+            DataFrame with one row per institution (best first): Sinta ID,
+            Nama Institusi, Klaster, the normalized component scores, Total
+            and Peringkat.
+        """
+        scores = self.score_matrix(cohort.matrix, cohort.codes)
+        frame = pd.DataFrame(scores["normalized"], columns=self.components)
+        frame.insert(0, "Klaster", cohort.klaster)
+        frame.insert(0, "Nama Institusi", cohort.names)
+        frame.insert(0, "Sinta ID", cohort.ids)
+        frame["Total"] = scores["total"]
+
+        order = np.argsort(-scores["total"], kind="stable")
+        frame = frame.iloc[order].reset_index(drop=True)
+        frame["Peringkat"] = np.arange(1, len(frame) + 1)
+        return frame
+
+
+def latest_cohort_path(directory: str = ".") -> Optional[str]:
+    """
+    Find the scrape output the cohort is loaded from.
+
+    Args:
+        directory: Folder to search.
+
+    Returns:
+        The newest timestamped output, else sinta_metrics_cluster_full.jsonl,
+        or None if neither exists.
+    """
+    path = latest_output(directory)
+    full_output = os.path.join(directory, f"{OUTPUT_PREFIX}_full.jsonl")
+    if path is None and os.path.exists(full_output):
+        path = full_output
+    return path
+
+
+def load_cohort(path: Optional[str] = None, directory: str = ".") -> Optional[Cohort]:
+    """
+    Load the cohort from a scrape output.
+
+    The output's memory-mapped matrix file (cohort_matrix) or Parquet
+    snapshot (cohort_store) is used when it is up to date; otherwise the
+    records are parsed from the output itself.
+
+    Args:
+        path: Scrape output (.jsonl or legacy .json); defaults to the newest
+            timestamped output in directory, then sinta_metrics_cluster_full.jsonl.
+        directory: Folder searched when path is None.
+
+    Returns:
+        The cohort, or None if no scrape output exists.
+    """
+    if path is None:
+        path = latest_cohort_path(directory)
+    if path is None or not os.path.exists(path):
+        return None
+    # Berkas matriks (memory-mapped) atau snapshot Parquet dari scraper jauh lebih cepat
+    # dibaca daripada JSON bersarang
+    from cohort_matrix import get_matrix_store
+    from cohort_store import get_cohort_store
+    matrices, store = get_matrix_store(), get_cohort_store()
+    if matrices.is_fresh(path):
+        return matrices.load_cohort(path)
+    if store.is_fresh(path):
+        return store.load_cohort(path)
+    return Cohort.from_records(iter_records(path))
+
+
+# Global instance of the batch scorer
+batch_scorer = BatchScorer()
+
+
+def get_batch_scorer() -> BatchScorer:
+    """Get the global batch scorer instance."""
+    return batch_scorer
+
+
+def score_cohort(cohort: Cohort) -> pd.DataFrame:
+    """Convenience function to score and rank a cohort."""
+    return batch_scorer.score_cohort(cohort)
@@ -0,0 +1,250 @@
+"""
+Cluster Boundaries Module for SINTA Cluster Predictor
+
+This module learns the score cut points between the SINTA clusters from
+reality: the scraped cohort's total scores and the Klaster labels of
+hasil_sinta_metric.csv (Pratama < Madya < Utama < Mandiri). Each boundary
+is placed with one sort and a cumulative-sum sweep that minimizes the
+number of institutions falling on the wrong side. Fitted models are cached
+per dataset version (scrape output and normalizers). The current model of
+each normalizer version is held in memory and only looked up again after a
+new scrape is recorded (invalidate), so predicting a cluster is one version
+check plus a binary search over a handful of cut points.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from batch_scoring import latest_cohort_path
+from cohort_index import cohort_index_manager, get_cohort_index
+from indicator_registry import get_registry
+
+DEFAULT_BOUNDARY_PATH = "cluster_boundaries.json"
+MAX_CACHED_MODELS = 20
+
+# Urutan klaster SINTA dari terendah ke tertinggi
+CLUSTER_ORDER = ("Binaan", "Pratama", "Madya", "Utama", "Mandiri")
+
+# Warna dan ikon per klaster (label CSV dan label pita tetap lama)
+CLUSTER_STYLE = {
+    "Mandiri": ("gold", "🏆"),
+    "Utama": ("silver", "🥈"),
+    "Madya": ("bronze", "🥉"),
+    "Pratama": ("gray", "⚠️"),
+    "Binaan": ("gray", "⚠️"),
+    "Cluster A": ("gold", "🏆"),
+    "Cluster B": ("silver", "🥈"),
+    "Cluster Mandiri": ("blue", "🥇"),
+    "Cluster Utama": ("bronze", "🥉"),
+    "Cluster Pengembangan": ("gray", "⚠️"),
+}
+
+
+class BoundaryModel:
+    """
+    Fitted cut points between consecutive clusters.
+
+    Attributes:
+        clusters: Cluster labels present in the data, lowest first.
+        cuts: Ascending lower bound of every cluster but the lowest.
+        accuracy: Share of the cohort whose label the cuts reproduce.
+        size: Number of institutions used for fitting.
+    """
+
+    def __init__(self, clusters: List[str], cuts: List[float], accuracy: float = 0.0, size: int = 0):
+        self.clusters = list(clusters)
+        self.cuts = np.asarray(cuts, dtype=float)
+        self.accuracy = accuracy
+        self.size = size
+
+    def lookup(self, score: float) -> str:
+        """Cluster of a total score (binary search over the cut points)."""
+        return self.clusters[int(np.searchsorted(self.cuts, score, side="right"))]
+
+    def bands(self) -> List[Tuple[str, float, float]]:
+        """(cluster, lower bound, upper bound) per cluster, lowest first."""
+        lowers = [0.0] + self.cuts.tolist()
+        uppers = self.cuts.tolist() + [100.0]
+        return list(zip(self.clusters, lowers, uppers))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"clusters": self.clusters, "cuts": self.cuts.tolist(), "accuracy": self.accuracy, "size": self.size}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BoundaryModel":
+        return cls(data["clusters"], data["cuts"], data.get("accuracy", 0.0), data.get("size", 0))
+
+
+def fit_boundaries(totals: Iterable[float], labels: Iterable[Any],
+                   order: Tuple[str, ...] = CLUSTER_ORDER) -> Optional[BoundaryModel]:
+    """
+    Fit the cut points between ordered clusters.
+
+    For every pair of neighbouring clusters the cohort is split into "this
+    cluster or lower" and "higher"; after sorting the totals, the errors of
+    every possible cut are counted at once with cumulative sums and the cut
+    with the fewest errors is taken (midway between the two totals around
+    it). Cuts are then forced to be non-decreasing.
+
+    Args:
+        totals: Total score per institution.
+        labels: Klaster label per institution; unknown labels are ignored.
+        order: Cluster labels from lowest to highest.
+
+    Returns:
+        The fitted model, or None if fewer than two clusters are present.
+    """
+    rank_of = {name: r for r, name in enumerate(order)}
+    pairs = [(float(t), rank_of[l]) for t, l in zip(totals, labels) if l in rank_of and t == t]
+    if not pairs:
+        return None
+    totals_arr = np.array([t for t, _ in pairs])
+    ranks = np.array([r for _, r in pairs])
+
+    present = np.unique(ranks)
+    if len(present) < 2:
+        return None
+    # Peringkat dipadatkan ke klaster yang benar-benar ada di data
+    ranks = np.searchsorted(present, ranks)
+
+    sort = np.argsort(totals_arr, kind="stable")
+    sorted_totals, sorted_ranks = totals_arr[sort], ranks[sort]
+    n = len(sorted_totals)
+
+    cuts = []
+    for j in range(1, len(present)):
+        high = sorted_ranks >= j
+        # errors[i]: potong sebelum posisi i -> klaster tinggi di bawah potongan + klaster rendah di atasnya
+        high_below = np.concatenate(([0], np.cumsum(high)))
+        low_below = np.concatenate(([0], np.cumsum(~high)))
+        errors = high_below + (low_below[-1] - low_below)
+        i = int(np.argmin(errors))
+        if i == 0:
+            cuts.append(sorted_totals[0])
+        elif i == n:
+            cuts.append(sorted_totals[-1])
+        else:
+            cuts.append((sorted_totals[i - 1] + sorted_totals[i]) / 2)
+    cuts = np.maximum.accumulate(np.array(cuts))
+
+    predicted = np.searchsorted(cuts, sorted_totals, side="right")
+    accuracy = float(np.mean(predicted == sorted_ranks))
+    return BoundaryModel([order[r] for r in present], cuts.tolist(), accuracy, n)
+
+
+def normalizer_signature() -> str:
+    """Short hash of the registry's current normalizers."""
+    return hashlib.sha1(get_registry().normalizers.tobytes()).hexdigest()[:8]
+
+
+class BoundaryStore:
+    """
+    Fits boundary models on demand and caches them per dataset version.
+
+    The dataset version combines the scrape output version and the
+    normalizer signature, so a new scrape or a normalizer change refits once;
+    models are also kept in a JSON file so restarts do not refit. The model
+    in use for each registry version (sessions may use different
+    normalizers) is kept together with the scrape output (path and
+    modification time) it belongs to, and is returned without touching the
+    disk until invalidate() is called.
+    """
+
+    def __init__(self, path: str = DEFAULT_BOUNDARY_PATH):
+        """
+        Args:
+            path: Location of the JSON model cache.
+        """
+        self.path = path
+        self._models: Dict[str, BoundaryModel] = {}
+        # Versi registry -> (generasi, (output, mtime), model)
+        self._current: Dict[int, Tuple[int, Tuple[Optional[str], int], Optional[BoundaryModel]]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, key: str, model: BoundaryModel):
+        data = self._load()
+        data[key] = {**model.to_dict(), "fitted_at": datetime.now().isoformat()}
+        data = dict(sorted(data.items(), key=lambda item: item[1].get("fitted_at", ""))[-MAX_CACHED_MODELS:])
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def invalidate(self):
+        """Look for a new scrape output on the next get_model call (call after recording a scrape)."""
+        self._generation += 1
+
+    def _source_key(self) -> Tuple[Optional[str], int]:
+        """Latest scrape output and its modification time."""
+        path = latest_cohort_path(cohort_index_manager.directory)
+        mtime = os.stat(path).st_mtime_ns if path is not None and os.path.exists(path) else 0
+        return path, mtime
+
+    def _fit(self) -> Optional[BoundaryModel]:
+        """Get the model of the current cohort index from memory, the JSON cache or a new fit."""
+        index = get_cohort_index()
+        if index is None or not len(index):
+            return None
+        key = f"{cohort_index_manager.version}:{normalizer_signature()}"
+        if key in self._models:
+            return self._models[key]
+        cached = self._load().get(key)
+        if cached:
+            model = BoundaryModel.from_dict(cached)
+        else:
+            entries = index.entries.values()
+            model = fit_boundaries([e["total"] for e in entries], [e["klaster"] for e in entries])
+            if model is not None:
+                self._save(key, model)
+        self._models[key] = model
+        return model
+
+    def get_model(self) -> Optional[BoundaryModel]:
+        """
+        Get the boundary model of the current dataset.
+
+        Returns:
+            The fitted model, or None without labelled scrape data.
+        """
+        version = get_registry().version
+        current = self._current.get(version)
+        if current is not None and current[0] == self._generation:
+            return current[2]
+
+        with self._lock:
+            generation = self._generation
+            source = self._source_key()
+            current = self._current.get(version)
+            model = current[2] if current is not None and current[1] == source else self._fit()
+            self._current[version] = (generation, source, model)
+            return model
+
+
+# Global instance of the boundary store
+boundary_store = BoundaryStore()
+
+
+def get_boundary_model() -> Optional[BoundaryModel]:
+    """Convenience function to get the boundary model of the current dataset."""
+    return boundary_store.get_model()
+
+
+def invalidate_boundaries():
+    """Convenience function: refit or reload the boundary model after a new scrape is recorded."""
+    boundary_store.invalidate()
@@ -0,0 +1,383 @@
+"""
+Cohort Index Module for SINTA Cluster Predictor
+
+This module answers "where would we land" questions against the scraped
+cohort. The cohort's total scores and per-component scores are kept in
+sorted arrays, so the rank, percentile and nearest institutions of any
+score are found by binary search (np.searchsorted) instead of rescanning
+the cohort on every slider move. When a new scrape output appears only the
+institutions whose metrics changed are rescored and moved within the
+sorted arrays, and institutions missing from the new output are removed;
+sessions with different normalizers each get their own fully scored index.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from batch_scoring import BatchScorer, Cohort, get_batch_scorer, latest_cohort_path
+from cohort_matrix import get_matrix_store
+from cohort_normalizers import scrape_version
+from cohort_store import get_cohort_store
+from scrape_output import iter_records, metrics_hash
+
+DEFAULT_NEIGHBOURS = 5
+# Di atas proporsi perubahan ini indeks diurutkan ulang penuh (lebih murah dari banyak insert/delete)
+FULL_REBUILD_RATIO = 0.1
+MAX_INDEXES = 4  # indeks yang disimpan untuk pembagi normalisasi berbeda (sesi berbeda)
+
+
+class CohortIndex:
+    """
+    Sorted totals and component scores of a scored cohort.
+
+    Attributes:
+        components: Component names, one column each.
+        sorted_totals: Ascending total scores.
+        sorted_ids: Sinta ID of each entry of sorted_totals.
+        sorted_components: One ascending score array per component.
+        entries: Sinta ID to {'name', 'klaster', 'hash', 'total', 'components'}.
+    """
+
+    def __init__(self, scorer: Optional[BatchScorer] = None):
+        """
+        Args:
+            scorer: Batch scorer (default the global batch scorer).
+        """
+        self.scorer = scorer or get_batch_scorer()
+        self.components = list(self.scorer.components)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._sort()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _sort(self):
+        """Rebuild every sorted array from the entries."""
+        keys = list(self.entries)
+        totals = np.array([self.entries[key]["total"] for key in keys], dtype=float)
+        order = np.argsort(totals, kind="stable")
+        self.sorted_totals = totals[order]
+        self.sorted_ids = np.array(keys, dtype=object)[order]
+        scores = np.array([self.entries[key]["components"] for key in keys], dtype=float)
+        scores = scores.reshape(len(keys), len(self.components))
+        self.sorted_components = {name: np.sort(scores[:, k]) for k, name in enumerate(self.components)}
+
+    def _remove_sorted(self, entry: Dict[str, Any], key: str):
+        """Take one institution out of the sorted arrays."""
+        pos = int(np.searchsorted(self.sorted_totals, entry["total"], side="left"))
+        while self.sorted_ids[pos] != key:  # skor sama: cari ID yang tepat
+            pos += 1
+        self.sorted_totals = np.delete(self.sorted_totals, pos)
+        self.sorted_ids = np.delete(self.sorted_ids, pos)
+        for k, name in enumerate(self.components):
+            column = self.sorted_components[name]
+            self.sorted_components[name] = np.delete(
+                column, int(np.searchsorted(column, entry["components"][k], side="left")))
+
+    def _insert_sorted(self, entry: Dict[str, Any], key: str):
+        """Put one institution into the sorted arrays."""
+        pos = int(np.searchsorted(self.sorted_totals, entry["total"], side="right"))
+        self.sorted_totals = np.insert(self.sorted_totals, pos, entry["total"])
+        self.sorted_ids = np.insert(self.sorted_ids, pos, key)
+        for k, name in enumerate(self.components):
+            column = self.sorted_components[name]
+            self.sorted_components[name] = np.insert(
+                column, int(np.searchsorted(column, entry["components"][k], side="right")), entry["components"][k])
+
+    def _apply(self, updates: Dict[str, Dict[str, Any]], removed: List[str]) -> int:
+        """
+        Put new or rescored entries into the index and take removed ones out.
+
+        Small changes are applied to the sorted arrays in place; larger
+        ones rebuild them with one sort.
+
+        Returns:
+            Number of institutions added, rescored or removed.
+        """
+        if not updates and not removed:
+            return 0
+        incremental = len(updates) + len(removed) <= FULL_REBUILD_RATIO * max(len(self.entries), 1)
+        for key in removed:
+            if incremental:
+                self._remove_sorted(self.entries[key], key)
+            del self.entries[key]
+        for key, entry in updates.items():
+            if incremental and key in self.entries:
+                self._remove_sorted(self.entries[key], key)
+            self.entries[key] = entry
+            if incremental:
+                self._insert_sorted(entry, key)
+        if not incremental:
+            self._sort()
+        return len(updates) + len(removed)
+
+    def _unchanged(self, key: str, content_hash: Optional[str], name: Any, klaster: Any) -> bool:
+        """Update the labels of an entry whose metrics hash is unchanged; False if it must be rescored."""
+        entry = self.entries.get(key)
+        if entry is None or content_hash is None or entry["hash"] != content_hash:
+            return False
+        entry["name"], entry["klaster"] = name, klaster
+        return True
+
+    def _entry(self, name: Any, klaster: Any, content_hash: Optional[str], scores: Dict[str, np.ndarray],
+               i: int) -> Dict[str, Any]:
+        """Index entry of row i of a scores dictionary."""
+        return {
+            "name": name,
+            "klaster": klaster,
+            "hash": content_hash,
+            "total": float(scores["total"][i]),
+            "components": scores["normalized"][i].tolist()
+        }
+
+    def upsert(self, records: Iterable[Dict[str, Any]], replace: bool = False) -> int:
+        """
+        Add or update institutions, rescoring only records whose metrics changed.
+
+        Args:
+            records: Scrape records.
+            replace: Treat records as the whole cohort and remove the
+                institutions that are not among them.
+
+        Returns:
+            Number of institutions added, rescored or removed.
+        """
+        changed = {}
+        seen = set()
+        for record in records:
+            key = str(record.get('Sinta ID'))
+            seen.add(key)
+            content_hash = record.get('Content Hash') or metrics_hash(record.get('Metrics'))
+            if not self._unchanged(key, content_hash, record.get('Nama Institusi'), record.get('Klaster')):
+                changed[key] = (record, content_hash)
+        # Institusi yang tidak ada lagi di scrape terbaru dikeluarkan dari indeks
+        removed = [key for key in self.entries if key not in seen] if replace else []
+
+        updates = {}
+        if changed:
+            cohort = Cohort.from_records(record for record, _ in changed.values())
+            scores = self.scorer.score_matrix(cohort.matrix, cohort.codes)
+            for i, sinta_id in enumerate(cohort.ids):
+                record, content_hash = changed[str(sinta_id)]
+                updates[str(sinta_id)] = self._entry(record.get('Nama Institusi'), record.get('Klaster'),
+                                                     content_hash, scores, i)
+        return self._apply(updates, removed)
+
+    def sync(self, cohort: Cohort, hashes: Optional[List[Optional[str]]] = None) -> int:
+        """
+        Make the index mirror a loaded cohort (e.g. from a Parquet snapshot).
+
+        Args:
+            cohort: The whole cohort; institutions not in it are removed.
+            hashes: Content hash of every cohort row; rows whose hash is
+                unchanged are not rescored. Without hashes every row is
+                rescored (one matrix product).
+
+        Returns:
+            Number of institutions added, rescored or removed.
+        """
+        keys = [str(sinta_id) for sinta_id in cohort.ids]
+        hashes = hashes if hashes is not None else [None] * len(keys)
+        rows = [i for i, key in enumerate(keys)
+                if not self._unchanged(key, hashes[i], cohort.names[i], cohort.klaster[i])]
+        seen = set(keys)
+        removed = [key for key in self.entries if key not in seen]
+
+        updates = {}
+        if rows:
+            matrix = cohort.matrix if len(rows) == len(keys) else np.asarray(cohort.matrix)[rows]
+            scores = self.scorer.score_matrix(matrix, cohort.codes)
+            for j, i in enumerate(rows):
+                updates[keys[i]] = self._entry(cohort.names[i], cohort.klaster[i], hashes[i], scores, j)
+        return self._apply(updates, removed)
+
+    def rank(self, total: float) -> int:
+        """Rank a total score would take (1 = best); ties rank alongside the cohort."""
+        return len(self.sorted_totals) - int(np.searchsorted(self.sorted_totals, total, side="right")) + 1
+
+    def percentile(self, total: float) -> float:
+        """Share of the cohort (0-100) scoring at or below a total score."""
+        if not len(self.sorted_totals):
+            return 0.0
+        return int(np.searchsorted(self.sorted_totals, total, side="right")) / len(self.sorted_totals) * 100
+
+    def component_percentile(self, name: str, score: float) -> float:
+        """Share of the cohort (0-100) scoring at or below a component score."""
+        column = self.sorted_components[name]
+        if not len(column):
+            return 0.0
+        return int(np.searchsorted(column, score, side="right")) / len(column) * 100
+
+    def nearest(self, total: float, count: int = DEFAULT_NEIGHBOURS) -> pd.DataFrame:
+        """
+        Institutions whose total score is closest to a given one.
+
+        Args:
+            total: Score to compare with.
+            count: Number of institutions to return.
+
+        Returns:
+            DataFrame with Peringkat, Sinta ID, Nama Institusi, Klaster,
+            Total and Selisih (institution minus total), best first.
+        """
+        n = len(self.sorted_totals)
+        pos = int(np.searchsorted(self.sorted_totals, total))
+        # Hanya jendela di sekitar posisi hasil binary search yang perlu diperiksa
+        window = np.arange(max(0, pos - count), min(n, pos + count))
+        closest = window[np.argsort(np.abs(self.sorted_totals[window] - total), kind="stable")[:count]]
+        closest = np.sort(closest)[::-1]
+
+        rows = []
+        for i in closest:
+            entry = self.entries[self.sorted_ids[i]]
+            rows.append({
+                "Peringkat": n - int(i),
+                "Sinta ID": self.sorted_ids[i],
+                "Nama Institusi": entry["name"],
+                "Klaster": entry["klaster"],
+                "Total": self.sorted_totals[i],
+                "Selisih": self.sorted_totals[i] - total
+            })
+        return pd.DataFrame(rows, columns=["Peringkat", "Sinta ID", "Nama Institusi", "Klaster", "Total", "Selisih"])
+
+    def position(self, total: float, component_scores: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Summarize where a score lands in the cohort.
+
+        Args:
+            total: Total score.
+            component_scores: Optional normalized score per component.
+
+        Returns:
+            Dictionary with rank, size, percentile and (if given) the
+            percentile of every component.
+        """
+        position = {"rank": self.rank(total), "size": len(self), "percentile": self.percentile(total)}
+        if component_scores:
+            position["components"] = {
+                name: self.component_percentile(name, score)
+                for name, score in component_scores.items() if name in self.sorted_components
+            }
+        return position
+
+
+class CohortIndexManager:
+    """
+    Keeps a CohortIndex in sync with the latest scrape output.
+
+    A scrape output is identified by its version (see scrape_version); an
+    index is updated only when the version changes. Sessions using different
+    normalizers get their own index (one per registry version, at most
+    MAX_INDEXES). The output's memory-mapped matrix file or, failing that,
+    its Parquet snapshot is read when it is up to date; otherwise the
+    records are parsed from the output itself. The folder is only searched
+    for a new output after invalidate(), so repeated lookups do not touch
+    the disk.
+    """
+
+    def __init__(self, directory: str = ".", scorer: Optional[BatchScorer] = None):
+        """
+        Args:
+            directory: Folder holding the scrape outputs.
+            scorer: Batch scorer (default the global batch scorer).
+        """
+        self.directory = directory
+        self.scorer = scorer or get_batch_scorer()
+        self.version: Optional[str] = None
+        self.source: Optional[str] = None
+        # Versi registry -> (generasi, versi scrape, indeks)
+        self._indexes: Dict[int, Tuple[int, Optional[str], Optional[CohortIndex]]] = {}
+        self._generation = 0
+        self._checked: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Look for a new scrape output on the next get_index call (call after recording a scrape)."""
+        self._generation += 1
+
+    def _update(self, index: Optional[CohortIndex]) -> CohortIndex:
+        """Bring an index (or a new one) up to date with the current scrape output."""
+        if index is None:
+            index = CohortIndex(self.scorer)
+        path = self.source
+        matrices, store = get_matrix_store(), get_cohort_store()
+        if matrices.is_fresh(path):
+            # Berkas matriks memory-mapped: hanya header yang di-parse, nilai dibaca dari page cache
+            index.sync(matrices.load_cohort(path))
+        elif store.is_fresh(path):
+            # Snapshot Parquet: hanya kolom yang dibutuhkan dibaca, tanpa parsing JSON
+            labels = store.read_labels(path)
+            cohort = store.load_cohort(path)
+            index.sync(cohort, [labels[str(sinta_id)]["Content Hash"] for sinta_id in cohort.ids])
+        else:
+            index.upsert(iter_records(path), replace=True)
+        return index
+
+    def get_index(self) -> Optional[CohortIndex]:
+        """
+        Get the index for the normalizers in effect, updating it first if a new scrape output appeared.
+
+        Without a preceding invalidate() an index that was already built for
+        these normalizers is returned without checking the disk.
+
+        Returns:
+            The cohort index, or None if there is no scrape output.
+        """
+        registry_version = self.scorer.registry.version
+        cached = self._indexes.get(registry_version)
+        if cached is not None and cached[0] == self._generation:
+            return cached[2]
+
+        with self._lock:
+            generation = self._generation
+            if self._checked != generation:
+                path = latest_cohort_path(self.directory)
+                if path is None or not os.path.exists(path):
+                    self.source = self.version = None
+                else:
+                    self.source, self.version = path, scrape_version(path)
+                self._checked = generation
+
+            cached = self._indexes.pop(registry_version, None)
+            index = cached[2] if cached is not None else None
+            if self.source is not None and (index is None or cached[1] != self.version):
+                index = self._update(index)
+            self._indexes[registry_version] = (generation, self.version, index)
+            # Indeks untuk pembagi yang paling lama tidak diperbarui dibuang lebih dulu
+            while len(self._indexes) > MAX_INDEXES:
+                self._indexes.pop(next(iter(self._indexes)))
+            return index
+
+
+# Global instance of the cohort index manager
+cohort_index_manager = CohortIndexManager()
+
+
+def get_cohort_index() -> Optional[CohortIndex]:
+    """Convenience function to get the up-to-date cohort index."""
+    return cohort_index_manager.get_index()
+
+
+def invalidate_cohort_index():
+    """Convenience function to pick up a new scrape on the next index lookup."""
+    cohort_index_manager.invalidate()
+
+
+def cohort_position(total: float, component_scores: Optional[Dict[str, float]] = None) -> Optional[Dict[str, Any]]:
+    """Convenience function: rank and percentiles of a score, or None without cohort data."""
+    index = get_cohort_index()
+    if index is None or not len(index):
+        return None
+    return index.position(total, component_scores)
+
+
+def nearest_institutions(total: float, count: int = DEFAULT_NEIGHBOURS) -> List[Dict[str, Any]]:
+    """Convenience function: the institutions scoring closest to a total, as records."""
+    index = get_cohort_index()
+    if index is None or not len(index):
+        return []
+    return index.nearest(total, count).to_dict("records")
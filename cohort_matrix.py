@@ -0,0 +1,198 @@
+"""
+Cohort Matrix Module for SINTA Cluster Predictor
+
+This module stores the institutions x indicators matrix of a scrape in a
+compact binary file that the app opens with memory mapping. The file is
+
+    magic (8 bytes) | header length (uint32, little endian) | JSON header |
+    padding to a 64-byte boundary | float32 matrix (row-major)
+
+where the header records the format version, the scrape version the
+matrix was built from, the matrix shape, the Sinta ID / name / Klaster of
+every row and the indicator code of every column. Opening the file only
+parses the header; the values are mapped read-only (np.memmap), so startup
+copies nothing and every Streamlit worker process shares the same page
+cache instead of holding a private copy.
+"""
+
+import json
+import os
+import struct
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from batch_scoring import Cohort, load_cohort
+from cohort_normalizers import scrape_version
+from cohort_store import DEFAULT_STORE_DIR
+
+MAGIC = b"SINTAMX1"
+FORMAT_VERSION = 1
+DTYPE = "<f4"
+ALIGNMENT = 64  # awal data sejajar 64 byte (satu cache line)
+MATRIX_EXTENSION = ".f32mat"
+
+
+def write_matrix(path: str, cohort: Cohort, source_version: str = "", source: str = "") -> str:
+    """
+    Write a cohort to a matrix file (atomically).
+
+    Args:
+        path: Destination file.
+        cohort: Cohort to store; values are stored as float32.
+        source_version: scrape_version of the output it came from.
+        source: Name of the output it came from.
+
+    Returns:
+        The destination path.
+    """
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source": source,
+        "source_version": source_version,
+        "dtype": DTYPE,
+        "shape": [len(cohort), len(cohort.codes)],
+        "codes": list(cohort.codes),
+        "ids": [str(sinta_id) for sinta_id in cohort.ids],
+        "names": list(cohort.names),
+        "klaster": list(cohort.klaster)
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    prefix = len(MAGIC) + 4 + len(header_bytes)
+    padding = -prefix % ALIGNMENT
+
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * padding)
+        f.write(np.ascontiguousarray(cohort.matrix, dtype=DTYPE).tobytes())
+    os.replace(temp_path, path)
+    return path
+
+
+def read_header(path: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Read the header of a matrix file.
+
+    Args:
+        path: Matrix file.
+
+    Returns:
+        Tuple of (header, byte offset of the data).
+
+    Raises:
+        ValueError: If the file is not a matrix file of a supported version.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a cohort matrix file: {path}")
+        (length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length).decode('utf-8'))
+    if header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported cohort matrix version: {header.get('format_version')}")
+    prefix = len(MAGIC) + 4 + length
+    return header, prefix + (-prefix % ALIGNMENT)
+
+
+def open_matrix(path: str) -> Tuple[Dict[str, Any], np.memmap]:
+    """
+    Memory-map a matrix file read-only.
+
+    Args:
+        path: Matrix file.
+
+    Returns:
+        Tuple of (header, matrix of shape header['shape']).
+    """
+    header, offset = read_header(path)
+    rows, cols = header["shape"]
+    if rows * cols == 0:
+        return header, np.zeros((rows, cols), dtype=DTYPE)
+    return header, np.memmap(path, dtype=header["dtype"], mode='r', offset=offset, shape=(rows, cols))
+
+
+class MatrixStore:
+    """
+    Matrix files of scrape outputs, one per output, kept next to the Parquet snapshots.
+
+    Opened matrices are kept per process and reused until the file changes.
+    """
+
+    def __init__(self, directory: str = DEFAULT_STORE_DIR):
+        """
+        Args:
+            directory: Folder holding the matrix files.
+        """
+        self.directory = directory
+        self._open: Dict[str, Tuple[int, Dict[str, Any], np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def matrix_path(self, source: str) -> str:
+        """Matrix file of a scrape output."""
+        stem = os.path.splitext(os.path.basename(source))[0]
+        return os.path.join(self.directory, stem + MATRIX_EXTENSION)
+
+    def write(self, source: str, cohort: Optional[Cohort] = None) -> str:
+        """
+        Build the matrix file of a scrape output.
+
+        Args:
+            source: Scrape output.
+            cohort: Its cohort, if already loaded (default loaded with load_cohort).
+
+        Returns:
+            Path of the matrix file.
+        """
+        if cohort is None:
+            cohort = load_cohort(source)
+        os.makedirs(self.directory, exist_ok=True)
+        return write_matrix(self.matrix_path(source), cohort, scrape_version(source), os.path.basename(source))
+
+    def _get(self, source: str) -> Tuple[Dict[str, Any], np.ndarray]:
+        """Header and mapped matrix of a scrape output, reusing an open mapping."""
+        path = self.matrix_path(source)
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._open.get(path)
+            if cached is None or cached[0] != mtime:
+                header, matrix = open_matrix(path)
+                cached = self._open[path] = (mtime, header, matrix)
+            return cached[1], cached[2]
+
+    def is_fresh(self, source: str) -> bool:
+        """Whether the matrix file of a scrape output exists and matches its current version."""
+        if not os.path.exists(self.matrix_path(source)) or not os.path.exists(source):
+            return False
+        try:
+            header, _ = self._get(source)
+        except (OSError, ValueError):
+            return False
+        return header.get("source_version") == scrape_version(source)
+
+    def load_cohort(self, source: str) -> Cohort:
+        """
+        Cohort of a scrape output backed by its memory-mapped matrix (float32, read-only).
+
+        Args:
+            source: Scrape output.
+        """
+        header, matrix = self._get(source)
+        return Cohort(list(header["ids"]), list(header["names"]), list(header["klaster"]),
+                      list(header["codes"]), matrix)
+
+
+# Global instance of the matrix store
+matrix_store = MatrixStore()
+
+
+def get_matrix_store() -> MatrixStore:
+    """Get the global matrix store instance."""
+    return matrix_store
+
+
+def write_cohort_matrix(source: str) -> str:
+    """Convenience function to build the matrix file of a finished scrape output."""
+    return matrix_store.write(source)
@@ -0,0 +1,244 @@
+"""
+Cohort Normalizers Module for SINTA Cluster Predictor
+
+This module derives the component normalizers from the scraped cohort
+instead of the hard-coded reference values. The raw component scores of
+every institution are computed in one matrix product and each component's
+divisor is taken as the cohort maximum or a chosen percentile. Results are
+cached in a JSON file keyed by the scrape version (file name, size and
+modification time of the scrape output), so they are computed once per
+scrape. The method is chosen per Streamlit session and re-applied at the
+start of every rerun - following the newest scrape automatically - without
+affecting other sessions. Between scrapes the entries are kept in memory,
+so reruns do not touch the disk until invalidate() is called after a new
+scrape is recorded.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from batch_scoring import Cohort, latest_cohort_path, load_cohort
+from indicator_registry import IndicatorRegistry, get_registry
+
+DEFAULT_NORMALIZER_PATH = "cohort_normalizers.json"
+DEFAULT_PERCENTILE = 99.0
+MAX_CACHED_ENTRIES = 20  # entri (versi scrape x metode) yang disimpan
+
+# Metode penentuan pembagi normalisasi
+METHOD_DEFAULT = "bawaan"        # nilai acuan di indicator_registry
+METHOD_MAX = "maksimum"          # skor mentah tertinggi di kohort
+METHOD_PERCENTILE = "persentil"  # persentil skor mentah kohort
+METHODS = (METHOD_DEFAULT, METHOD_MAX, METHOD_PERCENTILE)
+NORMALIZER_CHOICE_KEY = "normalizer_choice"  # pilihan metode per sesi di st.session_state
+
+
+def scrape_version(path: str) -> str:
+    """
+    Identify a scrape output by name, size and modification time.
+
+    Args:
+        path: Scrape output file.
+
+    Returns:
+        Short hexadecimal version string.
+    """
+    stat = os.stat(path)
+    identity = f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(identity.encode('utf-8')).hexdigest()[:12]
+
+
+def compute_normalizers(cohort: Cohort, method: str = METHOD_MAX,
+                        percentile: float = DEFAULT_PERCENTILE,
+                        registry: Optional[IndicatorRegistry] = None) -> Dict[str, float]:
+    """
+    Derive one normalizer per component from a cohort.
+
+    Args:
+        cohort: Scraped cohort (institutions x indicators).
+        method: METHOD_MAX or METHOD_PERCENTILE.
+        percentile: Percentile (0-100) used by METHOD_PERCENTILE.
+        registry: Indicator registry (default the global registry).
+
+    Returns:
+        Component name to normalizer. Components whose cohort value is 0
+        (no institution reports them) keep the registry's base normalizer.
+    """
+    registry = registry or get_registry()
+    if method not in (METHOD_MAX, METHOD_PERCENTILE):
+        raise ValueError(f"Unknown normalizer method: {method}")
+
+    # Skor mentah (setelah faktor penyesuaian) seluruh institusi: satu perkalian matriks
+    matrix = np.zeros((len(cohort), len(registry.codes)))
+    columns = {code: j for j, code in enumerate(cohort.codes)}
+    for i, code in enumerate(registry.codes):
+        if code in columns:
+            matrix[:, i] = cohort.matrix[:, columns[code]]
+    raw = matrix @ registry.weight_matrix
+
+    if len(cohort) == 0:
+        reference = np.zeros(len(registry.names))
+    elif method == METHOD_MAX:
+        reference = raw.max(axis=0)
+    else:
+        reference = np.percentile(raw, percentile, axis=0)
+
+    return {
+        name: float(value) if value > 0 else registry.base_normalizers[name]
+        for name, value in zip(registry.names, reference)
+    }
+
+
+class CohortNormalizers:
+    """
+    Computes, caches and applies cohort-derived normalizers.
+
+    The JSON cache has the form {"entries": {"<version>:<method>:<percentile>":
+    entry}}, where each entry records the scrape source, version, method,
+    computation time, cohort size and the normalizers. Which method is in
+    use is not stored here: every session passes its own choice to apply().
+    """
+
+    def __init__(self, path: str = DEFAULT_NORMALIZER_PATH, directory: str = ".",
+                 registry: Optional[IndicatorRegistry] = None):
+        """
+        Args:
+            path: Location of the JSON cache.
+            directory: Folder holding the scrape outputs.
+            registry: Indicator registry to apply to (default the global registry).
+        """
+        self.path = path
+        self.directory = directory
+        self.registry = registry or get_registry()
+        # (metode, persentil) -> entri scrape terbaru, sampai invalidate()
+        self._latest: Dict[Tuple[str, Optional[float]], Optional[Dict[str, Any]]] = {}
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {"entries": {}}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return {"entries": json.load(f).get("entries", {})}
+        except (OSError, ValueError):
+            return {"entries": {}}
+
+    def _save(self, data: Dict[str, Any]):
+        # Simpan entri terbaru saja, lalu tulis atomik
+        entries = sorted(data["entries"].items(), key=lambda item: item[1].get("computed_at", ""))
+        data["entries"] = dict(entries[-MAX_CACHED_ENTRIES:])
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def compute(self, method: str = METHOD_MAX, percentile: float = DEFAULT_PERCENTILE,
+                source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the normalizers of a scrape, computing them only if not cached.
+
+        Args:
+            method: METHOD_MAX or METHOD_PERCENTILE.
+            percentile: Percentile used by METHOD_PERCENTILE.
+            source: Scrape output; defaults to the latest one.
+
+        Returns:
+            Cache entry with 'normalizers', or None if no scrape output exists.
+        """
+        source = source or latest_cohort_path(self.directory)
+        if source is None or not os.path.exists(source):
+            return None
+
+        version = scrape_version(source)
+        percentile = float(percentile) if method == METHOD_PERCENTILE else None
+        key = f"{version}:{method}:{percentile}"
+        data = self._load()
+        if key in data["entries"]:
+            return data["entries"][key]
+
+        cohort = load_cohort(source)
+        entry = {
+            "source": os.path.basename(source),
+            "version": version,
+            "method": method,
+            "percentile": percentile,
+            "computed_at": datetime.now().isoformat(),
+            "institutions": len(cohort),
+            "normalizers": compute_normalizers(cohort, method, percentile or DEFAULT_PERCENTILE, self.registry)
+        }
+        data["entries"][key] = entry
+        self._save(data)
+        return entry
+
+    def entry(self, method: str, percentile: float = DEFAULT_PERCENTILE) -> Optional[Dict[str, Any]]:
+        """
+        Get the normalizers of a method for the latest scrape.
+
+        The result is kept in memory until invalidate(), so repeated calls
+        do not touch the disk.
+
+        Args:
+            method: One of METHODS.
+            percentile: Percentile used by METHOD_PERCENTILE.
+
+        Returns:
+            Cache entry with 'normalizers', or None for METHOD_DEFAULT or
+            when no scrape output exists.
+        """
+        if method == METHOD_DEFAULT:
+            return None
+        key = (method, float(percentile) if method == METHOD_PERCENTILE else None)
+        if key not in self._latest:
+            self._latest[key] = self.compute(method, percentile)
+        return self._latest[key]
+
+    def apply(self, method: str = METHOD_DEFAULT,
+              percentile: float = DEFAULT_PERCENTILE) -> Optional[Dict[str, Any]]:
+        """
+        Switch the registry to a normalizer method for the current session.
+
+        The registry keeps normalizers per thread, so this only affects the
+        session whose script run calls it; sessions call it at the start of
+        every rerun with their own choice.
+
+        Args:
+            method: One of METHODS.
+            percentile: Percentile used by METHOD_PERCENTILE.
+
+        Returns:
+            The applied entry, or None when METHOD_DEFAULT is chosen or no
+            scrape output exists (the registry's base normalizers are used).
+        """
+        entry = self.entry(method, percentile)
+        if entry is None:
+            self.registry.reset_normalizers()
+        else:
+            self.registry.set_normalizers(entry["normalizers"])
+        return entry
+
+    def invalidate(self):
+        """Look for a new scrape output on the next entry call (call after recording a scrape)."""
+        self._latest = {}
+
+
+# Global instance of the cohort normalizers
+cohort_normalizers = CohortNormalizers()
+
+
+def get_cohort_normalizers() -> CohortNormalizers:
+    """Get the global cohort normalizers instance."""
+    return cohort_normalizers
+
+
+def apply_normalizers(method: str = METHOD_DEFAULT,
+                      percentile: float = DEFAULT_PERCENTILE) -> Optional[Dict[str, Any]]:
+    """Convenience function to apply a session's normalizer choice to the latest scrape."""
+    return cohort_normalizers.apply(method, percentile)
+
+
+def invalidate_normalizers():
+    """Convenience function to pick up a new scrape on the next refresh."""
+    cohort_normalizers.invalidate()
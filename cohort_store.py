@@ -0,0 +1,262 @@
+"""
+Cohort Store Module for SINTA Cluster Predictor
+
+This module keeps scraped SINTA metrics in a columnar Parquet store. Each
+scrape output becomes one snapshot file with one row per institution and
+one float64 column per indicator code, next to the identifying columns
+(Sinta ID, Kode PT, name, Klaster, SINTA scores, scrape date, content
+hash). The nested JSON is walked and parsed once, when the scraper
+finishes; the cohort loaders, the cohort index and the score history then
+read only the columns they need (column projection) in milliseconds. A
+snapshot records the version of the scrape output it was built from, so a
+stale snapshot is never used in place of a newer output.
+"""
+
+import os
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from batch_scoring import Cohort, all_codes, record_values
+from cohort_normalizers import scrape_version
+from scrape_output import iter_records, output_timestamp
+
+DEFAULT_STORE_DIR = "cohort_store"
+# Kolom identitas; kolom lainnya adalah satu kolom float64 per kode indikator
+ID_COLUMNS = ("sinta_id", "kode_pt", "nama_institusi", "klaster", "sinta_score_overall", "sinta_score_3yr",
+              "scrape_date", "scraped_at", "content_hash")
+# Kolom snapshot -> field record scrape, untuk pembaca yang butuh label tanpa JSON
+LABEL_FIELDS = {
+    "nama_institusi": "Nama Institusi",
+    "klaster": "Klaster",
+    "content_hash": "Content Hash",
+    "sinta_score_overall": "Sinta Score Overall",
+    "sinta_score_3yr": "Sinta Score 3Yr"
+}
+# Metadata skema Parquet yang mencatat asal snapshot
+SOURCE_VERSION_KEY = b"source_version"
+SOURCE_NAME_KEY = b"source"
+
+
+def records_to_table(records: Iterable[Dict[str, Any]], scrape_date: date,
+                     codes: Optional[List[str]] = None) -> pa.Table:
+    """
+    Flatten scrape records into an Arrow table.
+
+    Records sharing a Sinta ID are collapsed into one row (last one wins),
+    as in Cohort.from_records. Missing indicators are 0.
+
+    Args:
+        records: Scrape records.
+        scrape_date: Date stored in the scrape_date column.
+        codes: Indicator columns; defaults to every code in the indicator registry.
+
+    Returns:
+        Table with ID_COLUMNS followed by one column per code.
+    """
+    codes = list(codes or all_codes())
+    column = {code: j for j, code in enumerate(codes)}
+    rows: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        values = np.zeros(len(codes))
+        for code, value in record_values(record).items():
+            j = column.get(code)
+            if j is not None:
+                values[j] = value
+        rows[str(record.get('Sinta ID'))] = {
+            "kode_pt": record.get('Kode PT'),
+            "nama_institusi": record.get('Nama Institusi'),
+            "klaster": record.get('Klaster'),
+            "sinta_score_overall": record.get('Sinta Score Overall'),
+            "sinta_score_3yr": record.get('Sinta Score 3Yr'),
+            "scraped_at": record.get('Scraped At'),
+            "content_hash": record.get('Content Hash'),
+            "values": values
+        }
+
+    matrix = np.vstack([row["values"] for row in rows.values()]) if rows else np.zeros((0, len(codes)))
+    scraped_at = pd.to_datetime([row["scraped_at"] for row in rows.values()], errors="coerce")
+    arrays = {
+        "sinta_id": pa.array(list(rows), pa.string()),
+        "kode_pt": pa.array([None if r["kode_pt"] is None else str(r["kode_pt"]) for r in rows.values()], pa.string()),
+        "nama_institusi": pa.array([r["nama_institusi"] for r in rows.values()], pa.string()),
+        "klaster": pa.array([r["klaster"] for r in rows.values()], pa.string()).dictionary_encode(),
+        "sinta_score_overall": pa.array([r["sinta_score_overall"] for r in rows.values()], pa.float64()),
+        "sinta_score_3yr": pa.array([r["sinta_score_3yr"] for r in rows.values()], pa.float64()),
+        "scrape_date": pa.array([scrape_date] * len(rows), pa.date32()),
+        "scraped_at": pa.array(scraped_at, pa.timestamp("us")),
+        "content_hash": pa.array([r["content_hash"] for r in rows.values()], pa.string())
+    }
+    for j, code in enumerate(codes):
+        arrays[code] = pa.array(matrix[:, j], pa.float64())
+    return pa.table(arrays)
+
+
+class CohortStore:
+    """
+    Directory of Parquet snapshots, one per scrape output.
+
+    A snapshot is named after its scrape output (sinta_metrics_cluster_
+    20250101_120000.parquet) and its schema metadata holds the output's
+    scrape_version; together the snapshots form one dataset with a row per
+    institution x scrape date.
+    """
+
+    def __init__(self, directory: str = DEFAULT_STORE_DIR, codes: Optional[List[str]] = None):
+        """
+        Args:
+            directory: Folder holding the snapshots.
+            codes: Indicator columns to store (default every registry code).
+        """
+        self.directory = directory
+        self.codes = list(codes or all_codes())
+
+    def snapshot_path(self, source: str) -> str:
+        """Snapshot file of a scrape output."""
+        stem = os.path.splitext(os.path.basename(source))[0]
+        return os.path.join(self.directory, f"{stem}.parquet")
+
+    def write_snapshot(self, source: str, scrape_date: Optional[date] = None) -> str:
+        """
+        Convert a scrape output into a snapshot (replacing an older one).
+
+        Args:
+            source: Scrape output (.jsonl or legacy .json).
+            scrape_date: Date of the snapshot (default from the filename).
+
+        Returns:
+            Path of the snapshot.
+        """
+        table = records_to_table(iter_records(source), scrape_date or output_timestamp(source).date(), self.codes)
+        table = table.replace_schema_metadata({
+            SOURCE_VERSION_KEY: scrape_version(source).encode('utf-8'),
+            SOURCE_NAME_KEY: os.path.basename(source).encode('utf-8')
+        })
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.snapshot_path(source)
+        temp_path = path + ".tmp"
+        pq.write_table(table, temp_path, compression="zstd")
+        os.replace(temp_path, path)
+        return path
+
+    def is_fresh(self, source: str) -> bool:
+        """Whether the snapshot of a scrape output exists and matches its current version."""
+        path = self.snapshot_path(source)
+        if not os.path.exists(path) or not os.path.exists(source):
+            return False
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+        except (OSError, pa.ArrowInvalid):
+            return False
+        return metadata.get(SOURCE_VERSION_KEY, b"").decode('utf-8') == scrape_version(source)
+
+    def read_snapshot(self, source: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read one snapshot, loading only the requested columns.
+
+        Args:
+            source: Scrape output whose snapshot is read.
+            columns: Columns to load (default all).
+
+        Returns:
+            DataFrame with one row per institution.
+        """
+        return pq.ParquetFile(self.snapshot_path(source)).read(columns=columns).to_pandas()
+
+    def load_cohort(self, source: str, codes: Optional[List[str]] = None) -> Cohort:
+        """
+        Load a cohort from the snapshot of a scrape output.
+
+        Args:
+            source: Scrape output whose snapshot is read.
+            codes: Indicator columns (default the store's codes); codes
+                missing from the snapshot are 0.
+
+        Returns:
+            The cohort, equal to Cohort.from_records on the scrape output.
+        """
+        codes = list(codes or self.codes)
+        parquet = pq.ParquetFile(self.snapshot_path(source))
+        present = [code for code in codes if code in parquet.schema_arrow.names]
+        table = parquet.read(columns=["sinta_id", "nama_institusi", "klaster"] + present)
+
+        matrix = np.zeros((table.num_rows, len(codes)))
+        for j, code in enumerate(codes):
+            if code in present:
+                matrix[:, j] = table.column(code).to_numpy()
+        return Cohort(table.column("sinta_id").to_pylist(), table.column("nama_institusi").to_pylist(),
+                      table.column("klaster").to_pylist(), codes, matrix)
+
+    def read_labels(self, source: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the non-metric fields of every institution in a snapshot.
+
+        Args:
+            source: Scrape output whose snapshot is read.
+
+        Returns:
+            Sinta ID (as string) to a dictionary with the scrape record's
+            field names (Nama Institusi, Klaster, Content Hash and the SINTA
+            scores); fields missing from an older snapshot are None.
+        """
+        parquet = pq.ParquetFile(self.snapshot_path(source))
+        present = [column for column in LABEL_FIELDS if column in parquet.schema_arrow.names]
+        table = parquet.read(columns=["sinta_id"] + present)
+        columns = {LABEL_FIELDS[column]: table.column(column).to_pylist() for column in present}
+        return {
+            sinta_id: {field: columns[field][i] if field in columns else None for field in LABEL_FIELDS.values()}
+            for i, sinta_id in enumerate(table.column("sinta_id").to_pylist())
+        }
+
+    def dates(self) -> List[date]:
+        """Scrape dates present in the store, oldest first."""
+        if not self.snapshots():
+            return []
+        table = self.dataset().to_table(columns=["scrape_date"])
+        return sorted(set(table.column("scrape_date").to_pylist()))
+
+    def snapshots(self) -> List[str]:
+        """Snapshot files in the store, sorted by name (and so by time)."""
+        if not os.path.isdir(self.directory):
+            return []
+        return [os.path.join(self.directory, name) for name in sorted(os.listdir(self.directory))
+                if name.endswith(".parquet")]
+
+    def dataset(self) -> ds.Dataset:
+        """All snapshots as one Arrow dataset."""
+        return ds.dataset(self.snapshots(), format="parquet")
+
+    def read(self, columns: Optional[List[str]] = None, dates: Optional[Iterable[date]] = None) -> pd.DataFrame:
+        """
+        Read institution x scrape date rows across every snapshot.
+
+        Args:
+            columns: Columns to load (default all); only these are read from disk.
+            dates: Scrape dates to keep (default all).
+
+        Returns:
+            DataFrame with one row per institution per scrape date.
+        """
+        if not self.snapshots():
+            return pd.DataFrame(columns=columns or list(ID_COLUMNS) + self.codes)
+        predicate = ds.field("scrape_date").isin(list(dates)) if dates is not None else None
+        return self.dataset().to_table(columns=columns, filter=predicate).to_pandas()
+
+
+# Global instance of the cohort store
+cohort_store = CohortStore()
+
+
+def get_cohort_store() -> CohortStore:
+    """Get the global cohort store instance."""
+    return cohort_store
+
+
+def store_scrape_output(source: str) -> str:
+    """Convenience function to write the snapshot of a finished scrape output."""
+    return cohort_store.write_snapshot(source)
@@ -9,7 +9,10 @@ import streamlit as st
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List
+
+from indicator_registry import get_registry
+from scenario_store import get_scenario_store
 
 
 class SintaDataManager:
@@ -20,42 +23,35 @@ class SintaDataManager:
 
     def __init__(self):
         """Initialize the data manager and ensure session state is set up."""
+        self._listeners: List[Callable[[Optional[str], Any, Any], None]] = []
         self._ensure_session_state()
 
+    def add_listener(self, callback: Callable[[Optional[str], Any, Any], None]):
+        """
+        Register a function called after every change to the data store.
+
+        Args:
+            callback: Called as callback(key, old_value, new_value) after a
+                single value changes, and as callback(None, None, None) after
+                a bulk change (reset, load, restore).
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def _notify(self, key: Optional[str] = None, old_value: Any = None, new_value: Any = None):
+        """Inform the registered listeners about a change."""
+        for callback in self._listeners:
+            callback(key, old_value, new_value)
+
     def _ensure_session_state(self):
         """Ensure required session state variables are initialized."""
         if "SINTA_DB" not in st.session_state:
             st.session_state["SINTA_DB"] = {}
 
         if "default_values" not in st.session_state:
-            # Default values based on actual UPN Veteran Yogyakarta SINTA data from sinta_metrics_cluster_full.json
-            st.session_state["default_values"] = {
-                # Publication defaults - based on actual UPN Veteran Yogyakarta SINTA data
-                "AI1": 0.136, "AI2": 0.159, "AI3": 0.147, "AI4": 0.075, "AI5": 0.040,  # Q1-Q4, Non-Q, Non Journal Int
-                "AI6": 0.504, "AI7": 932.079, "AI8": 0.588, # International citations and cited docs
-                "AN1": 0.007, "AN2": 0.169, "AN3": 0.204, "AN4": 0.464, "AN5": 0.312, "AN6": 0.012, # National journal ranks 1-6
-                "AN7": 1.483, "AN8": 0.104, "AN9": 0.000, "AN10": 0.0, # Non-accredited, proceedings, national citations
-                "DGS1": 22.092, "DGS2": 0.473, "DGS3": 9.828, # Google Scholar metrics
-                "B1": 0.070, "B2": 0.415, "B3": 0.069, # Books metrics
-
-                # Research defaults - based on actual UPN Veteran Yogyakarta SINTA data
-                "P1": 0.0, "P2": 0.0, "P3": 51.0, "P4": 25.0, "P5": 523.0, "P6": 32.0, "P7": 37077.71,  # Research metrics
-
-                # Abdimas defaults - based on actual UPN Veteran Yogyakarta SINTA data
-                "PM1": 0.0, "PM2": 0.0, "PM3": 9.0, "PM4": 0.0, "PM5": 96.0, "PM6": 8.0, "PM7": 3351.79,  # Community service metrics
-
-                # HKI defaults - based on actual UPN Veteran Yogyakarta SINTA data
-                "KI1": 0.0, "KI2": 0.015, "KI3": 0.005, "KI4": 0.0, "KI5": 0.0, "KI6": 0.0,
-                "KI7": 0.0, "KI8": 0.003, "KI9": 0.409, "KI10": 0.0,  # IPR metrics
-
-                # SDM defaults - based on actual UPN Veteran Yogyakarta SINTA data (613 total authors)
-                "R1": 0.0, "R2": 0.0, "R3": 0.0, "DOS1": 0.024, "DOS2": 0.178, "DOS3": 0.481,
-                "DOS4": 0.242, "DOS5": 0.076, "REV1": 0.0,  # Staff and reviewer metrics
-
-                # Kelembagaan defaults - based on actual UPN Veteran Yogyakarta SINTA data (35 departments)
-                "APS1": 0.514, "APS2": 0.343, "APS3": 0.114, "APS4": 0.029,  # Accreditation program metrics
-                "JO1": 0.0, "JO2": 2.0, "JO3": 2.0, "JO4": 10.0, "JO5": 2.0, "JO6": 0.0  # Journal accreditation metrics
-            }
+            # Default values based on actual UPN Veteran Yogyakarta SINTA data, stored under
+            # the same keys the input pages use (see indicator_registry)
+            st.session_state["default_values"] = get_registry().default_values()
 
         # Initialize with default values if DB is empty
         if not st.session_state["SINTA_DB"]:
@@ -71,6 +67,7 @@ class SintaDataManager:
 
     def set_value(self, key: str, value: Any):
         """Set a value in the data store."""
+        old_value = st.session_state["SINTA_DB"].get(key)
         # Ensure we only store numeric values
         try:
             numeric_value = float(value)
@@ -79,6 +76,7 @@ class SintaDataManager:
             # If it's not a valid number, store as-is but issue a warning
             st.session_state["SINTA_DB"][key] = value
             st.warning(f"Warning: Value '{value}' for key '{key}' is not numeric")
+        self._notify(key, old_value, st.session_state["SINTA_DB"][key])
 
     def get_all_values(self) -> Dict[str, Any]:
         """Get all values from the data store."""
@@ -87,54 +85,76 @@ class SintaDataManager:
     def reset_data(self):
         """Reset all data to default values."""
         st.session_state["SINTA_DB"] = st.session_state["default_values"].copy()
+        self._notify()
 
-    def save_to_file(self, filename: str = None) -> bool:
+    def save_scenario(self, name: str, note: str = "") -> Optional[int]:
         """
-        Save current data to a JSON file.
+        Save the current data as a named scenario (only changed keys are written).
 
         Args:
-            filename: Optional filename to save to. If None, uses a timestamped name.
+            name: Scenario name.
+            note: Note stored with the new version.
 
         Returns:
-            True if successful, False otherwise.
+            The scenario's current version, or None if saving failed.
         """
         try:
-            if filename is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"sinta_data_{timestamp}.json"
+            version, _ = get_scenario_store().save(name, st.session_state["SINTA_DB"], note)
+            return version
+        except Exception as e:
+            st.error(f"Error saving scenario: {e}")
+            return None
+
+    def load_scenario(self, name: str, version: Optional[int] = None) -> bool:
+        """
+        Load a named scenario into the data store.
+
+        Args:
+            name: Scenario name.
+            version: Version to load (default the current one).
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(st.session_state["SINTA_DB"], f, indent=2, ensure_ascii=False)
+        Returns:
+            True if successful, False otherwise.
+        """
+        try:
+            loaded_data = get_scenario_store().load(name, version)
+            if loaded_data is None:
+                st.error(f"Scenario not found: {name}")
+                return False
 
+            # Update the session state while preserving structure
+            st.session_state["SINTA_DB"].update(loaded_data)
+            self._notify()
             return True
         except Exception as e:
-            st.error(f"Error saving data: {e}")
+            st.error(f"Error loading scenario: {e}")
             return False
 
-    def load_from_file(self, filename: str) -> bool:
+    def import_file(self, filename: str, name: Optional[str] = None) -> Optional[int]:
         """
-        Load data from a JSON file.
+        Import a JSON file saved by earlier versions as a scenario.
 
         Args:
-            filename: Path to the JSON file to load.
+            filename: Path to the JSON file.
+            name: Scenario name (default the file name without extension).
 
         Returns:
-            True if successful, False otherwise.
+            The scenario's current version, or None if importing failed.
         """
         try:
             if not os.path.exists(filename):
                 st.error(f"File not found: {filename}")
-                return False
+                return None
 
             with open(filename, 'r', encoding='utf-8') as f:
                 loaded_data = json.load(f)
 
-            # Update the session state while preserving structure
-            st.session_state["SINTA_DB"].update(loaded_data)
-            return True
+            name = name or os.path.splitext(os.path.basename(filename))[0]
+            version, _ = get_scenario_store().save(name, loaded_data, f"Impor dari {filename}")
+            return version
         except Exception as e:
-            st.error(f"Error loading data: {e}")
-            return False
+            st.error(f"Error importing data: {e}")
+            return None
 
     def validate_data(self) -> Dict[str, str]:
         """
@@ -195,6 +215,7 @@ class SintaDataManager:
             backup_data: Dictionary containing the backup data
         """
         st.session_state["SINTA_DB"] = backup_data
+        self._notify()
 
 
 # Global instance of the data manager
@@ -4,6 +4,7 @@ import plotly.express as px
 
 # Import our enhanced modules
 from data_manager import get_val, set_val
+from indicator_registry import get_component
 
 def main():
     # Set page config without conflicting with main app
@@ -17,20 +18,9 @@ def main():
     st.markdown("Masukkan nilai pada tabel di kiri. Skor ternormalisasi dihitung menggunakan rumus terbaru.")
     st.divider()
 
-    # --- KONFIGURASI DATA HKI ---
-    # (Kode, Nama, Bobot, Default Value from UPN Veteran Yogyakarta profile)
-    data_hki = [
-        ("KI1", "HKI PATEN", 40, 0.000),
-        ("KI2", "HKI PATEN SEDERHANA", 20, 0.015),
-        ("KI3", "HKI MEREK", 1, 0.005),
-        ("KI4", "HKI INDIKASI GEOGRAFIS", 10, 0.000),
-        ("KI5", "HKI DESAIN INDUSTRI", 20, 0.000),
-        ("KI6", "HKI DESAIN TATA LETAK SIRKUIT TERPADU", 20, 0.000),
-        ("KI7", "HKI RAHASIA DAGANG", 0, 0.000),
-        ("KI8", "HKI PERLINDUNGAN VARIETAS TANAMAN", 40, 0.003),
-        ("KI9", "HKI HAK CIPTA", 1, 0.409),
-        ("KI10", "HKI SELAIN TERDAFTAR / DIBERI / DITERIMA", 1, 0.000),
-    ]
+    # --- DATA HKI ---
+    # Kode, nama, bobot, nilai default dan pembagi normalisasi dari indicator_registry
+    component = get_component("HKI")
 
     # --- LAYOUT SETUP ---
     col_left, col_right = st.columns([1.6, 1], gap="large")
@@ -53,7 +43,7 @@ def main():
         h5.markdown("**Total**")
         st.markdown("---")
 
-        for kode, nama, bobot, default_val in data_hki:
+        for _, kode, nama, bobot, default_val in component.rows:
             r1, r2, r3, r4, r5 = st.columns([0.6, 3.5, 0.6, 1.2, 1])
 
             with r1: st.write(f"**{kode}**")
@@ -65,7 +55,7 @@ def main():
                 val = st.number_input(
                     f"v_{kode}",
                     value=float(current_val),
-                    step=0.001,
+                    step=component.step(kode),
                     format="%.3f",
                     label_visibility="collapsed"
                 )
@@ -86,11 +76,8 @@ def main():
         st.markdown("### 📊 Ringkasan Skor")
 
         # --- RUMUS BARU ---
-        # (Total Score / 14.7) * 100
-        if total_score_raw > 0:
-            score_normalized = (total_score_raw / max(total_score_raw, 14.7)) * 100
-        else:
-            score_normalized = 0.0
+        # (Total Score / max(pembagi normalisasi, Total Score)) * 100
+        score_normalized = component.normalize(component.adjusted(total_score_raw))
 
         # Tampilan Kartu Skor
         st.markdown(f"""
@@ -111,8 +98,8 @@ def main():
         # Card 3: Ternormalisasi (Hasil Akhir)
         st.markdown(f"""
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
-            <h2 style="color: #234e52; margin:0;">{score_normalized * 0.10:,.2f}</h2>
-            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal (10%)</b></p>
+            <h2 style="color: #234e52; margin:0;">{score_normalized * component.weight:,.2f}</h2>
+            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal ({component.weight:.0%})</b></p>
         </div>
         """, unsafe_allow_html=True)
 
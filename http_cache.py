@@ -0,0 +1,122 @@
+"""
+HTTP Cache Module for SINTA Cluster Predictor
+
+This module provides a persistent on-disk cache for SINTA profile pages. Each
+entry stores the raw HTML together with its HTTP validators (ETag and
+Last-Modified), a content hash, the time it was fetched and, once known, the
+parsed metrics. The scraper uses it to send conditional requests, to skip
+requests entirely inside a TTL, and to skip re-parsing pages whose content
+did not change since the last run.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = ".sinta_cache"
+DEFAULT_TTL = 12 * 60 * 60  # detik
+
+
+def content_hash(body: str) -> str:
+    """Hash of a page body, used to detect unchanged content."""
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    File-per-URL response cache.
+
+    Entries are JSON files named after the SHA-1 of the URL and are replaced
+    atomically, so concurrent fetch threads (each working on its own URL) and
+    an interrupted run never leave a half-written entry behind.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            directory: Folder holding the cache entries.
+            ttl: Seconds during which a cached page is used without any request.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".json")
+
+    def _write(self, url: str, entry: Dict[str, Any]):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(url))
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cache entry for a URL, or None if it is missing or unreadable."""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still inside the TTL."""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from an entry's validators."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url: str, body: str, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, metrics: Any = None) -> Dict[str, Any]:
+        """
+        Store a freshly downloaded page.
+
+        Args:
+            url: Page URL.
+            body: Raw HTML.
+            etag: ETag response header, if any.
+            last_modified: Last-Modified response header, if any.
+            metrics: Parsed metrics when they are already known for this body.
+
+        Returns:
+            The stored entry.
+        """
+        entry = {
+            "url": url,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash(body),
+            "fetched_at": time.time(),
+            "metrics": metrics
+        }
+        self._write(url, entry)
+        return entry
+
+    def touch(self, url: str, entry: Dict[str, Any]):
+        """Mark an entry as revalidated now (after a 304 or an unchanged body)."""
+        entry["fetched_at"] = time.time()
+        self._write(url, entry)
+
+    def store_metrics(self, url: str, metrics: Any):
+        """Attach parsed metrics to the current entry so unchanged pages are not re-parsed."""
+        entry = self.get(url)
+        if entry is not None:
+            entry["metrics"] = metrics
+            self._write(url, entry)
+
+    def clear(self):
+        """Remove every cache entry."""
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,156 @@
+"""
+Incremental Scoring Module for SINTA Cluster Predictor
+
+This module keeps the simulation score up to date while the user edits it.
+The per-component raw sums, normalized scores and the weighted total are
+kept in the session; when set_val changes one indicator, only its component
+is updated with delta x weight and renormalized, so a what-if edit costs a
+constant amount of work instead of a full recomputation. Bulk changes
+(reset, load, restore) drop the state, which is rebuilt on the next read.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from data_manager import get_data_manager
+from indicator_registry import IndicatorRegistry, get_registry
+from score_cache import ScoreCache, get_score_cache
+
+SESSION_KEY = "SCORE_STATE"
+# Jumlah pembaruan inkremental sebelum state dihitung ulang penuh,
+# supaya galat pembulatan dari penjumlahan delta tidak menumpuk
+DEFAULT_REBUILD_EVERY = 1000
+
+
+class IncrementalEvaluator:
+    """
+    Session score state maintained by delta updates.
+
+    The state holds one raw sum (after the adjustment factor), normalized
+    score and weighted score per component, plus the total. Counters for
+    incremental updates and full rebuilds are kept for monitoring.
+    """
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None,
+                 cache: Optional[ScoreCache] = None,
+                 rebuild_every: int = DEFAULT_REBUILD_EVERY):
+        """
+        Args:
+            registry: Indicator registry (default the global registry).
+            cache: Score cache used by full rebuilds (default the global cache).
+            rebuild_every: Incremental updates before a forced full rebuild.
+        """
+        self.registry = registry or get_registry()
+        self.cache = cache or get_score_cache()
+        self.rebuild_every = max(1, int(rebuild_every))
+        self.updates = 0
+        self.rebuilds = 0
+
+        # Storage key -> (posisi komponen, bobot x faktor penyesuaian, nilai default)
+        self._targets: Dict[str, Tuple[int, float, float]] = {}
+        for k, component in enumerate(self.registry.components.values()):
+            for key, weight, default in zip(component.storage_keys, component.weights, component.defaults):
+                self._targets[key] = (k, float(weight) * component.adjustment, float(default))
+
+    def _state(self) -> Optional[Dict[str, Any]]:
+        """Current session state, or None if it must be rebuilt (also after a normalizer change)."""
+        state = st.session_state.get(SESSION_KEY)
+        if state is not None and state["version"] != self.registry.version:
+            return None
+        return state
+
+    def invalidate(self):
+        """Drop the session state; the next read rebuilds it."""
+        st.session_state.pop(SESSION_KEY, None)
+
+    def rebuild(self, get: Callable[[str, float], float]) -> Dict[str, Any]:
+        """
+        Compute the session state from scratch.
+
+        Args:
+            get: Lookup function such as data_manager.get_val(key, default).
+
+        Returns:
+            The new state.
+        """
+        values = self.registry.read_values(get)
+        _, component_scores = self.cache.score(values)
+        normalized = np.array([component_scores[name] for name in self.registry.names])
+        weighted = normalized * self.registry.component_weights
+        state = {
+            "raw": values @ self.registry.weight_matrix,
+            "normalized": normalized,
+            "weighted": weighted,
+            "total": float(weighted.sum()),
+            "edits": 0,
+            "version": self.registry.version
+        }
+        st.session_state[SESSION_KEY] = state
+        self.rebuilds += 1
+        return state
+
+    def on_change(self, key: Optional[str], old_value: Any, new_value: Any):
+        """
+        Data manager listener: apply one edit to the session state.
+
+        Args:
+            key: Changed storage key, or None after a bulk change.
+            old_value: Stored value before the edit (None if the key was absent).
+            new_value: Stored value after the edit.
+        """
+        if key is None:
+            self.invalidate()
+            return
+        target = self._targets.get(key)
+        state = self._state()
+        if target is None or state is None:
+            return
+
+        k, weight, default = target
+        try:
+            # Key yang belum ada dibaca sebagai nilai default-nya oleh rebuild()
+            delta = float(new_value) - float(default if old_value is None else old_value)
+        except (ValueError, TypeError):
+            self.invalidate()
+            return
+        if delta == 0:
+            return
+
+        component = self.registry.component(self.registry.names[k])
+        state["raw"][k] += delta * weight
+        state["normalized"][k] = component.normalize(state["raw"][k])
+        state["weighted"][k] = state["normalized"][k] * component.weight
+        state["total"] = float(state["weighted"].sum())
+        state["edits"] += 1
+        self.updates += 1
+        if state["edits"] >= self.rebuild_every:
+            self.invalidate()
+
+    def scores(self, get: Callable[[str, float], float]) -> Tuple[float, Dict[str, float]]:
+        """
+        Get the current scores, rebuilding the state only if needed.
+
+        Args:
+            get: Lookup function used for a rebuild.
+
+        Returns:
+            Tuple of (total_score, component_scores_dict).
+        """
+        state = self._state() or self.rebuild(get)
+        return state["total"], dict(zip(self.registry.names, state["normalized"].tolist()))
+
+    def stats(self) -> Dict[str, int]:
+        """Number of incremental updates and full rebuilds so far."""
+        return {"updates": self.updates, "rebuilds": self.rebuilds}
+
+
+# Global instance of the incremental evaluator, listening to every data store change
+incremental_evaluator = IncrementalEvaluator()
+get_data_manager().add_listener(incremental_evaluator.on_change)
+
+
+def get_incremental_evaluator() -> IncrementalEvaluator:
+    """Get the global incremental evaluator instance."""
+    return incremental_evaluator
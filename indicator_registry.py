@@ -0,0 +1,365 @@
+"""
+Indicator Registry Module for SINTA Cluster Predictor
+
+This module is the single source of truth for the SINTA indicators: code,
+name, weight, default value and storage key of every indicator, and the
+normalizer, adjustment factor and total-score weight of every component.
+The declarative table below is compiled once at import time into NumPy
+weight/default vectors and code index maps, which the input pages, the
+ClusterPredictor, the data manager defaults and the batch scorer all use.
+The registry is shared by every Streamlit session, so normalizer changes
+apply only to the thread that makes them (the session's script run); each
+session re-applies its own choice at the start of every rerun.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Format indikator: (Group, Kode, Nama Item, Bobot, Nilai Default)
+# Nilai default berasal dari profil SINTA UPN Veteran Yogyakarta.
+COMPONENTS = {
+    "Publikasi": {
+        "weight": 0.25,
+        "normalizer": 1776.69,
+        "adjustment": 1.0,
+        # Halaman publikasi menyimpan nilai dengan kode polos sebagai key
+        "key_prefix": "",
+        "input": {"step": 0.001},
+        "indicators": [
+            # --- INTERNASIONAL (AI) ---
+            ("Intl", "AI1", "ARTIKEL JURNAL INTERNASIONAL Q1", 40, 0.136),
+            ("Intl", "AI2", "ARTIKEL JURNAL INTERNASIONAL Q2", 35, 0.159),
+            ("Intl", "AI3", "ARTIKEL JURNAL INTERNASIONAL Q3", 30, 0.147),
+            ("Intl", "AI4", "ARTIKEL JURNAL INTERNASIONAL Q4", 25, 0.075),
+            ("Intl", "AI5", "ARTIKEL JURNAL INTERNASIONAL NON Q", 20, 0.040),
+            ("Intl", "AI6", "ARTIKEL NON JURNAL INTERNASIONAL", 15, 0.504),
+            ("Intl", "AI7", "JUMLAH SITASI PUBLIKASI INTERNASIONAL", 1, 932.079),
+            ("Intl", "AI8", "JUMLAH DOKUMEN PUBLIKASI INTERNASIONAL TERSITASI", 1, 0.588),
+            # --- NASIONAL (AN) ---
+            ("Nas", "AN1", "ARTIKEL JURNAL NASIONAL PERINGKAT 1", 25, 0.007),
+            ("Nas", "AN2", "ARTIKEL JURNAL NASIONAL PERINGKAT 2", 20, 0.169),
+            ("Nas", "AN3", "ARTIKEL JURNAL NASIONAL PERINGKAT 3", 15, 0.204),
+            ("Nas", "AN4", "ARTIKEL JURNAL NASIONAL PERINGKAT 4", 10, 0.464),
+            ("Nas", "AN5", "ARTIKEL JURNAL NASIONAL PERINGKAT 5", 5, 0.312),
+            ("Nas", "AN6", "ARTIKEL JURNAL NASIONAL PERINGKAT 6", 2, 0.012),
+            ("Nas", "AN8", "PROSIDING NASIONAL", 2, 0.104),
+            ("Nas", "AN9", "JUMLAH SITASI PUBLIKASI NASIONAL PER DOSEN", 1, 0.000),
+            # --- BUKU & LAINNYA (B & DGS) ---
+            ("Other", "DGS2", "GS CITATION PER LECTURER", 1, 0.473),
+            ("Other", "B1", "BUKU AJAR", 20, 0.070),
+            ("Other", "B2", "BUKU REFERENSI", 40, 0.415),
+            ("Other", "B3", "BUKU MONOGRAF", 20, 0.069),
+        ],
+    },
+    "Research": {
+        "weight": 0.15,
+        "normalizer": 261491.37,
+        "adjustment": 1.0,
+        "key_prefix": "v_",
+        "input": {"step": 1.0},
+        "indicators": [
+            (None, "P1", "JUMLAH PENELITIAN HIBAH LUAR NEGERI (KETUA)", 40, 0.0),
+            (None, "P2", "JUMLAH PENELITIAN HIBAH LUAR NEGERI (ANGGOTA)", 10, 0.0),
+            (None, "P3", "JUMLAH PENELITIAN HIBAH EKSTERNAL (KETUA)", 30, 51.0),
+            (None, "P4", "JUMLAH PENELITIAN HIBAH EKSTERNAL (ANGGOTA)", 10, 25.0),
+            (None, "P5", "JUMLAH PENELITIAN INTERNAL INSTITUSI (KETUA)", 15, 523.0),
+            (None, "P6", "JUMLAH PENELITIAN INTERNAL INSTITUSI (ANGGOTA)", 5, 32.0),
+            (None, "P7", "JUMLAH RUPIAH PENELITIAN (JUTA RUPIAH)", 0.05, 37077.71),
+        ],
+    },
+    "Abdimas": {
+        "weight": 0.15,
+        "normalizer": 447937.99,
+        "adjustment": 1.0,
+        "key_prefix": "v_",
+        "input": {"step": 1.0, "steps": {"PM7": 0.01}},
+        "indicators": [
+            (None, "PM1", "JUMLAH PENGABDIAN MASYARAKAT INTERNASIONAL (KETUA)", 40, 0.0),
+            (None, "PM2", "JUMLAH PENGABDIAN MASYARAKAT INTERNASIONAL (ANGGOTA)", 10, 0.0),
+            (None, "PM3", "JUMLAH PENGABDIAN MASYARAKAT NASIONAL/EKSTERNAL (KETUA)", 30, 9.0),
+            (None, "PM4", "JUMLAH PENGABDIAN MASYARAKAT NASIONAL/EKSTERNAL (ANGGOTA)", 10, 0.0),
+            (None, "PM5", "JUMLAH PENGABDIAN MASYARAKAT LOKAL/INTERNAL INSTITUSI (KETUA)", 15, 96.0),
+            (None, "PM6", "JUMLAH PENGABDIAN MASYARAKAT LOKAL/INTERNAL INSTITUSI (ANGGOTA)", 5, 8.0),
+            (None, "PM7", "JUMLAH RUPIAH PENGABDIAN MASYARAKAT (JUTA RUPIAH)", 0.05, 3351.79),
+        ],
+    },
+    "HKI": {
+        "weight": 0.10,
+        "normalizer": 14.7,
+        "adjustment": 1.0,
+        "key_prefix": "v_",
+        "input": {"step": 0.001},
+        "indicators": [
+            (None, "KI1", "HKI PATEN", 40, 0.000),
+            (None, "KI2", "HKI PATEN SEDERHANA", 20, 0.015),
+            (None, "KI3", "HKI MEREK", 1, 0.005),
+            (None, "KI4", "HKI INDIKASI GEOGRAFIS", 10, 0.000),
+            (None, "KI5", "HKI DESAIN INDUSTRI", 20, 0.000),
+            (None, "KI6", "HKI DESAIN TATA LETAK SIRKUIT TERPADU", 20, 0.000),
+            (None, "KI7", "HKI RAHASIA DAGANG", 0, 0.000),
+            (None, "KI8", "HKI PERLINDUNGAN VARIETAS TANAMAN", 40, 0.003),
+            (None, "KI9", "HKI HAK CIPTA", 1, 0.409),
+            (None, "KI10", "HKI SELAIN TERDAFTAR / DIBERI / DITERIMA", 1, 0.000),
+        ],
+    },
+    "SDM": {
+        "weight": 0.15,
+        "normalizer": 2.443,
+        "adjustment": 1.0,
+        "key_prefix": "v_",
+        "input": {"step": 0.001},
+        "indicators": [
+            (None, "R1", "REVIEWER JURNAL INTERNASIONAL (ORANG)", 2, 0.0),
+            (None, "R2", "REVIEWER JURNAL NASIONAL SINTA 1 & 2 (ORANG)", 1, 0.0),
+            (None, "R3", "REVIEWER JURNAL NASIONAL SINTA 3 S.D. 6 (ORANG)", 0.5, 0.0),
+            (None, "DOS1", "DOSEN PROFESSOR", 4, 0.024),
+            (None, "DOS2", "DOSEN LEKTOR KEPALA", 3, 0.178),
+            (None, "DOS3", "DOSEN LEKTOR", 2, 0.481),
+            (None, "DOS4", "DOSEN ASISTEN AHLI", 1, 0.242),
+            (None, "DOS5", "DOSEN NON JAFA", 0, 0.076),
+        ],
+    },
+    "Kelembagaan": {
+        "weight": 0.15,
+        "normalizer": 2181.33,
+        "adjustment": 0.30,  # Faktor penyesuaian 30% sebelum normalisasi
+        "key_prefix": "v_",
+        "input": {"step": 0.001},
+        "indicators": [
+            ("Akreditasi", "APS1", "AKREDITASI PRODI A/UNGGUL/INTERNASIONAL", 40, 0.514),
+            ("Akreditasi", "APS2", "AKREDITASI PRODI B/BAIK SEKALI", 30, 0.343),
+            ("Akreditasi", "APS3", "AKREDITASI PRODI C/BAIK", 20, 0.114),
+            ("Akreditasi", "APS4", "AKREDITASI PRODI D/TIDAK TERAKREDITASI", 0, 0.029),
+            ("Jurnal", "JO1", "JUMLAH JURNAL TERAKREDITASI S1", 40, 0.000),
+            ("Jurnal", "JO2", "JUMLAH JURNAL TERAKREDITASI S2", 30, 2.000),
+            ("Jurnal", "JO3", "JUMLAH JURNAL TERAKREDITASI S3", 20, 2.000),
+            ("Jurnal", "JO4", "JUMLAH JURNAL TERAKREDITASI S4", 10, 10.000),
+            ("Jurnal", "JO5", "JUMLAH JURNAL TERAKREDITASI S5", 5, 2.000),
+            ("Jurnal", "JO6", "JUMLAH JURNAL TERAKREDITASI S6", 2, 0.000),
+        ],
+    },
+}
+
+
+class Component:
+    """
+    Compiled form of one SINTA component.
+
+    Attributes:
+        name: Component name (e.g. "Publikasi").
+        weight: Share of the component in the total score.
+        normalizer: Divisor of the normalized score.
+        adjustment: Factor applied to the raw total before normalizing.
+        rows: Original (group, code, name, weight, default) tuples, for display.
+        codes: Indicator codes in table order.
+        storage_keys: SINTA_DB key of each indicator.
+        weights: float64 weight vector.
+        defaults: float64 default value vector.
+        index: Map of indicator code to its position.
+    """
+
+    def __init__(self, name: str, spec: Dict[str, Any]):
+        self.name = name
+        self.weight = float(spec["weight"])
+        self.base_normalizer = float(spec["normalizer"])
+        self.adjustment = float(spec["adjustment"])
+        self._registry: Optional["IndicatorRegistry"] = None
+        self._position = 0
+        self.input = spec.get("input", {})
+        self.rows: List[Tuple] = list(spec["indicators"])
+
+        self.codes = [code for _, code, _, _, _ in self.rows]
+        self.names = [nama for _, _, nama, _, _ in self.rows]
+        self.groups = [group for group, _, _, _, _ in self.rows]
+        self.storage_keys = [spec["key_prefix"] + code for code in self.codes]
+        self.weights = np.array([weight for _, _, _, weight, _ in self.rows], dtype=float)
+        self.defaults = np.array([default for _, _, _, _, default in self.rows], dtype=float)
+        self.index = {code: i for i, code in enumerate(self.codes)}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def normalizer(self) -> float:
+        """Divisor of the normalized score currently in effect (see IndicatorRegistry.normalizers)."""
+        if self._registry is None:
+            return self.base_normalizer
+        return float(self._registry.normalizers[self._position])
+
+    def step(self, code: str) -> float:
+        """Input step of an indicator's number_input."""
+        return self.input.get("steps", {}).get(code, self.input.get("step", 1.0))
+
+    def read_values(self, get: Callable[[str, float], float]) -> np.ndarray:
+        """
+        Gather the current value of every indicator.
+
+        Args:
+            get: Lookup function such as data_manager.get_val(key, default).
+
+        Returns:
+            float64 value vector in table order.
+        """
+        return np.array([get(key, default) for key, default in zip(self.storage_keys, self.defaults.tolist())],
+                        dtype=float)
+
+    def total(self, values: np.ndarray) -> float:
+        """Raw total: sum of value x weight."""
+        return float(np.dot(values, self.weights))
+
+    def adjusted(self, total: float) -> float:
+        """Raw total after the component's adjustment factor."""
+        return total * self.adjustment
+
+    def normalize(self, adjusted):
+        """
+        Normalized score, (adjusted / max(adjusted, normalizer)) x 100.
+
+        Works on scalars and arrays; the score never exceeds 100.
+        """
+        return adjusted / np.maximum(adjusted, self.normalizer) * 100
+
+    def score(self, values: np.ndarray) -> float:
+        """Normalized score of a value vector."""
+        return float(self.normalize(self.adjusted(self.total(values))))
+
+
+class IndicatorRegistry:
+    """
+    All components compiled into dense arrays.
+
+    Attributes:
+        components: Compiled components by name, in table order.
+        codes: Every indicator code, concatenated in component order.
+        storage_keys: SINTA_DB key of every indicator, same order as codes.
+        index: Map of indicator code to its position in codes.
+        slices: Position range of each component within codes.
+        weight_matrix: (codes x components) matrix of weight x adjustment.
+        normalizers: Normalizer of each component in effect for the current
+            thread (the base normalizers unless set_normalizers was called).
+        base_normalizers: The normalizers of the declarative table.
+        component_weights: Total-score weight of each component.
+        version: Identifies the normalizers in effect, so cached scores can
+            tell they are out of date; equal normalizers share a version and
+            the base normalizers are version 0.
+    """
+
+    def __init__(self, specs: Dict[str, Dict[str, Any]] = None):
+        """
+        Args:
+            specs: Declarative component table (default COMPONENTS).
+        """
+        self.components = {name: Component(name, spec) for name, spec in (specs or COMPONENTS).items()}
+        self.names = list(self.components)
+
+        self.codes, self.storage_keys, self.slices = [], [], {}
+        for name, component in self.components.items():
+            start = len(self.codes)
+            self.codes += component.codes
+            self.storage_keys += component.storage_keys
+            self.slices[name] = slice(start, len(self.codes))
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.defaults = np.concatenate([c.defaults for c in self.components.values()])
+
+        self.weight_matrix = np.zeros((len(self.codes), len(self.components)))
+        for k, (name, component) in enumerate(self.components.items()):
+            self.weight_matrix[self.slices[name], k] = component.weights * component.adjustment
+            component._registry, component._position = self, k
+        self._base = np.array([c.base_normalizer for c in self.components.values()])
+        self._base.flags.writeable = False
+        self.base_normalizers = dict(zip(self.names, self._base.tolist()))
+        self.component_weights = np.array([c.weight for c in self.components.values()])
+
+        # Pembagi per thread (satu run skrip Streamlit per sesi) dan nomor versi per isi pembagi
+        self._local = threading.local()
+        self._versions: Dict[bytes, int] = {self._base.tobytes(): 0}
+        self._versions_lock = threading.Lock()
+
+    @property
+    def normalizers(self) -> np.ndarray:
+        """Read-only normalizer array in effect for the current thread."""
+        return getattr(self._local, "normalizers", self._base)
+
+    @property
+    def version(self) -> int:
+        """Version of the normalizers in effect for the current thread."""
+        return getattr(self._local, "version", 0)
+
+    def set_normalizers(self, normalizers: Dict[str, float]):
+        """
+        Replace the normalizers of some or all components for the current thread.
+
+        Other sessions keep their own normalizers; a Streamlit session calls
+        this again at the start of every rerun.
+
+        Args:
+            normalizers: Component name to new normalizer (must be > 0).
+        """
+        values = self.normalizers.copy()
+        for k, name in enumerate(self.names):
+            if name in normalizers and normalizers[name] > 0:
+                values[k] = float(normalizers[name])
+        values.flags.writeable = False
+        with self._versions_lock:
+            version = self._versions.setdefault(values.tobytes(), len(self._versions))
+        self._local.normalizers, self._local.version = values, version
+
+    def reset_normalizers(self):
+        """Restore the normalizers of the declarative table for the current thread."""
+        self._local.__dict__.clear()
+
+    def component(self, name: str) -> Component:
+        """Get a compiled component by name."""
+        return self.components[name]
+
+    def default_values(self) -> Dict[str, float]:
+        """Default SINTA_DB contents: storage key to default value."""
+        return dict(zip(self.storage_keys, self.defaults.tolist()))
+
+    def read_values(self, get: Callable[[str, float], float]) -> np.ndarray:
+        """Gather every indicator value (in codes order) through a get(key, default) function."""
+        return np.array([get(key, default) for key, default in zip(self.storage_keys, self.defaults.tolist())],
+                        dtype=float)
+
+    def score_vector(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Score a single value vector (codes order).
+
+        Returns:
+            Dictionary with 'raw' (after adjustment), 'normalized' and
+            'weighted' arrays of one entry per component, and 'total'.
+        """
+        scores = self.score_matrix(np.asarray(values, dtype=float)[np.newaxis, :])
+        return {key: value[0] for key, value in scores.items()}
+
+    def score_matrix(self, matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Score many value vectors at once.
+
+        Args:
+            matrix: Array of shape (n, len(codes)).
+
+        Returns:
+            Dictionary with 'raw', 'normalized' and 'weighted' arrays of
+            shape (n, components) and 'total' of shape (n,).
+        """
+        raw = matrix @ self.weight_matrix
+        normalized = raw / np.maximum(raw, self.normalizers) * 100
+        weighted = normalized * self.component_weights
+        return {"raw": raw, "normalized": normalized, "weighted": weighted, "total": weighted.sum(axis=1)}
+
+
+# Global instance of the indicator registry
+registry = IndicatorRegistry()
+
+
+def get_registry() -> IndicatorRegistry:
+    """Get the global indicator registry."""
+    return registry
+
+
+def get_component(name: str) -> Optional[Component]:
+    """Convenience function to get a compiled component by name."""
+    return registry.components.get(name)
@@ -0,0 +1,133 @@
+"""
+Institution CSV Module for SINTA Cluster Predictor
+
+This module loads the institution list (hasil_sinta_metric.csv) once per
+file change. Columns are read with explicit dtypes - integer IDs, a
+categorical Klaster and float scores - instead of inferring object columns
+on every read. The parsed frame is kept in memory and in a pickle sidecar
+next to the CSV, both keyed by the CSV's size and modification time, so
+page reruns and new processes skip parsing until the CSV changes.
+"""
+
+import os
+import pickle
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+DEFAULT_CSV_PATH = "hasil_sinta_metric.csv"
+SIDECAR_SUFFIX = ".pkl"
+
+# Tipe kolom yang dikenal; kolom lain dibiarkan diinferensi pandas
+CSV_DTYPES = {
+    "No": "Int32",
+    "Kode PT": "Int64",
+    "Nama Institusi": "string",
+    "Klaster": "category",
+    "Sinta Score Overall": "float64",
+    "Sinta Score 3Yr": "float64",
+    "Sinta ID Link": "Int64",
+}
+
+
+def _stamp(path: str) -> Tuple[int, int]:
+    """Size and modification time of a file, identifying its content version."""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def read_institutions(source: Any) -> pd.DataFrame:
+    """
+    Parse an institution CSV with the known dtypes (no caching).
+
+    Args:
+        source: Path or file-like object (e.g. a Streamlit upload).
+
+    Returns:
+        The institution frame.
+    """
+    return pd.read_csv(source, dtype=CSV_DTYPES)
+
+
+class InstitutionLoader:
+    """
+    Cached loader for institution CSV files.
+
+    Each path is cached in memory and in a pickle sidecar (path + ".pkl")
+    together with the CSV's size and modification time; a changed CSV is
+    parsed again and the sidecar rewritten.
+    """
+
+    def __init__(self):
+        self._frames: Dict[str, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    def _read_sidecar(self, path: str, stamp: Tuple[int, int]) -> Optional[pd.DataFrame]:
+        try:
+            with open(path + SIDECAR_SUFFIX, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(cached, dict) or cached.get("stamp") != stamp:
+            return None
+        return cached.get("frame")
+
+    def _write_sidecar(self, path: str, stamp: Tuple[int, int], frame: pd.DataFrame):
+        temp_path = path + SIDECAR_SUFFIX + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump({"stamp": stamp, "frame": frame}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path + SIDECAR_SUFFIX)
+        except OSError:
+            pass  # direktori hanya-baca: cukup cache di memori
+
+    def load(self, path: str = DEFAULT_CSV_PATH, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load an institution CSV, parsing it only if it changed.
+
+        Args:
+            path: CSV file.
+            columns: Columns to return (default all); missing ones are skipped.
+
+        Returns:
+            A copy of the cached frame (safe to modify).
+        """
+        stamp = _stamp(path)
+        key = os.path.abspath(path)
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is None or cached[0] != stamp:
+                frame = self._read_sidecar(path, stamp)
+                if frame is None:
+                    frame = read_institutions(path)
+                    self._write_sidecar(path, stamp, frame)
+                cached = self._frames[key] = (stamp, frame)
+        frame = cached[1]
+        if columns is not None:
+            frame = frame[[column for column in columns if column in frame.columns]]
+        return frame.copy()
+
+
+# Global instance of the institution loader
+institution_loader = InstitutionLoader()
+
+
+def get_institution_loader() -> InstitutionLoader:
+    """Get the global institution loader instance."""
+    return institution_loader
+
+
+def load_institutions(source: Union[str, Any] = DEFAULT_CSV_PATH,
+                      columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Convenience function: load an institution CSV from a path (cached) or an upload (parsed once).
+
+    Args:
+        source: Path or file-like object.
+        columns: Columns to return (default all).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return institution_loader.load(source, columns)
+    frame = read_institutions(source)
+    return frame[[column for column in columns if column in frame.columns]] if columns is not None else frame
@@ -4,6 +4,7 @@ import plotly.express as px
 
 # Import our enhanced modules
 from data_manager import get_val, set_val
+from indicator_registry import get_component
 
 def main():
     # Set page config without conflicting with main app
@@ -17,26 +18,10 @@ def main():
     st.markdown("Masukkan nilai pada tabel di kiri. Perhitungan mencakup Total, Penyesuaian (30%), dan Normalisasi.")
     st.divider()
 
-    # --- KONSTANTA RUMUS ---
-    FAKTOR_PENYESUAIAN = 0.30       # 30%
-    PEMBAGI_NORMALISASI = 2181.33   # Angka pembagi
-
     # --- DATA KELEMBAGAAN ---
-    # Format: (Group, Kode, Nama Item, Bobot, Nilai Default from UPN Veteran Yogyakarta profile)
-    # Grouping: APS (Akreditasi Prodi) & JO (Jurnal)
-    data_kelembagaan = [
-        ("Akreditasi", "APS1", "AKREDITASI PRODI A/UNGGUL/INTERNASIONAL", 40, 0.514),
-        ("Akreditasi", "APS2", "AKREDITASI PRODI B/BAIK SEKALI", 30, 0.343),
-        ("Akreditasi", "APS3", "AKREDITASI PRODI C/BAIK", 20, 0.114),
-        ("Akreditasi", "APS4", "AKREDITASI PRODI D/TIDAK TERAKREDITASI", 0, 0.029),
-        
-        ("Jurnal", "JO1", "JUMLAH JURNAL TERAKREDITASI S1", 40, 0.000),
-        ("Jurnal", "JO2", "JUMLAH JURNAL TERAKREDITASI S2", 30, 2.000),
-        ("Jurnal", "JO3", "JUMLAH JURNAL TERAKREDITASI S3", 20, 2.000),
-        ("Jurnal", "JO4", "JUMLAH JURNAL TERAKREDITASI S4", 10, 10.000),
-        ("Jurnal", "JO5", "JUMLAH JURNAL TERAKREDITASI S5", 5, 2.000),
-        ("Jurnal", "JO6", "JUMLAH JURNAL TERAKREDITASI S6", 2, 0.000),
-    ]
+    # Kode, nama, bobot, nilai default, faktor penyesuaian (30%) dan pembagi
+    # normalisasi dari indicator_registry. Grouping: APS (Akreditasi Prodi) & JO (Jurnal)
+    component = get_component("Kelembagaan")
 
     # --- LAYOUT SETUP ---
     col_left, col_right = st.columns([1.6, 1], gap="large")
@@ -59,7 +44,7 @@ def main():
         h5.markdown("**Total**")
         st.markdown("---")
 
-        for group, kode, nama, bobot, default_val in data_kelembagaan:
+        for group, kode, nama, bobot, default_val in component.rows:
             r1, r2, r3, r4, r5 = st.columns([0.6, 3.5, 0.6, 1.2, 1])
 
             with r1: st.write(f"**{kode}**")
@@ -72,7 +57,7 @@ def main():
                 val = st.number_input(
                     f"v_{kode}",
                     value=float(current_val),
-                    step=0.001,
+                    step=component.step(kode),
                     format="%.3f",
                     label_visibility="collapsed"
                 )
@@ -96,13 +81,10 @@ def main():
         # 1. Total Score Kelembagaan (Sudah dihitung di loop)
 
         # 2. Total Score Penyesuaian (Total * 30%)
-        score_penyesuaian = total_score_raw * FAKTOR_PENYESUAIAN
+        score_penyesuaian = component.adjusted(total_score_raw)
 
-        # 3. Total Score Ternormal ((Penyesuaian / 2181.33) * 100)
-        if score_penyesuaian > 0:
-            score_ternormal = (score_penyesuaian / max(PEMBAGI_NORMALISASI, score_penyesuaian)) * 100
-        else:
-            score_ternormal = 0.0
+        # 3. Total Score Ternormal ((Penyesuaian / pembagi normalisasi) * 100)
+        score_ternormal = component.normalize(score_penyesuaian)
 
         # --- TAMPILAN 3 KARTU SKOR (STACKED) ---
 
@@ -118,7 +100,7 @@ def main():
         st.markdown(f"""
         <div style="background-color: #fff8e1; padding: 15px; border-radius: 8px; border: 1px solid #ffe0b2; margin-bottom: 10px;">
             <h3 style="color: #f57c00; margin:0;">{score_penyesuaian:,.2f}</h3>
-            <p style="margin:0; font-size: 14px; color: #f57c00;">Score Penyesuaian (30%)</p>
+            <p style="margin:0; font-size: 14px; color: #f57c00;">Score Penyesuaian ({component.adjustment:.0%})</p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -127,14 +109,14 @@ def main():
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
             <h2 style="color: #234e52; margin:0;">{score_ternormal:,.2f}</h2>
             <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal</b></p>
-            <p style="margin:0; font-size: 10px; color: #234e52; margin-top:5px;"><i>Rumus: (Score Penyesuaian / {PEMBAGI_NORMALISASI:,.2f}) x 100</i></p>
+            <p style="margin:0; font-size: 10px; color: #234e52; margin-top:5px;"><i>Rumus: (Score Penyesuaian / {component.normalizer:,.2f}) x 100</i></p>
         </div>
         """, unsafe_allow_html=True)
         
         st.markdown(f"""
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
-            <h2 style="color: #234e52; margin:0;">{score_ternormal * 0.15:,.2f}</h2>
-            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal (15%)</b></p>
+            <h2 style="color: #234e52; margin:0;">{score_ternormal * component.weight:,.2f}</h2>
+            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal ({component.weight:.0%})</b></p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -1,10 +1,24 @@
 import streamlit as st
 import importlib
+import os
 import pandas as pd
 
 # Import our enhanced modules
 from data_manager import get_val, reset_sinta_data, validate_sinta_data, get_data_manager
-from cluster_prediction import calculate_cluster_score, predict_cluster_type, get_strategic_advice, calculate_advancement_path
+from cluster_prediction import (calculate_cluster_score, predict_cluster_type, get_strategic_advice, calculate_advancement_path,
+                                get_cluster_floor)
+from score_cache import get_score_cache
+from incremental_scoring import get_incremental_evaluator
+from cohort_normalizers import (apply_normalizers, get_cohort_normalizers, invalidate_normalizers, METHODS,
+                                METHOD_DEFAULT, METHOD_PERCENTILE, DEFAULT_PERCENTILE, NORMALIZER_CHOICE_KEY)
+from indicator_registry import get_registry
+from cohort_index import cohort_position, invalidate_cohort_index, nearest_institutions
+from advancement_optimizer import plan_cheapest_path, DEFAULT_COST
+from sensitivity import indicator_ranking
+from score_history import get_score_history, DEFAULT_LOOKBACK_DAYS
+from cluster_boundaries import invalidate_boundaries
+from scenario_store import get_scenario_store
+from monte_carlo import simulate_cluster, default_ranges, DISTRIBUTIONS, DEFAULT_DRAWS as DEFAULT_MC_DRAWS
 
 # --- KONFIGURASI HALAMAN UTAMA ---
 st.set_page_config(layout="wide", page_title="SINTA Master Simulator")
@@ -65,6 +79,15 @@ def run_module_safely(module_name):
 # ==============================================================================
 
 def main():
+    # Terapkan pembagi normalisasi kohort pilihan sesi ini (sesi lain tidak terpengaruh);
+    # disk hanya dibaca lagi setelah ada scrape baru
+    choice = st.session_state.setdefault(NORMALIZER_CHOICE_KEY,
+                                         {"method": METHOD_DEFAULT, "percentile": DEFAULT_PERCENTILE})
+    try:
+        apply_normalizers(choice["method"], choice["percentile"])
+    except Exception as e:
+        st.sidebar.warning(f"Pembagi normalisasi kohort tidak dapat dimuat: {e}")
+
     # Sidebar dengan peningkatan
     with st.sidebar:
         st.title("🎛️ Navigasi SINTA")
@@ -91,6 +114,10 @@ def main():
             st.metric("Total Score", f"{total_score:,.2f}")
             pred, color, icon = predict_cluster_type(total_score)
             st.success(f"{icon} {pred}")
+            position = cohort_position(total_score)
+            if position:
+                st.caption(f"Peringkat kohort: #{position['rank']} dari {position['size']} "
+                           f"(persentil {position['percentile']:.1f})")
             st.caption("Pindah ke Dashboard untuk hasil lengkap.")
         except:
             st.error("Error menghitung skor")
@@ -139,10 +166,100 @@ def main():
                 st.caption("Target maksimal tercapai")
 
         # Tampilkan status kelulusan
-        if total_score >= 50:  # Threshold for Mandiri cluster
+        mandiri_floor = get_cluster_floor("Mandiri")  # Batas bawah klaster Mandiri (hasil fitting atau bawaan)
+        if mandiri_floor is None:
+            mandiri_floor = 50
+        if total_score >= mandiri_floor:
             st.success(f"✅ **Lolos Cluster Mandiri!**  Skor: {total_score:.2f}")
         else:
-            st.error(f"❌ **Belum Lolos Cluster Mandiri.**  Skor: {total_score:.2f} (butuh {30-total_score:.2f} poin lagi)")
+            st.error(f"❌ **Belum Lolos Cluster Mandiri.**  Skor: {total_score:.2f} (butuh {mandiri_floor-total_score:.2f} poin lagi)")
+
+        # Posisi di antara institusi hasil scraping (binary search pada indeks kohort)
+        position = cohort_position(total_score, component_scores)
+        if position:
+            st.markdown("### 🏅 Posisi di Kohort SINTA")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Peringkat", f"#{position['rank']}", help=f"Dari {position['size']} institusi hasil scraping")
+            col2.metric("Persentil", f"{position['percentile']:.1f}")
+            col3.metric("Jumlah Institusi", f"{position['size']:,}")
+
+            with st.expander("Institusi dengan skor terdekat & persentil per komponen"):
+                neighbours = nearest_institutions(total_score)
+                if neighbours:
+                    st.dataframe(
+                        pd.DataFrame(neighbours).style.format({"Total": "{:.2f}", "Selisih": "{:+.2f}"}),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                st.dataframe(
+                    pd.DataFrame(list(position["components"].items()), columns=["Komponen", "Persentil"])
+                    .style.format({"Persentil": "{:.1f}"}),
+                    use_container_width=True,
+                    hide_index=True
+                )
+        else:
+            st.caption("Jalankan Scraping Data untuk melihat peringkat terhadap institusi lain.")
+
+        # Riwayat skor antar-scrape (hanya perubahan nyata yang tersimpan)
+        history = get_score_history()
+        if os.path.exists(history.path):
+            with st.expander("📈 Riwayat Skor Kohort"):
+                st.markdown(f"**Perubahan terbesar {DEFAULT_LOOKBACK_DAYS} hari terakhir**")
+                movers = history.movers()
+                if len(movers):
+                    st.dataframe(
+                        movers.style.format({"Total Awal": "{:.2f}", "Total Akhir": "{:.2f}", "Perubahan": "{:+.2f}"}),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                else:
+                    st.caption("Belum ada perubahan dalam periode ini.")
+
+                sinta_id = st.text_input("Sinta ID untuk melihat tren", key="history_sinta_id")
+                if sinta_id:
+                    trend = history.trend(sinta_id.strip(), every_scrape=True)
+                    if len(trend):
+                        st.line_chart(trend.set_index("Waktu")["Total"])
+                    else:
+                        st.caption("Sinta ID tidak ditemukan di riwayat.")
+
+        # Simulasi ketidakpastian: peluang tiap klaster bila sebagian indikator belum pasti
+        with st.expander("🎲 Simulasi Ketidakpastian (Monte Carlo)"):
+            st.caption("Pilih indikator yang belum pasti (mis. artikel dalam review, hibah yang diajukan) "
+                       "dan isi rentang pesimis - realistis - optimis.")
+            codes = st.multiselect("Indikator tidak pasti", get_registry().codes, key="mc_codes")
+            if codes:
+                ranges = pd.DataFrame(default_ranges(codes, get_val))
+                ranges = st.data_editor(
+                    ranges,
+                    column_config={"Distribusi": st.column_config.SelectboxColumn(options=list(DISTRIBUTIONS))},
+                    disabled=["Kode"],
+                    hide_index=True,
+                    key=f"mc_ranges_{'_'.join(codes)}"
+                )
+                col1, col2 = st.columns(2)
+                draws = col1.select_slider("Jumlah skenario", options=[1_000, 10_000, 100_000], value=DEFAULT_MC_DRAWS)
+                seed = int(_original_number_input("Seed", min_value=0, value=42, step=1, key="mc_seed"))
+
+                if col2.button("Jalankan Simulasi"):
+                    distributions = {
+                        row["Kode"]: {"dist": row["Distribusi"], "low": row["Pesimis"],
+                                      "mode": row["Realistis"], "high": row["Optimis"]}
+                        for _, row in ranges.iterrows()
+                    }
+                    try:
+                        result = simulate_cluster(get_val, distributions, draws, seed)
+                    except ValueError as e:
+                        st.error(f"Rentang tidak valid: {e}")
+                    else:
+                        df_prob = pd.DataFrame(list(result.probabilities.items()), columns=["Cluster", "Peluang"])
+                        st.dataframe(df_prob.style.format({"Peluang": "{:.1%}"}), use_container_width=True, hide_index=True)
+                        st.bar_chart(df_prob.set_index("Cluster")["Peluang"])
+                        df_q = pd.DataFrame([(f"P{q * 100:g}", v) for q, v in result.quantiles.items()],
+                                            columns=["Kuantil", "Skor Total"])
+                        st.dataframe(df_q.style.format({"Skor Total": "{:.2f}"}), use_container_width=True, hide_index=True)
+                        st.caption(f"{result.draws:,} skenario, rerata {result.mean:.2f} ± {result.std:.2f}; "
+                                   f"paling mungkin: {result.most_likely_cluster()}")
 
         st.divider()
 
@@ -259,6 +376,8 @@ def main():
                 st.markdown(f"### {i+1}. {priority_emoji} {rec['area']} (Skor: {rec['current_score']:.2f})")
                 st.markdown(f"**Prioritas: {rec['priority']}**")
                 st.info(rec['action'])
+                for ind in rec['indicators']:
+                    st.write(f"- **{ind['Kode']}** {ind['Nama']}: +{ind['Kenaikan per Unit']:.4f} poin total per unit")
 
                 # Tambahkan saran spesifik
                 if rec['area'] == 'Publikasi':
@@ -288,22 +407,91 @@ def main():
 
                 st.divider()
 
+        # Peringkat seluruh indikator menurut kenaikan skor total per unit
+        ranking = indicator_ranking(get_val)
+        with st.expander("📐 Analisis Sensitivitas Seluruh Indikator"):
+            st.caption("Kenaikan skor total bila indikator bertambah satu unit (atau satu langkah input). "
+                       "Komponen yang sudah jenuh (skor 100) tidak memberi tambahan.")
+            st.dataframe(
+                ranking.style.format({"Nilai": "{:.3f}", "Kenaikan per Unit": "{:.4f}",
+                                      "Kenaikan per Langkah": "{:.4f}"}),
+                use_container_width=True,
+                hide_index=True
+            )
+
         # Tampilkan rencana peningkatan ke cluster berikutnya
         st.subheader("Rencana Peningkatan ke Cluster Berikutnya")
         advancement = calculate_advancement_path(total_score)
 
         if advancement['next_cluster'] != 'Maximum':
+            # Rekomendasi mengikuti indikator dengan kenaikan skor total per unit terbesar
+            top = ranking[ranking["Kenaikan per Unit"] > 0].head(3)
+            if top.empty:
+                focus = "semua komponen sudah mencapai batas normalisasi"
+            else:
+                focus = "tambah " + ", ".join(f"{row['Kode']} ({row['Komponen']}, +{row['Kenaikan per Unit']:.4f} per unit)"
+                                              for row in top.to_dict("records"))
             st.info(f"""
             📈 **Rencana Peningkatan:**
             - Cluster saat ini: {advancement['current_cluster']}
             - Target cluster: {advancement['next_cluster']}
             - Skor yang dibutuhkan: {advancement['target_score']:.2f}
             - Jarak yang harus ditutup: {advancement['gap']:.2f} poin
-            - Rekomendasi: Fokus pada 3 komponen dengan skor terendah untuk efek maksimal terhadap total skor
+            - Rekomendasi: {focus}
             """)
         else:
             st.success("🎉 Selamat! Anda telah mencapai cluster tertinggi.")
 
+        # Rencana termurah menuju skor target (biaya dan batas per indikator dari pengguna)
+        st.subheader("Rencana Biaya Minimum")
+        st.caption("Isi perkiraan biaya per unit dan batas tambahan tiap indikator. "
+                   "Biaya 0 berarti indikator tidak diubah; batas kosong berarti tanpa batas.")
+
+        registry = get_registry()
+        if "OPTIMIZER_INPUTS" not in st.session_state:
+            st.session_state["OPTIMIZER_INPUTS"] = pd.DataFrame({
+                "Kode": registry.codes,
+                "Komponen": [name for name in registry.names for _ in registry.component(name).codes],
+                "Biaya per Unit": [DEFAULT_COST] * len(registry.codes),
+                "Batas Tambahan": [None] * len(registry.codes)
+            })
+        inputs = st.data_editor(
+            st.session_state["OPTIMIZER_INPUTS"],
+            disabled=["Kode", "Komponen"],
+            hide_index=True,
+            key="optimizer_editor"
+        )
+
+        default_target = advancement['target_score'] if advancement['next_cluster'] != 'Maximum' else total_score
+        # Pakai number_input asli supaya target tidak ikut tersimpan ke SINTA_DB
+        target = _original_number_input("Skor total target", min_value=0.0, max_value=100.0,
+                                        value=float(round(default_target, 2)), step=0.5, key="optimizer_target")
+        round_steps = st.checkbox("Bulatkan tambahan ke langkah input indikator", value=True)
+
+        if st.button("Hitung Rencana Termurah"):
+            st.session_state["OPTIMIZER_INPUTS"] = inputs
+            costs = {row["Kode"]: float(row["Biaya per Unit"] or 0) for _, row in inputs.iterrows()}
+            caps = {row["Kode"]: None if pd.isna(row["Batas Tambahan"]) else float(row["Batas Tambahan"])
+                    for _, row in inputs.iterrows()}
+            steps = ({code: registry.component(name).step(code) for code, name in zip(inputs["Kode"], inputs["Komponen"])}
+                     if round_steps else None)
+            result = plan_cheapest_path(get_val, target, costs, caps, steps)
+
+            if not result.steps and result.reached:
+                st.success("Skor saat ini sudah memenuhi target.")
+            elif not result.steps:
+                st.warning("Tidak ada indikator yang dapat ditingkatkan dengan biaya dan batas yang diberikan.")
+            else:
+                st.dataframe(pd.DataFrame(result.steps).drop(columns=["Key"]), use_container_width=True, hide_index=True)
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Total Biaya", f"{result.total_cost:,.2f}")
+                col2.metric("Skor Setelah Rencana", f"{result.final_total:.2f}",
+                            f"{result.final_total - result.start_total:+.2f}")
+                col3.metric("Target", f"{result.target:.2f}")
+                if not result.reached:
+                    st.warning("Target tidak tercapai dengan batas tambahan yang diberikan; "
+                               "rencana di atas adalah yang paling mendekati.")
+
     # --- MODUL INPUT (Jalankan file asli) ---
     elif menu == "📚 Publikasi":
         run_module_safely("publikasi")
@@ -349,25 +537,125 @@ def main():
                     else:
                         st.warning("⚠️ Ada masalah dengan data, lihat pesan di atas")
 
-        with st.expander("Simpan/Muat Data"):
-            st.info("Fitur untuk menyimpan dan memuat data SINTA")
-            filename = st.text_input("Nama file untuk menyimpan/memuat:", "sinta_data.json")
-            col1, col2 = st.columns(2)
+        with st.expander("Simpan/Muat Skenario"):
+            st.info("Simpan data SINTA sebagai skenario bernama. Setiap penyimpanan menjadi versi baru "
+                    "dan hanya input yang berubah yang ditulis ke database.")
+            store = get_scenario_store()
+            scenarios = store.list_scenarios()
 
+            col1, col2 = st.columns(2)
             with col1:
-                if st.button("💾 Simpan Data"):
-                    if data_manager.save_to_file(filename):
-                        st.success(f"Data berhasil disimpan ke {filename}")
+                scenario_name = st.text_input("Nama skenario:", "Skenario Utama")
+                scenario_note = st.text_input("Catatan versi (opsional):", "")
+                if st.button("💾 Simpan Skenario"):
+                    version = data_manager.save_scenario(scenario_name.strip(), scenario_note) \
+                        if scenario_name.strip() else None
+                    if version is not None:
+                        st.success(f"Skenario '{scenario_name.strip()}' tersimpan (versi {version})")
                     else:
-                        st.error("Gagal menyimpan data")
+                        st.error("Gagal menyimpan skenario")
 
             with col2:
-                if st.button("📂 Muat Data"):
-                    if data_manager.load_from_file(filename):
-                        st.success(f"Data berhasil dimuat dari {filename}")
-                        st.rerun()
-                    else:
-                        st.error("Gagal memuat data")
+                if scenarios.empty:
+                    st.caption("Belum ada skenario tersimpan.")
+                else:
+                    selected = st.selectbox("Skenario tersimpan:", scenarios["Nama"].tolist())
+                    history = store.versions(selected)
+                    version = st.selectbox("Versi:", history["Versi"].tolist())
+                    load_col, delete_col = st.columns(2)
+                    with load_col:
+                        if st.button("📂 Muat Skenario"):
+                            if data_manager.load_scenario(selected, int(version)):
+                                st.success(f"Skenario '{selected}' versi {version} dimuat")
+                                st.rerun()
+                            else:
+                                st.error("Gagal memuat skenario")
+                    with delete_col:
+                        if st.button("🗑️ Hapus Skenario"):
+                            store.delete(selected)
+                            st.rerun()
+
+            if not scenarios.empty:
+                st.dataframe(scenarios, use_container_width=True, hide_index=True)
+                st.dataframe(history, use_container_width=True, hide_index=True)
+
+            legacy_file = st.text_input("Impor file JSON lama:", "sinta_data.json")
+            if st.button("📥 Impor JSON"):
+                version = data_manager.import_file(legacy_file)
+                if version is not None:
+                    st.success(f"{legacy_file} diimpor sebagai skenario (versi {version})")
+                    st.rerun()
+
+        with st.expander("Normalisasi Kohort"):
+            st.info("Pembagi normalisasi tiap komponen dapat diambil dari data scraping terbaru "
+                    "(skor mentah tertinggi atau persentil kohort) alih-alih nilai bawaan.")
+            normalizers = get_cohort_normalizers()
+            choice = st.session_state[NORMALIZER_CHOICE_KEY]
+            method = st.selectbox("Metode pembagi normalisasi", METHODS, index=METHODS.index(choice["method"]),
+                                  format_func=lambda m: m.capitalize())
+            percentile = DEFAULT_PERCENTILE
+            if method == METHOD_PERCENTILE:
+                percentile = st.slider("Persentil", min_value=50.0, max_value=100.0,
+                                       value=choice["percentile"], step=0.5)
+
+            if st.button("Terapkan Pembagi Normalisasi", help="Hanya berlaku untuk sesi ini"):
+                st.session_state[NORMALIZER_CHOICE_KEY] = {"method": method, "percentile": percentile}
+                entry = normalizers.apply(method, percentile)
+                if entry is None and method != METHOD_DEFAULT:
+                    st.warning("Belum ada data scraping; pembagi bawaan tetap digunakan.")
+                else:
+                    st.success("Pembagi normalisasi diperbarui")
+                st.rerun()
+
+            registry = get_registry()
+            current = normalizers.entry(choice["method"], choice["percentile"])
+            if current:
+                st.caption(f"Sumber: {current['source']} (versi {current['version']}, "
+                           f"{current['institutions']} institusi)")
+            st.dataframe(
+                pd.DataFrame([
+                    {"Komponen": name, "Bawaan": registry.base_normalizers[name],
+                     "Aktif": registry.component(name).normalizer}
+                    for name in registry.names
+                ]),
+                hide_index=True,
+                use_container_width=True
+            )
+            # Scrape dari halaman Scraping memperbarui pembagi, indeks dan batas klaster otomatis;
+            # hasil new_scraping.py (proses lain) baru terbaca setelah tombol ini
+            if st.button("🔄 Muat Ulang Data Kohort"):
+                invalidate_normalizers()
+                invalidate_cohort_index()
+                invalidate_boundaries()
+                st.rerun()
+
+        with st.expander("Cache Skor"):
+            st.info("Skor komponen disimpan berdasarkan sidik jari nilai input; komponen yang inputnya tidak berubah tidak dihitung ulang.")
+            cache_stats = get_score_cache().stats()
+            total_hits = sum(s["hits"] for s in cache_stats.values())
+            total_misses = sum(s["misses"] for s in cache_stats.values())
+            total_lookups = total_hits + total_misses
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Hit", f"{total_hits:,}")
+            col2.metric("Miss", f"{total_misses:,}")
+            col3.metric("Hit Rate", f"{(total_hits / total_lookups if total_lookups else 0):.1%}")
+
+            st.dataframe(
+                pd.DataFrame([
+                    {"Komponen": name, "Hit": s["hits"], "Miss": s["misses"],
+                     "Hit Rate": f"{s['hit_rate']:.1%}", "Entri": s["entries"]}
+                    for name, s in cache_stats.items()
+                ]),
+                hide_index=True,
+                use_container_width=True
+            )
+            evaluator_stats = get_incremental_evaluator().stats()
+            st.caption(f"Pembaruan inkremental: {evaluator_stats['updates']:,} · Hitung ulang penuh: {evaluator_stats['rebuilds']:,}")
+            if st.button("🧹 Kosongkan Cache Skor"):
+                get_score_cache().clear()
+                st.success("Cache skor dikosongkan")
+                st.rerun()
 
         with st.expander("Informasi Sistem"):
             st.write("Sistem prediksi cluster SINTA versi terbaru")
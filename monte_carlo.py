@@ -0,0 +1,178 @@
+"""
+Monte Carlo Module for SINTA Cluster Predictor
+
+This module turns the single deterministic cluster prediction into a
+distribution. Uncertain indicators (publications in the pipeline, pending
+grants) are given a pessimistic / most likely / optimistic range; the
+simulator draws every scenario at once as a matrix, scores it with the
+registry's matrix scoring and reports the probability of landing in each
+cluster together with quantiles of the total score. Draws come from a
+seeded generator, so a seed reproduces a run exactly.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from cluster_prediction import ClusterPredictor, get_cluster_predictor
+from indicator_registry import IndicatorRegistry, get_registry
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+# Skenario diproses per blok supaya memori tetap kecil untuk jumlah draw besar
+CHUNK_SIZE = 25_000
+
+# Jenis distribusi; semuanya dibaca dari rentang low (pesimis), mode (paling mungkin), high (optimis)
+DIST_TRIANGULAR = "segitiga"  # segitiga low-mode-high
+DIST_UNIFORM = "seragam"      # seragam antara low dan high
+DIST_NORMAL = "normal"        # rerata mode, simpangan baku (high - low) / 4
+DIST_POISSON = "poisson"      # cacahan dengan rerata mode (mis. artikel yang sedang direview)
+DISTRIBUTIONS = (DIST_TRIANGULAR, DIST_UNIFORM, DIST_NORMAL, DIST_POISSON)
+
+
+class SimulationResult:
+    """
+    Outcome of a Monte Carlo run.
+
+    Attributes:
+        draws: Number of simulated scenarios.
+        seed: Seed used (None for an unseeded run).
+        totals: Simulated total score of every scenario.
+        probabilities: Cluster to share of scenarios (0-1), lowest cluster first.
+        quantiles: Quantile (0-1) to total score.
+        mean: Mean total score.
+        std: Standard deviation of the total score.
+    """
+
+    def __init__(self, totals: np.ndarray, probabilities: Dict[str, float],
+                 quantiles: Dict[float, float], seed: Optional[int] = None):
+        self.totals = totals
+        self.draws = len(totals)
+        self.seed = seed
+        self.probabilities = probabilities
+        self.quantiles = quantiles
+        self.mean = float(totals.mean()) if len(totals) else 0.0
+        self.std = float(totals.std()) if len(totals) else 0.0
+
+    def most_likely_cluster(self) -> Optional[str]:
+        """Cluster with the highest probability."""
+        return max(self.probabilities, key=self.probabilities.get) if self.probabilities else None
+
+
+class MonteCarloSimulator:
+    """Vectorized scenario sampler on top of the registry's matrix scoring."""
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None,
+                 predictor: Optional[ClusterPredictor] = None):
+        """
+        Args:
+            registry: Indicator registry (default the global registry).
+            predictor: Cluster predictor providing the cluster bands
+                (default the global predictor).
+        """
+        self.registry = registry or get_registry()
+        self.predictor = predictor or get_cluster_predictor()
+        self._columns = {code: i for i, code in enumerate(self.registry.codes)}
+
+    def _sample(self, rng: np.random.Generator, spec: Dict[str, Any], size: int) -> np.ndarray:
+        """Draw one indicator's values (clipped at 0)."""
+        dist = spec.get("dist", DIST_TRIANGULAR)
+        low, mode, high = float(spec["low"]), float(spec["mode"]), float(spec["high"])
+        if dist == DIST_TRIANGULAR:
+            values = rng.triangular(low, mode, high, size) if high > low else np.full(size, mode)
+        elif dist == DIST_UNIFORM:
+            values = rng.uniform(low, high, size)
+        elif dist == DIST_NORMAL:
+            values = rng.normal(mode, (high - low) / 4, size)
+        elif dist == DIST_POISSON:
+            values = rng.poisson(mode, size).astype(float)
+        else:
+            raise ValueError(f"Unknown distribution: {dist}")
+        return np.maximum(values, 0.0)
+
+    def simulate(self, values: np.ndarray, distributions: Dict[str, Dict[str, Any]],
+                 draws: int = DEFAULT_DRAWS, seed: Optional[int] = None,
+                 quantiles: Sequence[float] = DEFAULT_QUANTILES) -> SimulationResult:
+        """
+        Simulate the total score under uncertain indicators.
+
+        Args:
+            values: Current indicator values, in registry code order; used for
+                every indicator without a distribution.
+            distributions: Indicator code to {'dist', 'low', 'mode', 'high'}
+                (see DISTRIBUTIONS). Unknown codes are ignored.
+            draws: Number of scenarios.
+            seed: Random seed for a reproducible run.
+            quantiles: Quantiles (0-1) of the total score to report.
+
+        Returns:
+            The simulation result.
+        """
+        rng = np.random.default_rng(seed)
+        base = np.asarray(values, dtype=float)
+        uncertain = [(self._columns[code], spec) for code, spec in distributions.items() if code in self._columns]
+
+        totals = np.empty(max(int(draws), 0))
+        for start in range(0, len(totals), CHUNK_SIZE):
+            size = min(CHUNK_SIZE, len(totals) - start)
+            matrix = np.tile(base, (size, 1))
+            for column, spec in uncertain:
+                matrix[:, column] = self._sample(rng, spec, size)
+            totals[start:start + size] = self.registry.score_matrix(matrix)["total"]
+
+        # Klaster tiap skenario: binary search pada batas bawah pita klaster
+        bands = self.predictor.cluster_bands()
+        lowers = np.array([low for _, low, _ in bands])
+        band_of = np.clip(np.searchsorted(lowers, totals, side="right") - 1, 0, len(bands) - 1)
+        counts = np.bincount(band_of, minlength=len(bands))
+        probabilities = {name: float(count) / max(len(totals), 1) for (name, _, _), count in zip(bands, counts)}
+
+        quantile_values = np.quantile(totals, quantiles) if len(totals) else np.zeros(len(quantiles))
+        return SimulationResult(totals, probabilities, dict(zip(quantiles, quantile_values.tolist())), seed)
+
+
+# Global instance of the Monte Carlo simulator
+monte_carlo_simulator = MonteCarloSimulator()
+
+
+def get_monte_carlo_simulator() -> MonteCarloSimulator:
+    """Get the global Monte Carlo simulator instance."""
+    return monte_carlo_simulator
+
+
+def simulate_cluster(get: Callable[[str, float], float], distributions: Dict[str, Dict[str, Any]],
+                     draws: int = DEFAULT_DRAWS, seed: Optional[int] = None) -> SimulationResult:
+    """
+    Convenience function: simulate from the current simulation values.
+
+    Args:
+        get: Lookup function such as data_manager.get_val(key, default).
+        distributions: Indicator code to distribution spec.
+        draws: Number of scenarios.
+        seed: Random seed for a reproducible run.
+    """
+    values = monte_carlo_simulator.registry.read_values(get)
+    return monte_carlo_simulator.simulate(values, distributions, draws, seed)
+
+
+def default_ranges(codes: List[str], get: Callable[[str, float], float],
+                   spread: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Starting ranges for the uncertainty table: the current value +/- a spread.
+
+    Args:
+        codes: Indicator codes.
+        get: Lookup function such as data_manager.get_val(key, default).
+        spread: Relative half-width of the range.
+
+    Returns:
+        One {'Kode', 'Distribusi', 'Pesimis', 'Realistis', 'Optimis'} row per code.
+    """
+    registry = monte_carlo_simulator.registry
+    values = registry.read_values(get)
+    rows = []
+    for code in codes:
+        current = float(values[registry.codes.index(code)])
+        rows.append({"Kode": code, "Distribusi": DIST_TRIANGULAR,
+                     "Pesimis": current * (1 - spread), "Realistis": current, "Optimis": current * (1 + spread)})
+    return rows
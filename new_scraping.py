@@ -1,117 +1,141 @@
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import time
-import json
 import os
+from datetime import timedelta
+
+from sinta_parser import parse_metrics_page
+from scraper_engine import CachedMetrics, SintaClient, scrape_concurrently
+from scrape_retry import RetryPolicy, RetryQueue
+from http_cache import ResponseCache
+from scrape_journal import CheckpointJournal
+from scrape_output import JsonlRecordWriter, make_record, row_labels
+from cohort_store import store_scrape_output
+from institution_csv import load_institutions
+from cohort_matrix import write_cohort_matrix
+from score_history import record_scrape
+from refresh_planner import plan_refresh
 
 # Konfigurasi
 CSV_INPUT = "hasil_sinta_metric.csv"
-OUTPUT_JSON = "sinta_metrics_cluster_full.json"
-DELAY = 1  # detik antar request
-
-# Fungsi untuk parsing satu halaman
-def parse_metrics_page(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table', class_='table')
-    if not table:
-        return None
-
-    sections = {}
-    current_section = None
-    rows = table.find_all('tr')
-
-    for row in rows:
-        # Deteksi header section
-        header = row.find('th', colspan=True, style=lambda x: x and 'border-left: 3px solid' in x)
-        if header and 'Total' not in header.get_text():
-            section_text = header.get_text(strip=True)
-            if 'Score in' in section_text:
-                current_section = section_text
-                sections[current_section] = []
-            continue
-
-        # Deteksi total akhir (TOTAL ALL SCORE)
-        total_all = row.find('th', style=lambda x: x and '#FF6B1A' in x)
-        if total_all and 'TOTAL ALL SCORE' in total_all.get_text():
-            total_score = row.find_all('th')[-1].get_text(strip=True)
-            sections['TOTAL ALL SCORE'] = total_score
-            continue
-
-        # Deteksi subtotal section (Total Score Publication Ternormal, dll)
-        italic_total = row.find('th', style=lambda x: x and 'font-style: italic' in x)
-        if italic_total:
-            text = italic_total.get_text(strip=True)
-            if 'Total Score' in text:
-                value = row.find_all('th')[-1].get_text(strip=True)
-                sections.setdefault(current_section + ' (subtotal)', []).append({
-                    'label': text,
-                    'value': value
-                })
-            continue
-
-        # Ambil data baris biasa (AI1, AN2, dll)
-        cols = row.find_all(['th', 'td'])
-        if len(cols) >= 5 and cols[0].get('style') and 'border-left: 3px solid' in cols[0]['style']:
-            code = cols[1].get_text(strip=True)
-            name = cols[2].get_text(strip=True)
-            weight = cols[3].get_text(strip=True)
-            value = cols[4].get_text(strip=True).replace(',', '.')
-            total = cols[5].get_text(strip=True).replace(',', '.')
-
-            if current_section:
-                sections[current_section].append({
-                    'code': code,
-                    'name': name,
-                    'weight': weight,
-                    'value': value,
-                    'total': total
-                })
-
-    return sections
-
-# Baca CSV
-df = pd.read_csv(CSV_INPUT)
-
-# List hasil
-results = []
-
-# Proses tiap universitas
-for idx, row in df.iterrows():
-    sinta_id = row['Sinta ID Link']
-    nama = row['Nama Institusi']
-    klaster = row['Klaster']
-
-    print(f"[{idx+1}/{len(df)}] Scraping {nama} (ID: {sinta_id})...")
-    
-    url = f"https://sinta.kemdiktisaintek.go.id/affiliations/profile/{sinta_id}/?view=matricscluster2026"
-    try:
-        response = requests.get(url, timeout=15)
-        if response.status_code != 200:
-            print(f"  ❌ Gagal akses {url}")
-            continue
-
-        metrics = parse_metrics_page(response.text)
-        if metrics is None:
-            print(f"  ⚠️ Tidak ada data metrics")
-            continue
-
-        results.append({
-            'Kode PT': row['Kode PT'],
-            'Nama Institusi': nama,
-            'Klaster': klaster,
-            'Sinta ID': sinta_id,
-            'Metrics': metrics
-        })
-
-        time.sleep(DELAY)
-
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
-        continue
-
-# Simpan ke JSON
-with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-    json.dump(results, f, indent=2, ensure_ascii=False)
-
-print(f"\n✅ Selesai! Hasil disimpan di {OUTPUT_JSON}")
\ No newline at end of file
+OUTPUT_JSONL = "sinta_metrics_cluster_full.jsonl"  # satu institusi per baris
+DELAY = 1  # detik antar request (batas laju global)
+BURST = 1  # request yang boleh dimulai berturut-turut
+MAX_WORKERS = 4  # jumlah request paralel
+PARSE_WORKERS = 2  # jumlah proses parsing HTML (0 = parse di thread request)
+JOURNAL_PATH = "sinta_scrape_journal.jsonl"  # checkpoint untuk melanjutkan scraping yang terputus
+RESUME = True  # False = abaikan checkpoint dan mulai dari awal
+CACHE_DIR = ".sinta_cache"  # cache halaman profil (None = tanpa cache)
+CACHE_TTL = 12 * 60 * 60  # detik; dalam rentang ini halaman dari cache dipakai tanpa request
+MAX_RETRIES = 3  # percobaan ulang untuk HTTP 429/5xx dan timeout
+RETRY_QUEUE_PATH = "sinta_retry_queue.jsonl"  # institusi yang tetap gagal
+DRAIN_RETRY_QUEUE = False  # True = hanya ambil ulang institusi di antrean gagal
+RETRY_OUTPUT_JSONL = "sinta_metrics_cluster_retry.jsonl"  # hasil saat DRAIN_RETRY_QUEUE = True
+INCREMENTAL = True  # hanya ambil institusi baru/berubah/kedaluwarsa dibanding OUTPUT_JSONL
+MAX_AGE = timedelta(days=7)  # umur maksimum data sebelum diambil ulang
+PRIORITY_IDS = []  # Sinta ID yang diambil lebih dulu (mis. institusi pesaing)
+
+def main():
+    retry_queue = RetryQueue(RETRY_QUEUE_PATH)
+    journal = CheckpointJournal(JOURNAL_PATH)
+
+    plan = None
+
+    if DRAIN_RETRY_QUEUE:
+        # Hanya institusi yang gagal pada run sebelumnya; baru keluar dari antrean setelah berhasil
+        all_rows = retry_queue.rows()
+        output_path = RETRY_OUTPUT_JSONL
+        journal.load()
+    else:
+        # Baca CSV
+        df = load_institutions(CSV_INPUT)
+        all_rows = df.to_dict('records')
+        output_path = OUTPUT_JSONL
+        if RESUME:
+            journal.load()
+        else:
+            journal.clear()
+        if INCREMENTAL and os.path.exists(OUTPUT_JSONL):
+            plan = plan_refresh(all_rows, OUTPUT_JSONL, MAX_AGE, PRIORITY_IDS,
+                                cache=ResponseCache(CACHE_DIR, CACHE_TTL) if CACHE_DIR else None)
+            print("Refresh inkremental: " + ", ".join(f"{n} {reason}" for reason, n in plan.counts().items()))
+            all_rows = plan.to_scrape
+    total_count = len(all_rows)
+
+    rows = [row for row in all_rows if not journal.is_finished(row['Sinta ID Link'])]
+    processed_count = total_count - len(rows)
+    if processed_count:
+        print(f"Melanjutkan dari checkpoint: {processed_count} institusi sudah diambil.")
+    client = SintaClient(MAX_WORKERS, cache=ResponseCache(CACHE_DIR, CACHE_TTL) if CACHE_DIR else None,
+                         retry_policy=RetryPolicy(MAX_RETRIES))
+    cached_ids = set()
+
+    def lookup_row(row):
+        cached = client.cached_metrics(row['Sinta ID Link'])
+        if cached is not None:
+            cached_ids.add(row['Sinta ID Link'])
+        return cached
+
+    # Unduh satu halaman (dijalankan di worker thread, parsing di proses terpisah)
+    def fetch_row(row):
+        page = client.fetch_profile(row['Sinta ID Link'])
+        if isinstance(page, CachedMetrics):
+            cached_ids.add(row['Sinta ID Link'])
+        return page
+
+    def on_complete(row, metrics, error):
+        nonlocal processed_count
+        processed_count += 1
+        print(f"[{processed_count}/{total_count}] Scraping {row['Nama Institusi']} (ID: {row['Sinta ID Link']})...")
+        if error is not None or metrics is None:
+            print(f"  ❌ Error: {error}" if error is not None else "  ⚠️ Tidak ada data metrics")
+            retry_queue.add(row['Sinta ID Link'], row, error or "Tidak ada data metrics")
+            # Data lama tetap dipakai jika refresh gagal
+            if plan is not None and row in plan.previous:
+                record = plan.previous.record(row)
+                record.update(row_labels(row))
+                writer.write(record)
+        else:
+            result = make_record(row, metrics)
+            if row['Sinta ID Link'] not in cached_ids:
+                client.store_metrics(row['Sinta ID Link'], metrics)
+            journal.append(result)
+            writer.write(result)
+            retry_queue.resolve(row['Sinta ID Link'], row)
+
+    # Proses semua universitas secara paralel; hasil langsung ditulis per baris
+    # Hasil lama dibaca selama refresh inkremental, jadi file baru ditulis terpisah lalu menggantikannya
+    with JsonlRecordWriter(output_path, atomic=plan is not None) as writer:
+        if plan is not None:
+            for record in plan.carried_records():
+                writer.write(record)
+
+        # Institusi yang sudah tercatat di checkpoint ditulis lebih dulu
+        for row in all_rows:
+            if journal.is_finished(row['Sinta ID Link']):
+                writer.write(journal.restore(row['Sinta ID Link'], row_labels(row)))
+
+        scrape_concurrently(rows, fetch_row, max_workers=MAX_WORKERS, rate=1.0 / DELAY,
+                            burst=BURST, on_complete=on_complete,
+                            parse=parse_metrics_page, lookup=lookup_row,
+                            retry_policy=client.retry_policy, breaker=client.breaker,
+                            parse_workers=PARSE_WORKERS)
+    client.close()
+    retry_queue.compact()
+    # Refresh penuh selesai tanpa terputus: checkpoint tidak dipakai lagi pada run berikutnya
+    if not DRAIN_RETRY_QUEUE:
+        journal.clear()
+
+    print(f"\n✅ Selesai! {writer.count} institusi disimpan di {output_path}")
+    if writer.count:
+        try:
+            print(f"Snapshot Parquet: {store_scrape_output(output_path)}")
+            print(f"Matriks kohort: {write_cohort_matrix(output_path)}")
+        except Exception as e:
+            print(f"⚠️ Snapshot kohort tidak dapat ditulis: {e}")
+        try:
+            print(f"Riwayat skor: {record_scrape(output_path)} institusi berubah sejak scrape sebelumnya.")
+        except Exception as e:
+            print(f"⚠️ Riwayat skor tidak dapat diperbarui: {e}")
+    if len(retry_queue):
+        print(f"⚠️ {len(retry_queue)} institusi gagal; set DRAIN_RETRY_QUEUE = True untuk mengambil ulang.")
+
+if __name__ == "__main__":
+    main()
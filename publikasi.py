@@ -4,6 +4,7 @@ import plotly.express as px
 
 # Import our enhanced modules
 from data_manager import get_val, set_val
+from indicator_registry import get_component
 
 def main():
     # Set page config without conflicting with main app
@@ -18,36 +19,9 @@ def main():
     st.divider()
 
     # --- KONSTANTA & DATA ---
-    NORMALIZER_PUB = 1776.69  # Pembagi Normalisasi (1.776,69)
-
-    # Format Tuple: (Kategori Group, Kode, Nama Item, Bobot, Nilai Default dari Gambar)
-    raw_data = [
-        # --- INTERNASIONAL (AI) ---
-        ("Intl", "AI1", "ARTIKEL JURNAL INTERNASIONAL Q1", 40, 0.136),
-        ("Intl", "AI2", "ARTIKEL JURNAL INTERNASIONAL Q2", 35, 0.159),
-        ("Intl", "AI3", "ARTIKEL JURNAL INTERNASIONAL Q3", 30, 0.147),
-        ("Intl", "AI4", "ARTIKEL JURNAL INTERNASIONAL Q4", 25, 0.075),
-        ("Intl", "AI5", "ARTIKEL JURNAL INTERNASIONAL NON Q", 20, 0.040),
-        ("Intl", "AI6", "ARTIKEL NON JURNAL INTERNASIONAL", 15, 0.504),
-        ("Intl", "AI7", "JUMLAH SITASI PUBLIKASI INTERNASIONAL", 1, 932.079),
-        ("Intl", "AI8", "JUMLAH DOKUMEN PUBLIKASI INTERNASIONAL TERSITASI", 1, 0.588),
-        
-        # --- NASIONAL (AN) ---
-        ("Nas", "AN1", "ARTIKEL JURNAL NASIONAL PERINGKAT 1", 25, 0.007),
-        ("Nas", "AN2", "ARTIKEL JURNAL NASIONAL PERINGKAT 2", 20, 0.169),
-        ("Nas", "AN3", "ARTIKEL JURNAL NASIONAL PERINGKAT 3", 15, 0.204),
-        ("Nas", "AN4", "ARTIKEL JURNAL NASIONAL PERINGKAT 4", 10, 0.464),
-        ("Nas", "AN5", "ARTIKEL JURNAL NASIONAL PERINGKAT 5", 5, 0.312),
-        ("Nas", "AN6", "ARTIKEL JURNAL NASIONAL PERINGKAT 6", 2, 0.012),
-        ("Nas", "AN8", "PROSIDING NASIONAL", 2, 0.104),
-        ("Nas", "AN9", "JUMLAH SITASI PUBLIKASI NASIONAL PER DOSEN", 1, 0.000),
-        
-        # --- BUKU & LAINNYA (B & DGS) ---
-        ("Other", "DGS2", "GS CITATION PER LECTURER", 1, 0.473),
-        ("Other", "B1", "BUKU AJAR", 20, 0.070),
-        ("Other", "B2", "BUKU REFERENSI", 40, 0.415),
-        ("Other", "B3", "BUKU MONOGRAF", 20, 0.069),
-    ]
+    # Format baris: (Kategori Group, Kode, Nama Item, Bobot, Nilai Default) dari indicator_registry,
+    # beserta pembagi normalisasi (bawaan 1.776,69 atau hasil kohort)
+    component = get_component("Publikasi")
 
     # --- LAYOUT SETUP ---
     col_left, col_right = st.columns([1.6, 1], gap="large")
@@ -72,7 +46,7 @@ def main():
         st.markdown("---")
 
         # Looping Data
-        for category, kode, nama, bobot, default_val in raw_data:
+        for category, kode, nama, bobot, default_val in component.rows:
             r1, r2, r3, r4, r5 = st.columns([0.6, 3.5, 0.6, 1.2, 1])
 
             with r1:
@@ -88,7 +62,7 @@ def main():
                     f"v_{kode}",
                     min_value=0.0,
                     value=float(current_val),
-                    step=0.001,
+                    step=component.step(kode),
                     format="%.3f",
                     label_visibility="collapsed",
                     key=kode
@@ -112,7 +86,7 @@ def main():
         st.markdown("### 📊 Analisis Skor Publikasi")
 
         # --- HITUNG SKOR TERNORMALISASI ---
-        normalized_score = (total_score_all / max(total_score_all, NORMALIZER_PUB)) * 100
+        normalized_score = component.normalize(component.adjusted(total_score_all))
 
         # 1. SCORE CARDS (TAMPILAN BARU: 2 KOLOM)
         # Card 1: Total Raw
@@ -134,8 +108,8 @@ def main():
         # Card 3: Ternormalisasi (Hasil Akhir)
         st.markdown(f"""
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
-            <h2 style="color: #234e52; margin:0;">{normalized_score * 0.25:,.2f}</h2>
-            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal (25%)</b></p>
+            <h2 style="color: #234e52; margin:0;">{normalized_score * component.weight:,.2f}</h2>
+            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal ({component.weight:.0%})</b></p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -0,0 +1,235 @@
+"""
+Refresh Planner Module for SINTA Cluster Predictor
+
+This module plans incremental refreshes. It compares the institution list
+(hasil_sinta_metric.csv) with the last scrape output and schedules only the
+institutions that are new, whose page changed since their record was
+written (the page cache holds metrics with a different Content Hash), or
+whose record is older than the allowed age. Everything else is carried over
+from the previous output, so a nightly refresh only touches the delta.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from http_cache import ResponseCache
+from scrape_output import iter_records, metrics_hash, row_labels
+from scraper_engine import profile_url
+
+DEFAULT_MAX_AGE = timedelta(days=7)
+
+# Alasan penjadwalan, diurutkan dari yang paling mendesak
+REASON_NEW = "baru"
+REASON_CHANGED = "halaman berubah"
+REASON_STALE = "kedaluwarsa"
+REASON_ORDER = {REASON_NEW: 0, REASON_CHANGED: 1, REASON_STALE: 2}
+
+
+def row_key(row: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Identity of a CSV row: Sinta ID plus Kode PT.
+
+    hasil_sinta_metric.csv lists several institutions under the same Sinta
+    ID, so the Sinta ID alone would mix up their records.
+    """
+    return str(row['Sinta ID Link']), str(row.get('Kode PT'))
+
+
+def _record_key(record: Dict[str, Any]) -> Tuple[str, str]:
+    """Identity of an output record, matching row_key of the row it was built from."""
+    return str(record['Sinta ID']), str(record.get('Kode PT'))
+
+
+class PreviousScrape:
+    """
+    Index of a previous scrape output, keyed by Sinta ID and Kode PT.
+
+    Only the small fields needed for planning (Sinta ID, Scraped At and
+    Content Hash) and the byte offset of each record are kept in memory;
+    full records are read back one at a time when they are carried over.
+    Legacy .json outputs have no offsets and are indexed in memory instead.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """
+        Args:
+            path: Previous .jsonl (or legacy .json) output, or None for a first run.
+        """
+        self.path = path
+        self._summary: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._offsets: Dict[Tuple[str, str], int] = {}
+        self._records: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        if path:
+            self._load()
+
+    def _remember(self, record: Dict[str, Any]) -> Tuple[str, str]:
+        key = _record_key(record)
+        self._summary[key] = {
+            'Sinta ID': record['Sinta ID'],
+            'Scraped At': record.get('Scraped At'),
+            'Content Hash': record.get('Content Hash')
+        }
+        return key
+
+    def _load(self):
+        if self.path.endswith(".json"):
+            for record in iter_records(self.path):
+                self._records[self._remember(record)] = record
+            return
+
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                try:
+                    key = self._remember(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._offsets[key] = line_offset
+
+    def __contains__(self, row: Dict[str, Any]) -> bool:
+        return row_key(row) in self._summary
+
+    def summary(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get the planning fields of a CSV row's previous record."""
+        return self._summary.get(row_key(row))
+
+    def content_hash(self, row: Dict[str, Any]) -> Optional[str]:
+        """Get the previous Content Hash of a CSV row, if recorded."""
+        summary = self.summary(row)
+        return summary.get('Content Hash') if summary else None
+
+    def record(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Read the full previous record of a CSV row."""
+        key = row_key(row)
+        if key in self._records:
+            return dict(self._records[key])
+        with open(self.path, 'rb') as f:
+            f.seek(self._offsets[key])
+            return json.loads(f.readline())
+
+
+class RefreshPlan:
+    """
+    Result of planning an incremental refresh.
+
+    Attributes:
+        to_scrape: CSV rows to fetch again, most important first.
+        reasons: Scheduling reason per CSV row (row_key; see REASON_*).
+        carried: CSV rows whose previous record is still valid.
+        previous: Index of the previous output the plan was made against.
+    """
+
+    def __init__(self, to_scrape: List[Dict[str, Any]], reasons: Dict[Tuple[str, str], str],
+                 carried: List[Dict[str, Any]], previous: PreviousScrape):
+        self.to_scrape = to_scrape
+        self.reasons = reasons
+        self.carried = carried
+        self.previous = previous
+
+    def counts(self) -> Dict[str, int]:
+        """Number of scheduled rows per reason, plus the carried-over rows."""
+        counts = {reason: 0 for reason in REASON_ORDER}
+        for row in self.to_scrape:
+            counts[self.reasons[row_key(row)]] += 1
+        counts["tidak berubah"] = len(self.carried)
+        return counts
+
+    def carried_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the carried-over records, relabelled with their current CSV row.
+
+        Yields:
+            One record per carried row.
+        """
+        for row in self.carried:
+            record = self.previous.record(row)
+            record.update(row_labels(row))
+            yield record
+
+
+def _scraped_at(summary: Dict[str, Any]) -> Optional[datetime]:
+    """Scraped At of a previous record, or None for legacy outputs without a usable one."""
+    try:
+        return datetime.fromisoformat(summary['Scraped At'])
+    except (TypeError, ValueError):
+        return None
+
+
+def _page_changed(summary: Dict[str, Any], cache: Optional[ResponseCache]) -> bool:
+    """
+    Check whether the page changed since the previous record was written.
+
+    Records without a Content Hash cannot be compared and always count as
+    changed. Otherwise the page cache is consulted: metrics cached after the
+    record was scraped (e.g. by a retry run) with a different hash mean the
+    institution changed. Without a newer cache entry only the age decides.
+    """
+    if not summary.get('Content Hash'):
+        return True
+    if cache is None:
+        return False
+    entry = cache.get(profile_url(summary['Sinta ID']))
+    if not entry or entry.get('metrics') is None:
+        return False
+    scraped_at = _scraped_at(summary)
+    if scraped_at is not None and datetime.fromtimestamp(entry.get('fetched_at', 0)) <= scraped_at:
+        return False
+    return metrics_hash(entry['metrics']) != summary['Content Hash']
+
+
+def plan_refresh(rows: Iterable[Dict[str, Any]], previous_path: Optional[str],
+                 max_age: timedelta = DEFAULT_MAX_AGE,
+                 priority_ids: Optional[Iterable[Any]] = None,
+                 now: Optional[datetime] = None,
+                 cache: Optional[ResponseCache] = None) -> RefreshPlan:
+    """
+    Decide which institutions need to be scraped again.
+
+    Rows are matched with their previous record by Sinta ID and Kode PT. An
+    institution is scheduled when it is missing from the previous output
+    (new), when its page changed since the record was written (the record
+    has no Content Hash, or cache holds newer metrics with a different
+    one), or when its record is older than max_age (stale). Scheduled rows
+    are ordered by priority set first, then by reason (new, changed, stale),
+    then oldest record first.
+
+    Args:
+        rows: CSV rows (must contain 'Sinta ID Link' and 'Kode PT').
+        previous_path: Last scrape output, or None to schedule everything.
+        max_age: Maximum age of a record before it is refreshed.
+        priority_ids: Sinta IDs to fetch before all others (e.g. competitors).
+        now: Reference time (default now).
+        cache: Page cache consulted for pages fetched after the previous
+            record (default: age only).
+
+    Returns:
+        RefreshPlan with the rows to scrape and the rows to carry over.
+    """
+    previous = PreviousScrape(previous_path)
+    cutoff = (now or datetime.now()) - max_age
+    priority = {str(sinta_id) for sinta_id in (priority_ids or [])}
+
+    scheduled, carried, reasons = [], [], {}
+    for row in rows:
+        summary = previous.summary(row)
+        if summary is None:
+            reason = REASON_NEW
+        elif _page_changed(summary, cache):
+            reason = REASON_CHANGED
+        elif (_scraped_at(summary) or datetime.min) < cutoff:
+            reason = REASON_STALE
+        else:
+            carried.append(row)
+            continue
+        reasons[row_key(row)] = reason
+        scheduled.append(row)
+
+    def sort_key(row):
+        summary = previous.summary(row) or {}
+        return (str(row['Sinta ID Link']) not in priority, REASON_ORDER[reasons[row_key(row)]],
+                summary.get('Scraped At') or "")
+
+    scheduled.sort(key=sort_key)
+    return RefreshPlan(scheduled, reasons, carried, previous)
@@ -4,6 +4,7 @@ import plotly.express as px
 
 # Import our enhanced modules
 from data_manager import get_val, set_val
+from indicator_registry import get_component
 
 def main():
     # Set page config without conflicting with main app
@@ -17,20 +18,9 @@ def main():
     st.markdown("Masukkan data penelitian pada tabel di kiri. Nilai P7 (Rupiah) dalam satuan Juta.")
     st.divider()
 
-    # --- KONSTANTA RUMUS ---
-    PEMBAGI_NORMALISASI = 261491.37   # Angka pembagi sesuai request
-
     # --- DATA RESEARCH ---
-    # Format: (Kode, Nama Item, Bobot, Nilai Default from UPN Veteran Yogyakarta profile)
-    data_research = [
-        ("P1", "JUMLAH PENELITIAN HIBAH LUAR NEGERI (KETUA)", 40, 0.0),
-        ("P2", "JUMLAH PENELITIAN HIBAH LUAR NEGERI (ANGGOTA)", 10, 0.0),
-        ("P3", "JUMLAH PENELITIAN HIBAH EKSTERNAL (KETUA)", 30, 51.0),
-        ("P4", "JUMLAH PENELITIAN HIBAH EKSTERNAL (ANGGOTA)", 10, 25.0),
-        ("P5", "JUMLAH PENELITIAN INTERNAL INSTITUSI (KETUA)", 15, 523.0),
-        ("P6", "JUMLAH PENELITIAN INTERNAL INSTITUSI (ANGGOTA)", 5, 32.0),
-        ("P7", "JUMLAH RUPIAH PENELITIAN (JUTA RUPIAH)", 0.05, 37077.71),
-    ]
+    # Kode, nama, bobot, nilai default dan pembagi normalisasi dari indicator_registry
+    component = get_component("Research")
 
     # --- LAYOUT SETUP ---
     col_left, col_right = st.columns([1.6, 1], gap="large")
@@ -53,7 +43,7 @@ def main():
         h5.markdown("**Total**")
         st.markdown("---")
 
-        for kode, nama, bobot, default_val in data_research:
+        for _, kode, nama, bobot, default_val in component.rows:
             r1, r2, r3, r4, r5 = st.columns([0.6, 3.5, 0.6, 1.2, 1])
 
             with r1: st.write(f"**{kode}**")
@@ -66,7 +56,7 @@ def main():
                 val = st.number_input(
                     f"v_{kode}",
                     value=float(current_val),
-                    step=1.0,
+                    step=component.step(kode),
                     format="%.2f",
                     label_visibility="collapsed"
                 )
@@ -87,11 +77,8 @@ def main():
         st.markdown("### 📊 Analisis Skor")
 
         # --- RUMUS PERHITUNGAN ---
-        # (Total Score / 261.491,37) * 100
-        if total_score_raw > 0:
-            score_ternormal = (total_score_raw / max(PEMBAGI_NORMALISASI, total_score_raw)) * 100
-        else:
-            score_ternormal = 0.0
+        # (Total Score / max(pembagi normalisasi, Total Score)) * 100
+        score_ternormal = component.normalize(component.adjusted(total_score_raw))
 
         # --- TAMPILAN 2 KARTU SKOR (STACKED) ---
 
@@ -114,8 +101,8 @@ def main():
         # Card 3: Ternormalisasi (Hasil Akhir)
         st.markdown(f"""
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
-            <h2 style="color: #234e52; margin:0;">{score_ternormal * 0.15:,.2f}</h2>
-            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal (15%)</b></p>
+            <h2 style="color: #234e52; margin:0;">{score_ternormal * component.weight:,.2f}</h2>
+            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal ({component.weight:.0%})</b></p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -0,0 +1,281 @@
+"""
+Scenario Store Module for SINTA Cluster Predictor
+
+This module keeps named simulation scenarios in a local SQLite database
+instead of loose JSON files. A scenario's current values are stored one row
+per key, and every save records only the keys that changed as a new
+version, so saving after one edit writes one row and any earlier version
+can be rebuilt from its changes. Each scenario row also holds its total
+score and key count, so scenarios can be listed and filtered without
+loading their values.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from indicator_registry import IndicatorRegistry, get_registry
+
+DEFAULT_SCENARIO_PATH = "sinta_scenarios.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL DEFAULT '',
+    version INTEGER NOT NULL DEFAULT 0,
+    total REAL,
+    keys INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scenario_versions (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id) ON DELETE CASCADE,
+    version INTEGER NOT NULL,
+    saved_at TEXT NOT NULL,
+    note TEXT NOT NULL DEFAULT '',
+    changed INTEGER NOT NULL,
+    total REAL,
+    PRIMARY KEY (scenario_id, version)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scenario_values (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (scenario_id, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scenario_changes (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios(id) ON DELETE CASCADE,
+    version INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (scenario_id, key, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_scenarios_total ON scenarios (total);
+CREATE INDEX IF NOT EXISTS idx_scenarios_updated ON scenarios (updated_at);
+"""
+
+
+def _numeric(values: Dict[str, Any]) -> Dict[str, float]:
+    """Keep only the values that can be stored as numbers."""
+    result = {}
+    for key, value in values.items():
+        try:
+            result[str(key)] = float(value)
+        except (ValueError, TypeError):
+            continue
+    return result
+
+
+class ScenarioStore:
+    """
+    SQLite repository of named, versioned scenarios.
+
+    Tables: scenarios (one row per scenario with its summary), scenario_values
+    (current value per key), scenario_changes (value of every key changed in
+    a version; NULL for a removed key) and scenario_versions (one row per
+    save).
+    """
+
+    def __init__(self, path: str = DEFAULT_SCENARIO_PATH, registry: Optional[IndicatorRegistry] = None):
+        """
+        Args:
+            path: SQLite database file.
+            registry: Registry used to compute the stored total scores
+                (default the global registry).
+        """
+        self.path = path
+        self.registry = registry or get_registry()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection (Streamlit reruns may come from different threads)."""
+        connection = sqlite3.connect(self.path)
+        try:
+            connection.execute("PRAGMA foreign_keys=ON")
+            if not self._initialized:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+                self._initialized = True
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _total(self, values: Dict[str, float]) -> float:
+        """Total score of a scenario's values."""
+        return float(self.registry.score_vector(self.registry.read_values(values.get))["total"])
+
+    def _save(self, connection: sqlite3.Connection, name: str, values: Dict[str, float],
+              note: str, description: Optional[str]) -> Tuple[int, int]:
+        """Write one scenario's changed keys inside an open transaction."""
+        now = datetime.now().isoformat(timespec="seconds")
+        row = connection.execute("SELECT id, version FROM scenarios WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            scenario_id = connection.execute(
+                "INSERT INTO scenarios (name, description, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (name, description or "", now, now)).lastrowid
+            version, stored = 0, {}
+        else:
+            scenario_id, version = row
+            stored = dict(connection.execute(
+                "SELECT key, value FROM scenario_values WHERE scenario_id = ?", (scenario_id,)))
+
+        # Hanya key yang berubah, bertambah atau hilang yang ditulis
+        changed = {key: value for key, value in values.items() if stored.get(key) != value}
+        removed = [key for key in stored if key not in values]
+        if not changed and not removed:
+            if description is not None:
+                connection.execute("UPDATE scenarios SET description = ? WHERE id = ?", (description, scenario_id))
+            return version, 0
+
+        version += 1
+        total = self._total(values)
+        connection.executemany(
+            "INSERT INTO scenario_values (scenario_id, key, value) VALUES (?, ?, ?) "
+            "ON CONFLICT (scenario_id, key) DO UPDATE SET value = excluded.value",
+            [(scenario_id, key, value) for key, value in changed.items()])
+        connection.executemany("DELETE FROM scenario_values WHERE scenario_id = ? AND key = ?",
+                               [(scenario_id, key) for key in removed])
+        connection.executemany(
+            "INSERT INTO scenario_changes (scenario_id, version, key, value) VALUES (?, ?, ?, ?)",
+            [(scenario_id, version, key, value) for key, value in changed.items()]
+            + [(scenario_id, version, key, None) for key in removed])
+        connection.execute(
+            "INSERT INTO scenario_versions (scenario_id, version, saved_at, note, changed, total) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (scenario_id, version, now, note, len(changed) + len(removed), total))
+        connection.execute(
+            "UPDATE scenarios SET version = ?, total = ?, keys = ?, updated_at = ?, "
+            "description = COALESCE(?, description) WHERE id = ?",
+            (version, total, len(values), now, description, scenario_id))
+        return version, len(changed) + len(removed)
+
+    def save(self, name: str, values: Dict[str, Any], note: str = "",
+             description: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Save a scenario, writing only the keys that changed since its last version.
+
+        Args:
+            name: Scenario name (created if new).
+            values: Full SINTA_DB contents; non-numeric values are skipped.
+            note: Note stored with the new version.
+            description: New scenario description (None keeps the current one).
+
+        Returns:
+            Tuple of (current version, number of keys written); nothing is
+            written and the version stays the same when no key changed.
+        """
+        with self._connect() as connection:
+            return self._save(connection, name, _numeric(values), note, description)
+
+    def upsert_many(self, scenarios: Dict[str, Dict[str, Any]], note: str = "") -> Dict[str, Tuple[int, int]]:
+        """
+        Save many scenarios in one transaction.
+
+        Args:
+            scenarios: Scenario name to its values.
+            note: Note stored with every new version.
+
+        Returns:
+            Scenario name to (current version, number of keys written).
+        """
+        with self._connect() as connection:
+            return {name: self._save(connection, name, _numeric(values), note, None)
+                    for name, values in scenarios.items()}
+
+    def load(self, name: str, version: Optional[int] = None) -> Optional[Dict[str, float]]:
+        """
+        Load a scenario's values.
+
+        Args:
+            name: Scenario name.
+            version: Version to rebuild (default the current one).
+
+        Returns:
+            Key to value, or None if the scenario (or version) does not exist.
+        """
+        with self._connect() as connection:
+            row = connection.execute("SELECT id, version FROM scenarios WHERE name = ?", (name,)).fetchone()
+            if row is None or (version is not None and not 1 <= version <= row[1]):
+                return None
+            scenario_id, current = row
+            if version is None or version == current:
+                return dict(connection.execute(
+                    "SELECT key, value FROM scenario_values WHERE scenario_id = ?", (scenario_id,)))
+            # Nilai tiap key = perubahan terakhir sampai versi yang diminta
+            rows = connection.execute("""
+                SELECT c.key, c.value FROM scenario_changes c
+                JOIN (SELECT key, MAX(version) AS version FROM scenario_changes
+                      WHERE scenario_id = ? AND version <= ? GROUP BY key) latest
+                  ON c.key = latest.key AND c.version = latest.version
+                WHERE c.scenario_id = ?
+            """, (scenario_id, version, scenario_id))
+            return {key: value for key, value in rows if value is not None}
+
+    def list_scenarios(self, name_like: Optional[str] = None, min_total: Optional[float] = None,
+                       limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        List scenarios from their summary rows (values are not loaded).
+
+        Args:
+            name_like: Only names containing this text.
+            min_total: Only scenarios with at least this total score.
+            limit: Maximum number of scenarios.
+
+        Returns:
+            DataFrame with Nama, Keterangan, Versi, Total, Jumlah Input and
+            Diperbarui, most recently updated first.
+        """
+        query = """
+            SELECT name AS Nama, description AS Keterangan, version AS Versi, total AS Total,
+                   keys AS "Jumlah Input", updated_at AS Diperbarui
+            FROM scenarios WHERE 1 = 1
+        """
+        params = []
+        if name_like:
+            query += " AND name LIKE ?"
+            params.append(f"%{name_like}%")
+        if min_total is not None:
+            query += " AND total >= ?"
+            params.append(min_total)
+        query += " ORDER BY updated_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self._connect() as connection:
+            return pd.read_sql_query(query, connection, params=params)
+
+    def versions(self, name: str) -> pd.DataFrame:
+        """
+        Version history of a scenario.
+
+        Returns:
+            DataFrame with Versi, Disimpan, Catatan, Input Berubah and Total, newest first.
+        """
+        query = """
+            SELECT v.version AS Versi, v.saved_at AS Disimpan, v.note AS Catatan,
+                   v.changed AS "Input Berubah", v.total AS Total
+            FROM scenario_versions v JOIN scenarios s ON s.id = v.scenario_id
+            WHERE s.name = ? ORDER BY v.version DESC
+        """
+        with self._connect() as connection:
+            return pd.read_sql_query(query, connection, params=(name,))
+
+    def delete(self, name: str) -> bool:
+        """Delete a scenario with all its versions; returns whether it existed."""
+        with self._connect() as connection:
+            return connection.execute("DELETE FROM scenarios WHERE name = ?", (name,)).rowcount > 0
+
+
+# Global instance of the scenario store
+scenario_store = ScenarioStore()
+
+
+def get_scenario_store() -> ScenarioStore:
+    """Get the global scenario store instance."""
+    return scenario_store
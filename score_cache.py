@@ -0,0 +1,145 @@
+"""
+Score Cache Module for SINTA Cluster Predictor
+
+This module memoizes component scores. Every Streamlit rerun scores the
+simulation at least twice (sidebar preview and the active page), usually
+with unchanged inputs. Each component's values are fingerprinted (the raw
+bytes of its value vector) and its normalized score is looked up by that
+fingerprint, so editing one HKI field only recomputes HKI. Hit/miss counters
+per component are kept for monitoring on the Pengaturan page.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from indicator_registry import IndicatorRegistry, get_registry
+
+DEFAULT_MAX_ENTRIES = 64  # fingerprint per komponen yang disimpan
+
+
+def fingerprint(values: np.ndarray) -> bytes:
+    """
+    Cheap, exact fingerprint of a value vector.
+
+    Args:
+        values: float64 values of one component, in registry order.
+
+    Returns:
+        The raw bytes of the vector (equal values give equal fingerprints).
+    """
+    return np.ascontiguousarray(values, dtype=float).tobytes()
+
+
+class ScoreCache:
+    """
+    Per-component LRU cache of normalized scores keyed by value fingerprint.
+
+    The cache is shared by all sessions: a fingerprint together with the
+    registry version of the normalizers in effect fully determines the
+    score, so one user's what-if can serve another's, and sessions using
+    different normalizers never see each other's scores.
+    """
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            registry: Indicator registry (default the global registry).
+            max_entries: Fingerprints kept per component.
+        """
+        self.registry = registry or get_registry()
+        self.max_entries = max(1, int(max_entries))
+        self._entries: Dict[str, OrderedDict] = {name: OrderedDict() for name in self.registry.names}
+        self.hits = {name: 0 for name in self.registry.names}
+        self.misses = {name: 0 for name in self.registry.names}
+        self._lock = threading.Lock()
+
+    def component_score(self, name: str, values: np.ndarray) -> float:
+        """
+        Get the normalized score of one component, computing it on a miss.
+
+        Args:
+            name: Component name.
+            values: The component's values, in registry order.
+
+        Returns:
+            Normalized score (0-100).
+        """
+        # Versi pembagi ikut menjadi key: sesi dengan pembagi berbeda berbagi cache yang sama
+        key = (self.registry.version, fingerprint(values))
+        entries = self._entries[name]
+        with self._lock:
+            if key in entries:
+                entries.move_to_end(key)
+                self.hits[name] += 1
+                return entries[key]
+
+        score = self.registry.component(name).score(values)
+        with self._lock:
+            self.misses[name] += 1
+            entries[key] = score
+            if len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        return score
+
+    def score(self, values: np.ndarray) -> Tuple[float, Dict[str, float]]:
+        """
+        Score a full value vector component by component.
+
+        Args:
+            values: Every indicator value, in registry code order.
+
+        Returns:
+            Tuple of (total_score, component_scores_dict).
+        """
+        component_scores = {
+            name: self.component_score(name, values[self.registry.slices[name]])
+            for name in self.registry.names
+        }
+        total_score = sum(component_scores[name] * component.weight
+                          for name, component in self.registry.components.items())
+        return total_score, component_scores
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Hit/miss counters per component.
+
+        Returns:
+            Dictionary of component name to hits, misses, hit_rate and entries.
+        """
+        with self._lock:
+            stats = {}
+            for name in self.registry.names:
+                lookups = self.hits[name] + self.misses[name]
+                stats[name] = {
+                    "hits": self.hits[name],
+                    "misses": self.misses[name],
+                    "hit_rate": self.hits[name] / lookups if lookups else 0.0,
+                    "entries": len(self._entries[name])
+                }
+            return stats
+
+    def clear(self):
+        """Drop every cached score and reset the counters."""
+        with self._lock:
+            for name in self.registry.names:
+                self._entries[name].clear()
+                self.hits[name] = 0
+                self.misses[name] = 0
+
+
+# Global instance of the score cache
+score_cache = ScoreCache()
+
+
+def get_score_cache() -> ScoreCache:
+    """Get the global score cache instance."""
+    return score_cache
+
+
+def cached_score(values: np.ndarray) -> Tuple[float, Dict[str, float]]:
+    """Convenience function to score a value vector through the cache."""
+    return score_cache.score(values)
@@ -0,0 +1,232 @@
+"""
+Score History Module for SINTA Cluster Predictor
+
+This module links successive scrapes into a time series. Every scrape
+output is scored and appended to a SQLite database keyed by Sinta ID and
+scrape timestamp, but an institution only gets a new observation when its
+metrics (content hash) or Klaster label changed since its previous one, so
+the database grows with real changes only. An institution's value at any
+time is its latest observation up to then; indexes on (Sinta ID, time) and
+time keep per-institution trends and cohort-wide "who moved most" queries
+fast. Totals are scored with the base normalizers so they stay comparable
+across scrapes whatever normalizer the app currently uses. An output's
+Parquet snapshot is read instead of its JSON when it is up to date.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Optional
+
+import pandas as pd
+
+from batch_scoring import BatchScorer, Cohort
+from cohort_normalizers import scrape_version
+from cohort_store import get_cohort_store
+from indicator_registry import IndicatorRegistry
+from scrape_output import iter_records, output_timestamp
+
+DEFAULT_HISTORY_PATH = "score_history.db"
+DEFAULT_MOVERS = 10
+DEFAULT_LOOKBACK_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrapes (
+    scraped_at TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    version TEXT NOT NULL,
+    institutions INTEGER NOT NULL,
+    changed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    sinta_id TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    nama_institusi TEXT,
+    klaster TEXT,
+    total REAL NOT NULL,
+    components TEXT NOT NULL,
+    sinta_score_overall REAL,
+    sinta_score_3yr REAL,
+    PRIMARY KEY (sinta_id, scraped_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_observations_time ON observations (scraped_at, sinta_id);
+"""
+
+# Observasi terakhir tiap institusi sampai suatu waktu (nilai berlaku pada waktu itu)
+_STATE_AT = """
+SELECT o.* FROM observations o
+JOIN (SELECT sinta_id, MAX(scraped_at) AS scraped_at FROM observations
+      WHERE scraped_at <= ? GROUP BY sinta_id) latest
+  ON o.sinta_id = latest.sinta_id AND o.scraped_at = latest.scraped_at
+"""
+
+
+class ScoreHistory:
+    """
+    Append-only SQLite history of institution scores.
+
+    Tables: scrapes (one row per ingested output) and observations (one row
+    per institution change, primary key Sinta ID + scrape time).
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, registry: Optional[IndicatorRegistry] = None):
+        """
+        Args:
+            path: SQLite database file.
+            registry: Registry used for scoring (default a fresh registry,
+                i.e. the base normalizers).
+        """
+        self.path = path
+        self.scorer = BatchScorer(registry or IndicatorRegistry())
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection (Streamlit reruns may come from different threads)."""
+        connection = sqlite3.connect(self.path)
+        try:
+            if not self._initialized:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+                self._initialized = True
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def ingest(self, source: str, scraped_at: Optional[datetime] = None) -> int:
+        """
+        Append a scrape output to the history.
+
+        Args:
+            source: Scrape output (.jsonl or legacy .json).
+            scraped_at: Scrape time (default from the filename, see output_timestamp).
+
+        Returns:
+            Number of institutions whose observation was added (0 if the
+            output was already ingested or nothing changed).
+        """
+        timestamp = (scraped_at or output_timestamp(source)).isoformat(timespec="seconds")
+        store = get_cohort_store()
+        if store.is_fresh(source):
+            # Snapshot Parquet berisi metrik dan label yang sama tanpa parsing JSON
+            labels = store.read_labels(source)
+            cohort = store.load_cohort(source)
+        else:
+            labels: Dict[str, Dict[str, Any]] = {}
+
+            def collect(records):
+                for record in records:
+                    labels[str(record.get('Sinta ID'))] = record
+                    yield record
+
+            cohort = Cohort.from_records(collect(iter_records(source)))
+        scores = self.scorer.score_matrix(cohort.matrix, cohort.codes)
+
+        with self._connect() as connection:
+            if connection.execute("SELECT 1 FROM scrapes WHERE scraped_at = ?", (timestamp,)).fetchone():
+                return 0
+            previous = {row[0]: (row[1], row[2]) for row in connection.execute(
+                f"SELECT sinta_id, content_hash, klaster FROM ({_STATE_AT})", (timestamp,))}
+
+            rows = []
+            for i, sinta_id in enumerate(cohort.ids):
+                key = str(sinta_id)
+                record = labels[key]
+                content_hash = record.get('Content Hash') or ""
+                if previous.get(key) == (content_hash, record.get('Klaster')):
+                    continue  # tidak berubah sejak observasi sebelumnya
+                rows.append((
+                    key, timestamp, content_hash, record.get('Nama Institusi'), record.get('Klaster'),
+                    float(scores["total"][i]),
+                    json.dumps(dict(zip(self.scorer.components, scores["normalized"][i].round(6).tolist()))),
+                    record.get('Sinta Score Overall'), record.get('Sinta Score 3Yr')
+                ))
+            connection.executemany("INSERT INTO observations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            connection.execute("INSERT INTO scrapes VALUES (?, ?, ?, ?, ?)",
+                               (timestamp, os.path.basename(source), scrape_version(source), len(cohort), len(rows)))
+        return len(rows)
+
+    def scrapes(self) -> pd.DataFrame:
+        """Ingested scrapes, oldest first."""
+        with self._connect() as connection:
+            return pd.read_sql_query("SELECT * FROM scrapes ORDER BY scraped_at", connection)
+
+    def trend(self, sinta_id: Any, every_scrape: bool = False) -> pd.DataFrame:
+        """
+        Score trend of one institution.
+
+        Args:
+            sinta_id: Institution's Sinta ID.
+            every_scrape: Repeat the current value at every ingested scrape
+                instead of listing only the points where it changed.
+
+        Returns:
+            DataFrame with Waktu, Klaster, Total, Sinta Score Overall and
+            one column per component, oldest first.
+        """
+        query = """
+            SELECT scraped_at AS Waktu, klaster AS Klaster, total AS Total,
+                   sinta_score_overall AS "Sinta Score Overall", components
+            FROM observations WHERE sinta_id = ? ORDER BY scraped_at
+        """
+        with self._connect() as connection:
+            df = pd.read_sql_query(query, connection, params=(str(sinta_id),))
+            times = [row[0] for row in connection.execute("SELECT scraped_at FROM scrapes ORDER BY scraped_at")]
+
+        components = pd.DataFrame([json.loads(c) for c in df.pop("components")], index=df.index)
+        df = pd.concat([df, components], axis=1)
+        df["Waktu"] = pd.to_datetime(df["Waktu"])
+        if every_scrape and len(df):
+            # Nilai berlaku = observasi terakhir sampai waktu scrape tersebut
+            grid = pd.DataFrame({"Waktu": pd.to_datetime(times)})
+            df = pd.merge_asof(grid[grid["Waktu"] >= df["Waktu"].iloc[0]], df, on="Waktu")
+        return df
+
+    def movers(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+               count: int = DEFAULT_MOVERS) -> pd.DataFrame:
+        """
+        Institutions whose total changed most between two times.
+
+        Args:
+            since: Start of the period (default DEFAULT_LOOKBACK_DAYS before until).
+            until: End of the period (default now).
+            count: Number of institutions to return.
+
+        Returns:
+            DataFrame with Sinta ID, Nama Institusi, Klaster, Total Awal,
+            Total Akhir and Perubahan, largest absolute change first.
+            Institutions first seen after since are not included.
+        """
+        until = until or datetime.now()
+        since = since or until - timedelta(days=DEFAULT_LOOKBACK_DAYS)
+        query = f"""
+            WITH akhir AS ({_STATE_AT}), awal AS ({_STATE_AT})
+            SELECT akhir.sinta_id AS "Sinta ID", akhir.nama_institusi AS "Nama Institusi",
+                   akhir.klaster AS Klaster, awal.total AS "Total Awal", akhir.total AS "Total Akhir",
+                   akhir.total - awal.total AS Perubahan
+            FROM akhir JOIN awal ON akhir.sinta_id = awal.sinta_id
+            WHERE akhir.total != awal.total
+            ORDER BY ABS(akhir.total - awal.total) DESC
+            LIMIT ?
+        """
+        params = (until.isoformat(timespec="seconds"), since.isoformat(timespec="seconds"), int(count))
+        with self._connect() as connection:
+            return pd.read_sql_query(query, connection, params=params)
+
+
+# Global instance of the score history
+score_history = ScoreHistory()
+
+
+def get_score_history() -> ScoreHistory:
+    """Get the global score history instance."""
+    return score_history
+
+
+def record_scrape(source: str) -> int:
+    """Convenience function to append a finished scrape output to the history."""
+    return score_history.ingest(source)
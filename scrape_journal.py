@@ -0,0 +1,154 @@
+"""
+Scrape Journal Module for SINTA Cluster Predictor
+
+This module provides an append-only checkpoint journal for the scraper. Every
+finished institution is written as one JSON line as soon as it completes, so
+an interrupted refresh (crash, Streamlit rerun, Ctrl+C) can be resumed and
+only the remaining institutions are fetched again. Loading the journal
+compacts it: entries outside the refresh window and entries superseded by a
+later one for the same institution are dropped, so the file never holds
+more than one line per institution.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+DEFAULT_JOURNAL_PATH = "sinta_scrape_journal.jsonl"
+DEFAULT_REFRESH_WINDOW = timedelta(hours=24)
+
+
+class CheckpointJournal:
+    """
+    Append-only JSONL journal of finished scrape records, compacted on load.
+
+    Each line has the form {"Sinta ID": ..., "finished_at": ISO time,
+    "record": {...}}. Entries older than the refresh window belong to a
+    previous refresh and are ignored when resuming; a refresh that completes
+    clears the journal, so only an interrupted one is resumed. Only the byte
+    offset of each finished line is kept in memory; records are read back on
+    demand.
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH,
+                 refresh_window: timedelta = DEFAULT_REFRESH_WINDOW):
+        """
+        Args:
+            path: Location of the journal file.
+            refresh_window: How long a finished institution counts as fresh.
+        """
+        self.path = path
+        self.refresh_window = refresh_window
+        self._finished: Dict[str, int] = {}
+
+    @staticmethod
+    def _key(sinta_id: Any) -> str:
+        """Normalize IDs so 428 from the CSV and "428" from JSON match."""
+        return str(sinta_id)
+
+    def load(self) -> int:
+        """
+        Scan the journal and index the records finished inside the window.
+
+        A truncated last line (the process died mid-write) is cut off so that
+        new entries are appended on a clean line.
+
+        Returns:
+            Number of distinct institutions already finished.
+        """
+        self._finished = {}
+        if not os.path.exists(self.path):
+            return 0
+
+        cutoff = datetime.now() - self.refresh_window
+        offset = 0
+        lines = 0
+        with open(self.path, 'rb+') as f:
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                if not line.endswith(b"\n"):
+                    f.truncate(line_offset)
+                    break
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                    finished_at = datetime.fromisoformat(entry["finished_at"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if finished_at >= cutoff:
+                    self._finished[self._key(entry["Sinta ID"])] = line_offset
+
+        if lines > len(self._finished):
+            self.compact()
+        return len(self._finished)
+
+    def compact(self):
+        """
+        Rewrite the journal with only the indexed entries (one per institution).
+
+        Entries outside the refresh window, superseded entries and unreadable
+        lines are dropped; the file is replaced atomically.
+        """
+        temp_path = self.path + ".tmp"
+        finished = {}
+        with open(self.path, 'rb') as source, open(temp_path, 'wb') as target:
+            for key, line_offset in sorted(self._finished.items(), key=lambda item: item[1]):
+                source.seek(line_offset)
+                finished[key] = target.tell()
+                target.write(source.readline())
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(temp_path, self.path)
+        self._finished = finished
+
+    def is_finished(self, sinta_id: Any) -> bool:
+        """Check whether an institution was already fetched in this window."""
+        return self._key(sinta_id) in self._finished
+
+    def restore(self, sinta_id: Any, labels: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Rebuild a finished record for a CSV row from the journal.
+
+        The same Sinta ID can appear on several rows of hasil_sinta_metric.csv,
+        so the journaled metrics are combined with the row's own labels
+        (Kode PT, Nama Institusi, Klaster) instead of the labels of whichever
+        row was fetched first.
+
+        Args:
+            sinta_id: SINTA affiliation ID of the row.
+            labels: Record fields taken from the CSV row.
+
+        Returns:
+            A new record dictionary.
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(self._finished[self._key(sinta_id)])
+            record = json.loads(f.readline())["record"]
+        record.update(labels)
+        return record
+
+    def append(self, record: Dict[str, Any]):
+        """
+        Append one finished record and flush it to disk immediately.
+
+        Args:
+            record: Scrape record containing at least a 'Sinta ID' field.
+        """
+        entry = {
+            "Sinta ID": record["Sinta ID"],
+            "finished_at": datetime.now().isoformat(),
+            "record": record
+        }
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            f.write((json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        self._finished[self._key(record["Sinta ID"])] = offset
+
+    def clear(self):
+        """Discard the journal so the next run starts a new refresh."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._finished = {}
@@ -0,0 +1,186 @@
+"""
+Scrape Output Module for SINTA Cluster Predictor
+
+This module streams scrape results to disk as JSON Lines (one institution
+record per line) and reads them back one record at a time. Records are
+written as soon as they finish, so memory stays flat regardless of cohort
+size and a partially written file is already usable by downstream tools.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+OUTPUT_PREFIX = "sinta_metrics_cluster"
+# Skor dari hasil_sinta_metric.csv yang ikut disimpan di setiap record
+SCORE_COLUMNS = ('Sinta Score Overall', 'Sinta Score 3Yr')
+
+
+def metrics_hash(metrics: Any) -> str:
+    """Stable hash of parsed metrics, used to tell whether an institution changed."""
+    return hashlib.sha256(json.dumps(metrics, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def row_labels(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Take the record fields that come from a CSV row.
+
+    Args:
+        row: Row of hasil_sinta_metric.csv as a dictionary.
+
+    Returns:
+        Kode PT, Nama Institusi, Klaster and the SINTA scores present in the row.
+    """
+    labels = {
+        'Kode PT': row['Kode PT'],
+        'Nama Institusi': row['Nama Institusi'],
+        'Klaster': row['Klaster']
+    }
+    for column in SCORE_COLUMNS:
+        if column in row and row[column] == row[column]:  # lewati NaN
+            labels[column] = float(row[column])
+    return labels
+
+
+def make_record(row: Dict[str, Any], metrics: Any, scraped_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Build the output record of one institution.
+
+    Args:
+        row: CSV row of the institution.
+        metrics: Parsed metrics sections.
+        scraped_at: Time the page was fetched (default now).
+
+    Returns:
+        Record with the row labels, Sinta ID, Metrics, Scraped At and Content Hash.
+    """
+    record = row_labels(row)
+    record['Sinta ID'] = row['Sinta ID Link']
+    record['Metrics'] = metrics
+    record['Scraped At'] = (scraped_at or datetime.now()).isoformat()
+    record['Content Hash'] = metrics_hash(metrics)
+    return record
+
+
+def output_filename(prefix: str = OUTPUT_PREFIX, timestamp: Optional[datetime] = None) -> str:
+    """Build a timestamped JSONL output filename, e.g. sinta_metrics_cluster_20250101_120000.jsonl."""
+    timestamp = timestamp or datetime.now()
+    return f"{prefix}_{timestamp.strftime('%Y%m%d_%H%M%S')}.jsonl"
+
+
+def output_timestamp(path: str) -> datetime:
+    """
+    Time a scrape output was taken.
+
+    Args:
+        path: Scrape output file.
+
+    Returns:
+        The timestamp in the filename (see output_filename), else the file's
+        modification time, to the second.
+    """
+    match = re.search(r"_(\d{8}_\d{6})\.jsonl?$", os.path.basename(path))
+    if match:
+        return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+    return datetime.fromtimestamp(int(os.path.getmtime(path)))
+
+
+def latest_output(directory: str = ".", prefix: str = OUTPUT_PREFIX) -> Optional[str]:
+    """
+    Find the most recent timestamped scrape output.
+
+    Only files named exactly like output_filename() produces are considered,
+    so retry outputs and other prefixes sharing the same start are skipped.
+
+    Args:
+        directory: Folder to search.
+        prefix: Output filename prefix.
+
+    Returns:
+        Path of the newest .jsonl output, or None if there is none.
+    """
+    pattern = re.compile(re.escape(prefix) + r"_\d{8}_\d{6}\.jsonl$")
+    names = sorted(name for name in os.listdir(directory) if pattern.match(name))
+    return os.path.join(directory, names[-1]) if names else None
+
+
+class JsonlRecordWriter:
+    """
+    Streaming writer that appends one JSON record per line.
+
+    Usage:
+        with JsonlRecordWriter(path) as writer:
+            writer.write(record)
+    """
+
+    def __init__(self, path: str, atomic: bool = False):
+        """
+        Args:
+            path: Output file; an existing file is overwritten.
+            atomic: Write to path + ".part" and only replace path once the
+                writer is closed without an error. Needed when the records
+                are carried over from the file being replaced.
+        """
+        self.path = path
+        self.atomic = atomic
+        self.count = 0
+        self._file = None
+
+    def __enter__(self) -> "JsonlRecordWriter":
+        self._file = open(self.path + ".part" if self.atomic else self.path, 'w', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(commit=exc_type is None)
+
+    def write(self, record: Dict[str, Any]):
+        """Write one record and flush it so readers can see it immediately."""
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self, commit: bool = True):
+        """
+        Close the underlying file.
+
+        Args:
+            commit: For an atomic writer, whether to move the finished file
+                into place (False keeps the previous file untouched).
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            if self.atomic and commit:
+                os.replace(self.path + ".part", self.path)
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over scrape records one at a time.
+
+    JSONL files are streamed line by line; a truncated last line (file still
+    being written) is skipped. Legacy .json files produced by older versions
+    (a single JSON list) are still accepted, but they are loaded in one go.
+
+    Args:
+        path: Path to a .jsonl or legacy .json scrape output.
+
+    Yields:
+        Institution records.
+    """
+    if path.endswith(".json"):
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
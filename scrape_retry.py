@@ -0,0 +1,344 @@
+"""
+Scrape Retry Module for SINTA Cluster Predictor
+
+This module decides what happens when a profile request fails. RetryPolicy
+retries transient failures (HTTP 429/5xx, timeouts, dropped connections)
+with exponential backoff, jitter and the server's Retry-After hint;
+CircuitBreaker pauses the whole run while the server is clearly overloaded;
+RetryQueue keeps the institutions that still failed so they can be fetched
+again later without repeating a full scrape.
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import requests
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY = 1.0  # detik
+DEFAULT_MAX_DELAY = 60.0  # detik
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_FAILURE_THRESHOLD = 5  # kegagalan berturut-turut sebelum sirkuit terbuka
+DEFAULT_COOLDOWN = 30.0  # detik jeda saat sirkuit terbuka
+DEFAULT_RETRY_QUEUE_PATH = "sinta_retry_queue.jsonl"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Convert a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient request failures.
+
+    The n-th retry waits a random time in [0, min(max_delay, base_delay * 2**n)],
+    or at least as long as the server asked for via Retry-After.
+    """
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY, statuses=RETRYABLE_STATUSES):
+        """
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying).
+            base_delay: Backoff ceiling of the first retry, in seconds.
+            max_delay: Upper bound for any single backoff, in seconds.
+            statuses: HTTP status codes worth retrying.
+        """
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Check whether an error is transient (throttling, server error, timeout, connection)."""
+        if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+            return True
+        return getattr(error, "status", None) in self.statuses
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """
+        Args:
+            error: Error raised by the last attempt.
+            attempt: Number of attempts made so far (1 after the first failure).
+        """
+        return attempt <= self.max_retries and self.is_retryable(error)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute the wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far.
+            retry_after: Server-requested wait in seconds, if any.
+
+        Returns:
+            Seconds to wait.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def call(self, fn: Callable[[Any], Any], arg: Any,
+             breaker: Optional["CircuitBreaker"] = None) -> Any:
+        """
+        Call fn(arg), blocking and retrying transient failures.
+
+        Args:
+            fn: Function performing one attempt.
+            arg: Its argument (e.g. a SINTA ID).
+            breaker: Optional circuit breaker consulted before each attempt.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            The last error once retries are exhausted or the error is permanent.
+        """
+        attempt = 0
+        while True:
+            if breaker:
+                breaker.wait()
+            try:
+                result = fn(arg)
+            except Exception as e:
+                attempt += 1
+                if breaker and self.is_retryable(e):
+                    breaker.record_failure(getattr(e, "retry_after", None))
+                if not self.should_retry(e, attempt):
+                    raise
+                time.sleep(self.backoff(attempt, getattr(e, "retry_after", None)))
+                continue
+            if breaker:
+                breaker.record_success()
+            return result
+
+
+class CircuitBreaker:
+    """
+    Run-wide circuit breaker.
+
+    After failure_threshold consecutive transient failures the circuit opens
+    and every worker waits until the cooldown (or a longer Retry-After) has
+    passed. The first request after that probes the server: a success closes
+    the circuit, another failure opens it again straight away.
+    """
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 cooldown: float = DEFAULT_COOLDOWN):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            cooldown: Seconds the run is paused each time the circuit opens.
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_count = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds until the circuit allows requests again (0 when closed)."""
+        return max(0.0, self._open_until - time.monotonic())
+
+    def record_success(self):
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self.failures = 0
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        """
+        Count a transient failure and open the circuit if the threshold is reached.
+
+        Args:
+            retry_after: Server-requested wait in seconds, if any.
+        """
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                now = time.monotonic()
+                if self._open_until <= now:
+                    self.open_count += 1
+                self._open_until = max(self._open_until, now + max(self.cooldown, retry_after or 0.0))
+
+    def wait(self):
+        """Block the current thread while the circuit is open."""
+        while self.remaining() > 0:
+            time.sleep(self.remaining())
+
+    async def wait_async(self):
+        """Suspend the current coroutine while the circuit is open."""
+        while self.remaining() > 0:
+            await asyncio.sleep(self.remaining())
+
+
+class RetryQueue:
+    """
+    JSONL queue of institutions that still failed after all retries.
+
+    Each line has the form {"Sinta ID": ..., "row": {...}, "error": "...",
+    "failed_at": ISO time}; an institution that is later fetched successfully
+    gets a {"Sinta ID": ..., "row": {...}, "resolved_at": ISO time} line. The
+    queue is drained separately, so a few failed institutions do not require
+    repeating the whole scrape, and a row only leaves the queue once it has
+    been fetched, so an interrupted drain loses nothing.
+    """
+
+    def __init__(self, path: str = DEFAULT_RETRY_QUEUE_PATH):
+        """
+        Args:
+            path: Location of the queue file.
+        """
+        self.path = path
+        self._pending: Optional[Set[Tuple[str, str]]] = None
+
+    def _append(self, entry: Dict[str, Any]):
+        """Append one line and flush it to disk immediately."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def add(self, sinta_id: Any, row: Dict[str, Any], error: Any):
+        """
+        Append one failed institution.
+
+        Args:
+            sinta_id: SINTA affiliation ID.
+            row: The input row needed to scrape it again.
+            error: The final error (exception or message).
+        """
+        entry = {
+            "Sinta ID": sinta_id,
+            "row": row,
+            "error": str(error),
+            "failed_at": datetime.now().isoformat()
+        }
+        self._append(entry)
+        if self._pending is not None:
+            self._pending.add(self._key(entry))
+
+    def resolve(self, sinta_id: Any, row: Dict[str, Any]):
+        """
+        Take one institution out of the queue after it was fetched successfully.
+
+        Rows that are not queued are ignored, so this can be called for every
+        successful row of a full scrape.
+
+        Args:
+            sinta_id: SINTA affiliation ID.
+            row: The input row that was fetched.
+        """
+        entry = {"Sinta ID": sinta_id, "row": row, "resolved_at": datetime.now().isoformat()}
+        key = self._key(entry)
+        if self._pending is None:
+            self.entries()
+        if key not in self._pending:
+            return
+        self._append(entry)
+        self._pending.discard(key)
+
+    @staticmethod
+    def _key(entry: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Identity of a queued row: Sinta ID plus Kode PT.
+
+        hasil_sinta_metric.csv lists several institutions under the same
+        Sinta ID, so the Sinta ID alone would merge their failures.
+        """
+        row = entry.get("row") or {}
+        return str(entry["Sinta ID"]), str(row.get("Kode PT"))
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Read the queued institutions, keeping the latest entry per CSV row (Sinta ID + Kode PT).
+
+        Rows whose latest line is a resolution are no longer queued.
+
+        Returns:
+            Queue entries in first-failure order.
+        """
+        latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        key = self._key(entry)
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        continue
+                    if "resolved_at" in entry:
+                        latest.pop(key, None)
+                    else:
+                        latest[key] = entry
+        self._pending = set(latest)
+        return list(latest.values())
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Input rows of every queued institution, without removing them.
+
+        Rows leave the queue through resolve() once they are fetched; rows
+        that fail again are re-added with add().
+
+        Returns:
+            The input rows to scrape again.
+        """
+        return [entry["row"] for entry in self.entries()]
+
+    def compact(self):
+        """
+        Rewrite the queue with only the rows still queued (one line each).
+
+        Resolved and superseded lines are dropped; the file is replaced
+        atomically, or removed when nothing is queued.
+        """
+        entries = self.entries()
+        if not entries:
+            self.clear()
+            return
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        """Empty the queue."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._pending = set()
@@ -0,0 +1,429 @@
+"""
+Scraper Engine Module for SINTA Cluster Predictor
+
+This module contains the network side of the SINTA scraper: a client that
+owns a pooled keep-alive HTTP session, a token-bucket rate limiter and an
+asyncio driver that keeps a bounded number of profile requests in flight.
+Downloaded pages can be handed through a bounded queue to a process pool for
+parsing, so CPU-bound parsing does not hold the GIL of the fetching threads.
+It has no Streamlit dependency so it can be shared by the scraping page
+(scraping_module.py) and the standalone new_scraping.py script.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from http_cache import ResponseCache, content_hash
+from scrape_retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+PROFILE_URL = "https://sinta.kemdiktisaintek.go.id/affiliations/profile/{sinta_id}/?view=matricscluster2026"
+DEFAULT_TIMEOUT = 15
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_RATE = 1.0  # request per detik
+MIN_DELAY = 0.5  # jeda minimum antar awal request (detik), seperti scraper awal
+DEFAULT_BURST = 1
+# Parsing di proses terpisah hanya menguntungkan jika ada lebih dari satu core
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1) if (os.cpu_count() or 1) > 1 else 0
+DEFAULT_QUEUE_SIZE = 16  # halaman HTML yang boleh menunggu untuk di-parse
+DEFAULT_CONNECT_RETRIES = 2  # percobaan ulang koneksi yang gagal dibuka
+
+
+class ScrapeError(Exception):
+    """Raised when a profile page cannot be fetched or has no metrics table."""
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Human readable description (shown in the UI).
+            status: HTTP status code of the failed response, if any.
+            retry_after: Seconds the server asked us to wait, if any.
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CachedMetrics:
+    """
+    Fetch result for a page whose metrics are already known from the cache.
+
+    The pipeline passes the metrics straight to on_complete and skips the
+    parse stage for such items.
+    """
+
+    def __init__(self, metrics: Any):
+        self.metrics = metrics
+
+
+class TokenBucket:
+    """
+    Global token-bucket rate limiter shared by all in-flight requests.
+
+    Tokens are refilled continuously at `rate` per second up to `burst`, and
+    every request consumes one. Over any time window T at most
+    burst + rate * T requests are started, regardless of server latency.
+    Consecutive requests never start less than `min_delay` seconds apart,
+    even within a burst, and the rate is capped at 1 / min_delay.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST, min_delay: float = MIN_DELAY):
+        """
+        Args:
+            rate: Sustained requests per second (at most 1 / min_delay).
+            burst: Number of requests that may start in quick succession.
+            min_delay: Minimum seconds between the starts of two requests.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.min_delay = max(0.0, float(min_delay))
+        self.rate = min(float(rate), 1.0 / self.min_delay) if self.min_delay else float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._next_start = self._updated
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate, self._next_start - now)
+            # Jadwalkan awal request berikutnya paling cepat min_delay setelah yang ini
+            self._next_start = now + wait + self.min_delay
+            return wait
+
+    def acquire(self):
+        """Block the current thread until a request may start."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Suspend the current coroutine until a request may start."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def profile_url(sinta_id: Any) -> str:
+    """Build the Metrics Cluster profile URL for a SINTA affiliation ID."""
+    return PROFILE_URL.format(sinta_id=sinta_id)
+
+
+class SintaClient:
+    """
+    HTTP client used by every scraping entry point.
+
+    It owns one requests session whose connection pool is sized to the
+    number of fetch threads, so connections to the SINTA host stay open
+    (keep-alive) and the TCP/TLS handshake is paid once per connection
+    instead of once per institution. Responses are requested compressed,
+    connection errors are retried at the transport level, and an optional
+    ResponseCache makes requests conditional. The client also carries the
+    retry policy and circuit breaker applied by the scrape driver.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_MAX_WORKERS, timeout: float = DEFAULT_TIMEOUT,
+                 cache: Optional[ResponseCache] = None, connect_retries: int = DEFAULT_CONNECT_RETRIES,
+                 retry_policy: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            pool_size: Maximum number of connections kept open to the SINTA host.
+            timeout: Request timeout in seconds.
+            cache: Optional persistent response cache.
+            connect_retries: Transport-level retries for failed connections.
+            retry_policy: Retry policy for 429/5xx/timeouts (default RetryPolicy()).
+            breaker: Circuit breaker shared by every request of this client.
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+        retry = Retry(total=connect_retries, connect=connect_retries, read=0, status=0,
+                      backoff_factor=0.5, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __enter__(self) -> "SintaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+    def cached_metrics(self, sinta_id: Any) -> Optional[CachedMetrics]:
+        """
+        Look up metrics that can be used without any request.
+
+        Args:
+            sinta_id: SINTA affiliation ID.
+
+        Returns:
+            CachedMetrics if the page was fetched inside the cache TTL and its
+            metrics are known, otherwise None.
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get(profile_url(sinta_id))
+        if entry is not None and entry.get("metrics") is not None and self.cache.is_fresh(entry):
+            return CachedMetrics(entry["metrics"])
+        return None
+
+    def store_metrics(self, sinta_id: Any, metrics: Any):
+        """Remember the parsed metrics of the cached page so it is not parsed again."""
+        if self.cache is not None and metrics is not None:
+            self.cache.store_metrics(profile_url(sinta_id), metrics)
+
+    def fetch_profile(self, sinta_id: Any) -> Union[str, CachedMetrics]:
+        """
+        Download the Metrics Cluster page of one institution.
+
+        With a cache, a page fetched inside the cache TTL is not requested at
+        all, other requests are made conditional on the stored ETag /
+        Last-Modified, and a page whose body hash did not change keeps its
+        previously parsed metrics. In those cases CachedMetrics is returned
+        instead of the HTML.
+
+        Args:
+            sinta_id: SINTA affiliation ID.
+
+        Returns:
+            The HTML body of the page, or CachedMetrics for an unchanged page.
+
+        Raises:
+            ScrapeError: If the server does not answer with HTTP 200 (or 304
+                for a cached page).
+        """
+        cache = self.cache
+        url = profile_url(sinta_id)
+        entry = cache.get(url) if cache else None
+        known_metrics = entry is not None and entry.get("metrics") is not None
+
+        if known_metrics and cache.is_fresh(entry):
+            return CachedMetrics(entry["metrics"])
+
+        response = self.session.get(url, timeout=self.timeout,
+                                    headers=ResponseCache.conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            cache.touch(url, entry)
+            return CachedMetrics(entry["metrics"]) if known_metrics else entry["body"]
+        if response.status_code != 200:
+            raise ScrapeError(f"Gagal akses {url} (HTTP {response.status_code})",
+                              status=response.status_code,
+                              retry_after=parse_retry_after(response.headers.get("Retry-After")))
+
+        body = response.text
+        if cache:
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if known_metrics and entry.get("content_hash") == content_hash(body):
+                cache.put(url, body, etag, last_modified, metrics=entry["metrics"])
+                return CachedMetrics(entry["metrics"])
+            cache.put(url, body, etag, last_modified)
+        return body
+
+    def fetch_profile_with_retry(self, sinta_id: Any) -> Union[str, CachedMetrics]:
+        """Blocking fetch_profile that applies the retry policy and circuit breaker."""
+        return self.retry_policy.call(self.fetch_profile, sinta_id, breaker=self.breaker)
+
+
+_default_client: Optional[SintaClient] = None
+
+
+def default_client() -> SintaClient:
+    """Get the shared client used for one-off fetches outside a scrape run."""
+    global _default_client
+    if _default_client is None:
+        _default_client = SintaClient()
+    return _default_client
+
+
+async def scrape_async(items: Iterable[Any],
+                       fetch: Callable[[Any], Any],
+                       limiter: TokenBucket,
+                       max_workers: int = DEFAULT_MAX_WORKERS,
+                       on_complete: Optional[Callable[[Any, Any, Optional[Exception]], None]] = None,
+                       parse: Optional[Callable[[Any], Any]] = None,
+                       lookup: Optional[Callable[[Any], Optional[CachedMetrics]]] = None,
+                       retry_policy: Optional[RetryPolicy] = None,
+                       breaker: Optional[CircuitBreaker] = None,
+                       parse_executor: Optional[Executor] = None,
+                       parse_workers: int = 0,
+                       queue_size: int = DEFAULT_QUEUE_SIZE):
+    """
+    Scrape all items on the running event loop.
+
+    The blocking fetch runs in a thread pool of max_workers threads; the
+    event loop only waits on the limiter and on finished futures, so a slow
+    response never delays the start of the next request beyond what the
+    limiter allows. When parse_executor is given, fetched bodies go through a
+    bounded queue to parse_workers consumers that parse them on that
+    executor; a full queue pauses the fetchers (backpressure).
+
+    A failed fetch that the retry policy considers transient is retried
+    after its backoff, without holding a worker slot while it waits; every
+    attempt takes a fresh limiter token. While the circuit breaker is open
+    no new request is started at all.
+
+    Args:
+        items: Work items (e.g. institution rows).
+        fetch: Blocking function that downloads one item.
+        limiter: Rate limiter consulted before every request.
+        max_workers: Maximum number of requests in flight.
+        on_complete: Callback(item, result, error) invoked on the event loop
+            thread as soon as each item finishes, in completion order. A
+            CachedMetrics fetch result is unwrapped and never parsed.
+        parse: Function applied to each fetched body. Must be a picklable
+            top-level function when parse_executor is a process pool.
+        lookup: Optional function returning CachedMetrics for items that
+            need no request; those items bypass the limiter entirely.
+        retry_policy: Policy for retrying failed fetches; None fails at once.
+        breaker: Circuit breaker shared by all requests of the run.
+        parse_executor: Executor for the parse stage; if None, parsing runs
+            in the fetch thread right after the download.
+        parse_workers: Number of parse consumers (normally the pool size).
+        queue_size: Maximum number of fetched bodies waiting to be parsed.
+    """
+    loop = asyncio.get_running_loop()
+    max_workers = max(1, max_workers)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    def finish(item, result, error):
+        if on_complete:
+            on_complete(item, result, error)
+
+    if parse is not None and parse_executor is None:
+        def fetch_and_parse(item, fetch_only=fetch, parse_inline=parse):
+            body = fetch_only(item)
+            return body if isinstance(body, CachedMetrics) else parse_inline(body)
+        fetch, parse = fetch_and_parse, None
+
+    queue = asyncio.Queue(maxsize=max(1, queue_size))
+
+    async def parse_loop():
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            item, body = job
+            try:
+                result, error = await loop.run_in_executor(parse_executor, parse, body), None
+            except Exception as e:
+                result, error = None, e
+            finish(item, result, error)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        async def fetch_one(item):
+            cached = lookup(item) if lookup else None
+            if cached is not None:
+                finish(item, cached.metrics, None)
+                return
+            attempt = 0
+            while True:
+                if breaker:
+                    await breaker.wait_async()
+                async with semaphore:
+                    await limiter.acquire_async()
+                    try:
+                        body = await loop.run_in_executor(executor, fetch, item)
+                    except Exception as e:
+                        error = e
+                    else:
+                        if breaker:
+                            breaker.record_success()
+                        if isinstance(body, CachedMetrics):
+                            finish(item, body.metrics, None)
+                        elif parse is None:
+                            finish(item, body, None)
+                        else:
+                            # Menunggu di sini saat antrean penuh menahan slot fetch
+                            await queue.put((item, body))
+                        return
+
+                attempt += 1
+                retry_after = getattr(error, "retry_after", None)
+                if breaker and retry_policy and retry_policy.is_retryable(error):
+                    breaker.record_failure(retry_after)
+                if retry_policy is None or not retry_policy.should_retry(error, attempt):
+                    finish(item, None, error)
+                    return
+                # Backoff di luar semaphore agar slot bisa dipakai institusi lain
+                await asyncio.sleep(retry_policy.backoff(attempt, retry_after))
+
+        parsers = []
+        if parse is not None:
+            parsers = [asyncio.create_task(parse_loop()) for _ in range(max(1, parse_workers))]
+
+        await asyncio.gather(*(fetch_one(item) for item in items))
+        for _ in parsers:
+            await queue.put(None)
+        await asyncio.gather(*parsers)
+
+
+def scrape_concurrently(items: Iterable[Any],
+                        fetch: Callable[[Any], Any],
+                        max_workers: int = DEFAULT_MAX_WORKERS,
+                        rate: float = DEFAULT_RATE,
+                        burst: int = DEFAULT_BURST,
+                        on_complete: Optional[Callable[[Any, Any, Optional[Exception]], None]] = None,
+                        parse: Optional[Callable[[Any], Any]] = None,
+                        lookup: Optional[Callable[[Any], Optional[CachedMetrics]]] = None,
+                        retry_policy: Optional[RetryPolicy] = None,
+                        breaker: Optional[CircuitBreaker] = None,
+                        parse_workers: int = 0,
+                        queue_size: int = DEFAULT_QUEUE_SIZE):
+    """
+    Fetch (and optionally parse) every item under a global rate ceiling.
+
+    Synchronous entry point for scrape_async: it owns the event loop, so the
+    callback runs in the calling thread (the Streamlit script thread).
+
+    Args:
+        items: Work items (e.g. institution rows).
+        fetch: Function that downloads one item and returns its body.
+        max_workers: Maximum number of requests in flight.
+        rate: Sustained requests per second across all workers (capped at 1 / MIN_DELAY).
+        burst: Number of requests that may start in quick succession (still MIN_DELAY apart).
+        on_complete: Callback(item, result, error) invoked as each item
+            finishes; result is the parsed body when parse is given.
+        parse: Picklable top-level function that parses one body.
+        lookup: Optional function returning CachedMetrics for items that can
+            be answered from the cache without a request.
+        retry_policy: Policy for retrying transient fetch failures.
+        breaker: Circuit breaker that pauses the run when the server is overloaded.
+        parse_workers: Size of the parsing process pool; 0 parses in the
+            fetch threads instead.
+        queue_size: Maximum number of fetched bodies waiting to be parsed.
+    """
+    limiter = TokenBucket(rate, burst)
+    if parse is None or parse_workers <= 0:
+        asyncio.run(scrape_async(items, fetch, limiter, max_workers=max_workers,
+                                 on_complete=on_complete, parse=parse, lookup=lookup,
+                                 retry_policy=retry_policy, breaker=breaker))
+        return
+
+    with ProcessPoolExecutor(max_workers=parse_workers) as parse_executor:
+        asyncio.run(scrape_async(items, fetch, limiter, max_workers=max_workers,
+                                 on_complete=on_complete, parse=parse, lookup=lookup,
+                                 retry_policy=retry_policy, breaker=breaker,
+                                 parse_executor=parse_executor, parse_workers=parse_workers,
+                                 queue_size=queue_size))
@@ -1,141 +1,298 @@
 import streamlit as st
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import time
-import json
 import os
-from datetime import datetime
+from datetime import timedelta
 
-def parse_metrics_page(html_content):
-    """Parse the metrics page HTML content and extract data."""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    table = soup.find('table', class_='table')
-    if not table:
-        return None
+from sinta_parser import parse_metrics_page
+from scraper_engine import (
+    DEFAULT_PARSE_WORKERS, MIN_DELAY, CachedMetrics, ScrapeError, SintaClient, default_client,
+    scrape_concurrently
+)
+from http_cache import DEFAULT_CACHE_DIR, DEFAULT_TTL, ResponseCache
+from scrape_journal import DEFAULT_JOURNAL_PATH, CheckpointJournal
+from scrape_output import (
+    SCORE_COLUMNS, JsonlRecordWriter, latest_output, make_record, row_labels,
+    output_filename as scrape_output_filename
+)
+from cohort_store import store_scrape_output
+from institution_csv import DEFAULT_CSV_PATH, load_institutions
+from cohort_matrix import write_cohort_matrix
+from score_history import record_scrape
+from cluster_boundaries import invalidate_boundaries
+from cohort_normalizers import invalidate_normalizers
+from cohort_index import invalidate_cohort_index
+from refresh_planner import DEFAULT_MAX_AGE, plan_refresh
+from scrape_retry import DEFAULT_MAX_RETRIES, DEFAULT_RETRY_QUEUE_PATH, RetryPolicy, RetryQueue
+
+RETRY_OUTPUT_PREFIX = "sinta_metrics_cluster_retry"
+
+def build_record(row, metrics):
+    """Build the output record of one CSV row, raising ScrapeError if it has no metrics."""
+    if metrics is None:
+        raise ScrapeError(f"Tidak ada data metrics untuk {row['Nama Institusi']}")
+
+    return make_record(row, metrics)
 
-    sections = {}
-    current_section = None
-    rows = table.find_all('tr')
-
-    for row in rows:
-        # Deteksi header section
-        header = row.find('th', colspan=True, style=lambda x: x and 'border-left: 3px solid' in x)
-        if header and 'Total' not in header.get_text():
-            section_text = header.get_text(strip=True)
-            if 'Score in' in section_text:
-                current_section = section_text
-                sections[current_section] = []
-            continue
-
-        # Deteksi total akhir (TOTAL ALL SCORE)
-        total_all = row.find('th', style=lambda x: x and '#FF6B1A' in x)
-        if total_all and 'TOTAL ALL SCORE' in total_all.get_text():
-            total_score = row.find_all('th')[-1].get_text(strip=True)
-            sections['TOTAL ALL SCORE'] = total_score
-            continue
-
-        # Deteksi subtotal section (Total Score Publication Ternormal, dll)
-        italic_total = row.find('th', style=lambda x: x and 'font-style: italic' in x)
-        if italic_total:
-            text = italic_total.get_text(strip=True)
-            if 'Total Score' in text:
-                value = row.find_all('th')[-1].get_text(strip=True)
-                sections.setdefault(current_section + ' (subtotal)', []).append({
-                    'label': text,
-                    'value': value
-                })
-            continue
-
-        # Ambil data baris biasa (AI1, AN2, dll)
-        cols = row.find_all(['th', 'td'])
-        if len(cols) >= 5 and cols[0].get('style') and 'border-left: 3px solid' in cols[0]['style']:
-            code = cols[1].get_text(strip=True)
-            name = cols[2].get_text(strip=True)
-            weight = cols[3].get_text(strip=True)
-            value = cols[4].get_text(strip=True).replace(',', '.')
-            total = cols[5].get_text(strip=True).replace(',', '.')
-
-            if current_section:
-                sections[current_section].append({
-                    'code': code,
-                    'name': name,
-                    'weight': weight,
-                    'value': value,
-                    'total': total
-                })
-
-    return sections
-
-def scrape_institution_data(sinta_id, nama, klaster, kode_pt):
+def fetch_institution_record(sinta_id, nama, klaster, kode_pt, client=None):
+    """Fetch and parse a single institution, raising ScrapeError on failure."""
+    client = client or default_client()
+    row = {'Sinta ID Link': sinta_id, 'Nama Institusi': nama, 'Klaster': klaster, 'Kode PT': kode_pt}
+    page = client.fetch_profile_with_retry(sinta_id)
+    if isinstance(page, CachedMetrics):
+        return build_record(row, page.metrics)
+
+    metrics = parse_metrics_page(page)
+    client.store_metrics(sinta_id, metrics)
+    return build_record(row, metrics)
+
+def scrape_institution_data(sinta_id, nama, klaster, kode_pt, client=None):
     """Scrape data for a single institution."""
-    url = f"https://sinta.kemdiktisaintek.go.id/affiliations/profile/{sinta_id}/?view=matricscluster2026"
     try:
-        response = requests.get(url, timeout=15)
-        if response.status_code != 200:
-            st.warning(f"Gagal akses {url}")
-            return None
-
-        metrics = parse_metrics_page(response.text)
-        if metrics is None:
-            st.warning(f"Tidak ada data metrics untuk {nama}")
-            return None
-
-        return {
-            'Kode PT': kode_pt,
-            'Nama Institusi': nama,
-            'Klaster': klaster,
-            'Sinta ID': sinta_id,
-            'Metrics': metrics
-        }
-
+        return fetch_institution_record(sinta_id, nama, klaster, kode_pt, client=client)
+    except ScrapeError as e:
+        st.warning(str(e))
+        return None
     except Exception as e:
         st.error(f"Error saat mengambil data untuk {nama}: {e}")
         return None
 
-def perform_scraping(csv_input, delay=1):
-    """Perform the scraping operation."""
-    # Read CSV
-    df = pd.read_csv(csv_input)
-    
-    results = []
-    processed_count = 0
-    total_count = len(df)
+def perform_scraping(csv_input, delay=1, max_workers=1, burst=1, resume=True,
+                     journal_path=DEFAULT_JOURNAL_PATH, parse_workers=DEFAULT_PARSE_WORKERS,
+                     use_cache=True, cache_dir=DEFAULT_CACHE_DIR, cache_ttl=DEFAULT_TTL,
+                     max_retries=DEFAULT_MAX_RETRIES, retry_queue_path=DEFAULT_RETRY_QUEUE_PATH,
+                     incremental=False, previous_output=None, max_age=DEFAULT_MAX_AGE, priority_ids=None):
+    """
+    Perform the scraping operation.
+
+    Requests are started at most once per `delay` seconds on average (with up
+    to `burst` in quick succession, never less than MIN_DELAY apart) and at
+    most max_workers are in flight. Every
+    finished institution is appended to the checkpoint journal; with
+    resume=True, institutions already in the journal for the current refresh
+    window are taken from it instead of being fetched again. The journal is
+    cleared once the run completes, so only an interrupted run is resumed
+    and a later run fetches every institution again. Downloaded pages
+    are parsed in a pool of parse_workers processes (0 = parse in the fetch
+    threads) while the next requests are already in flight.
+
+    Records are streamed to a JSONL file as they complete, so results are not
+    held in memory and the file is readable (scrape_output.iter_records) while
+    the scrape is still running.
+
+    With use_cache=True, pages are kept in a persistent cache (cache_dir).
+    Pages fetched less than cache_ttl seconds ago are not requested at all,
+    older ones are revalidated with conditional requests, and pages whose
+    content did not change reuse their previously parsed metrics.
+
+    Transient failures (HTTP 429/5xx, timeouts) are retried up to max_retries
+    times with exponential backoff, and the whole run pauses while the
+    server keeps failing. Institutions that still fail are added to the
+    retry queue (see drain_retry_queue).
+
+    With incremental=True only the delta against previous_output (default:
+    the latest timestamped output) is scraped: new institutions, institutions
+    whose page cache holds newer metrics than their record, and records
+    older than max_age, with priority_ids first. All other records are copied from the previous
+    output into the new one.
+
+    csv_input is the path of the institution CSV (loaded through the cached
+    institution_csv loader) or an already loaded institution frame.
+
+    Returns:
+        Tuple of (output_filename, number_of_records_written)
+    """
+    # Read CSV (csv_input may also be the frame the page already loaded)
+    df = csv_input if isinstance(csv_input, pd.DataFrame) else load_institutions(csv_input)
+    columns = ['Sinta ID Link', 'Nama Institusi', 'Klaster', 'Kode PT']
+    columns += [column for column in SCORE_COLUMNS if column in df.columns]
+    all_rows = df[columns].to_dict('records')
+
+    journal = CheckpointJournal(journal_path)
+    if resume:
+        journal.load()
+    else:
+        journal.clear()
+
+    plan = None
+    if incremental:
+        plan = plan_refresh(all_rows, previous_output or latest_output(), max_age, priority_ids,
+                            cache=ResponseCache(cache_dir, cache_ttl) if use_cache else None)
+        counts = plan.counts()
+        st.info("Refresh inkremental: " + ", ".join(f"{count} {reason}" for reason, count in counts.items()))
+        all_rows = plan.to_scrape
+
+    result = _scrape_rows(all_rows, journal, scrape_output_filename(), delay, max_workers, burst,
+                          parse_workers, use_cache, cache_dir, cache_ttl, max_retries,
+                          RetryQueue(retry_queue_path), plan)
+    # Refresh selesai tanpa terputus: checkpoint hanya untuk melanjutkan run yang terputus,
+    # jadi run berikutnya mengambil ulang semua institusi
+    journal.clear()
+    return result
+
+def drain_retry_queue(delay=1, max_workers=1, burst=1, journal_path=DEFAULT_JOURNAL_PATH,
+                      parse_workers=DEFAULT_PARSE_WORKERS, use_cache=True, cache_dir=DEFAULT_CACHE_DIR,
+                      cache_ttl=DEFAULT_TTL, max_retries=DEFAULT_MAX_RETRIES,
+                      retry_queue_path=DEFAULT_RETRY_QUEUE_PATH):
+    """
+    Scrape again only the institutions waiting in the retry queue.
+
+    Successful institutions are appended to the checkpoint journal (so the
+    next resumed full scrape picks them up), written to their own JSONL file
+    and only then taken out of the queue, so an interrupted drain loses
+    nothing; institutions that fail again stay in the queue.
+
+    Returns:
+        Tuple of (output_filename, number_of_records_written)
+    """
+    retry_queue = RetryQueue(retry_queue_path)
+    rows = retry_queue.rows()
+
+    journal = CheckpointJournal(journal_path)
+    journal.load()
+
+    return _scrape_rows(rows, journal, scrape_output_filename(RETRY_OUTPUT_PREFIX), delay, max_workers,
+                        burst, parse_workers, use_cache, cache_dir, cache_ttl, max_retries, retry_queue)
+
+def _scrape_rows(all_rows, journal, output_filename, delay, max_workers, burst, parse_workers,
+                 use_cache, cache_dir, cache_ttl, max_retries, retry_queue, plan=None):
+    """
+    Scrape the given CSV rows with progress display; shared by perform_scraping and drain_retry_queue.
+
+    When a RefreshPlan is given, its carried-over records are written first
+    and scraped institutions are compared with their previous Content Hash.
+    """
+    rows = [row for row in all_rows if not journal.is_finished(row['Sinta ID Link'])]
+    processed_count = len(all_rows) - len(rows)
+    total_count = len(all_rows)
+    failed_count = 0
+    changed_count = 0
     
     # Create a progress bar
-    progress_bar = st.progress(0)
+    progress_bar = st.progress(processed_count / total_count if total_count else 1.0)
     status_text = st.empty()
-    
-    for idx, row in df.iterrows():
-        sinta_id = row['Sinta ID Link']
+    if processed_count:
+        st.info(f"Melanjutkan dari checkpoint: {processed_count} institusi sudah diambil sebelumnya.")
+    client = SintaClient(max_workers, cache=ResponseCache(cache_dir, cache_ttl) if use_cache else None,
+                         retry_policy=RetryPolicy(max_retries))
+    # ID yang metrics-nya diambil dari cache tidak perlu disimpan ulang
+    cached_ids = set()
+
+    # Stream records into the output file as they finish
+    writer = JsonlRecordWriter(output_filename)
+
+    def lookup(row):
+        cached = client.cached_metrics(row['Sinta ID Link'])
+        if cached is not None:
+            cached_ids.add(row['Sinta ID Link'])
+        return cached
+
+    def fetch(row):
+        page = client.fetch_profile(row['Sinta ID Link'])
+        if isinstance(page, CachedMetrics):
+            cached_ids.add(row['Sinta ID Link'])
+        return page
+
+    def on_complete(row, metrics, error):
+        # Dipanggil di thread utama agar elemen Streamlit tetap ter-update
+        nonlocal processed_count, failed_count, changed_count
         nama = row['Nama Institusi']
-        klaster = row['Klaster']
-        kode_pt = row['Kode PT']
-        
-        status_text.text(f"Scraping {nama} (ID: {sinta_id})... ({processed_count+1}/{total_count})")
-        
-        result = scrape_institution_data(sinta_id, nama, klaster, kode_pt)
-        if result:
-            results.append(result)
-        
+        if error is None:
+            try:
+                result = build_record(row, metrics)
+            except ScrapeError as e:
+                error = e
+
+        if error is not None:
+            failed_count += 1
+            retry_queue.add(row['Sinta ID Link'], row, error)
+            if isinstance(error, ScrapeError):
+                st.warning(str(error))
+            else:
+                st.error(f"Error saat mengambil data untuk {nama}: {error}")
+            # Refresh yang gagal tidak menghapus data lama dari hasil
+            if plan is not None and row in plan.previous:
+                record = plan.previous.record(row)
+                record.update(row_labels(row))
+                writer.write(record)
+        else:
+            if row['Sinta ID Link'] not in cached_ids:
+                client.store_metrics(row['Sinta ID Link'], metrics)
+            if plan is not None and plan.previous.content_hash(row) != result['Content Hash']:
+                changed_count += 1
+            journal.append(result)
+            writer.write(result)
+            retry_queue.resolve(row['Sinta ID Link'], row)
+
         processed_count += 1
         progress_bar.progress(processed_count / total_count)
-        
-        # Sleep to avoid overloading the server (only if not the last item)
-        if processed_count < total_count:
-            time.sleep(delay)
-    
-    # Generate filename with current timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_filename = f"sinta_metrics_cluster_{timestamp}.json"
-    
-    # Save to JSON file
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+        status_text.text(f"Selesai {nama} (ID: {row['Sinta ID Link']})... ({processed_count}/{total_count})")
+
+    try:
+        with writer:
+            # Institusi yang tidak perlu di-refresh disalin dari hasil sebelumnya
+            if plan is not None:
+                for record in plan.carried_records():
+                    writer.write(record)
+
+            # Institusi dari checkpoint ditulis lebih dulu
+            for row in all_rows:
+                if journal.is_finished(row['Sinta ID Link']):
+                    writer.write(journal.restore(row['Sinta ID Link'], row_labels(row)))
+
+            scrape_concurrently(rows, fetch, max_workers=max_workers, rate=1.0 / delay,
+                                burst=burst, on_complete=on_complete,
+                                parse=parse_metrics_page, lookup=lookup,
+                                retry_policy=client.retry_policy, breaker=client.breaker,
+                                parse_workers=parse_workers)
+    finally:
+        client.close()
+    # Baris yang sudah berhasil dan entri lama dibuang dari antrean
+    retry_queue.compact()
+
+    # Simpan juga sebagai snapshot kolom (Parquet) dan matriks memory-mapped untuk analisis kohort
+    if writer.count:
+        try:
+            store_scrape_output(output_filename)
+            write_cohort_matrix(output_filename)
+        except Exception as e:
+            st.warning(f"Snapshot kohort tidak dapat ditulis: {e}")
+        try:
+            changed = record_scrape(output_filename)
+            st.info(f"Riwayat skor diperbarui: {changed} institusi berubah sejak scrape sebelumnya.")
+        except Exception as e:
+            st.warning(f"Riwayat skor tidak dapat diperbarui: {e}")
+        # Pembagi normalisasi, indeks kohort dan batas klaster dihitung ulang dari scrape baru
+        # pada rerun berikutnya
+        invalidate_normalizers()
+        invalidate_cohort_index()
+        invalidate_boundaries()
     
     status_text.text(f"✅ Selesai! Hasil disimpan di {output_filename}")
+    if client.breaker.open_count:
+        st.warning(f"Server SINTA sempat kelebihan beban; scraping dijeda {client.breaker.open_count} kali.")
+    if failed_count:
+        st.warning(f"{failed_count} institusi gagal diambil dan dimasukkan ke antrean ulang.")
+    if plan is not None:
+        st.info(f"{changed_count} dari {len(rows)} institusi yang diambil ulang memiliki data yang berubah.")
     
-    return output_filename, results
+    return output_filename, writer.count
+
+def show_scraping_result(output_filename, record_count):
+    """Show the outcome of a scrape run with a download button for its JSONL file."""
+    if record_count:
+        st.success(f"Scraping selesai! {record_count} institusi telah disimpan ke {output_filename}")
+        
+        # Show download link
+        with open(output_filename, 'r', encoding='utf-8') as f:
+            st.download_button(
+                label="📥 Download Hasil Scraping",
+                data=f.read(),
+                file_name=output_filename,
+                mime="application/x-ndjson"
+            )
+    
+    else:
+        st.error("Tidak ada data yang berhasil diambil")
 
 def scraping_page():
     """The scraping functionality page."""
@@ -152,17 +309,15 @@ def scraping_page():
     
     # Use existing CSV if available
     use_existing_csv = False
-    if os.path.exists("hasil_sinta_metric.csv"):
-        use_existing_csv = st.checkbox("Gunakan file hasil_sinta_metric.csv yang sudah ada")
+    if os.path.exists(DEFAULT_CSV_PATH):
+        use_existing_csv = st.checkbox(f"Gunakan file {DEFAULT_CSV_PATH} yang sudah ada")
     
     if uploaded_file or use_existing_csv:
         if use_existing_csv:
-            csv_input = "hasil_sinta_metric.csv"
-            df = pd.read_csv(csv_input)
+            # Dibaca dari cache selama file CSV tidak berubah
+            df = load_institutions(DEFAULT_CSV_PATH)
         else:
-            # Save uploaded file temporarily
-            df = pd.read_csv(uploaded_file)
-            csv_input = uploaded_file.name
+            df = load_institutions(uploaded_file)
         
         st.success(f"File berhasil dimuat. Total institusi: {len(df)}")
         
@@ -171,27 +326,59 @@ def scraping_page():
         st.dataframe(df.head())
         
         # Delay configuration
-        delay = st.slider("Delay antar request (detik)", 0.5, 5.0, 1.0, 0.1)
+        delay = st.slider("Delay antar request (detik)", MIN_DELAY, 5.0, 1.0, 0.1,
+                          help="Batas laju global: rata-rata paling banyak 1 request per delay ini")
+        max_workers = st.slider("Jumlah request paralel", 1, 16, 4, 1)
+        parse_workers = st.slider("Jumlah proses parsing", 0, max(1, os.cpu_count() or 1), DEFAULT_PARSE_WORKERS, 1,
+                                  help="Halaman di-parse di proses terpisah agar tidak menghambat request; 0 = parse di thread request")
+        burst = st.slider("Burst request", 1, 10, 1, 1,
+                          help="Jumlah request yang boleh dimulai berturut-turut (tetap berjarak minimal "
+                               f"{MIN_DELAY} detik) sebelum batas laju berlaku")
+        resume = st.checkbox("Lanjutkan dari checkpoint terakhir", value=True,
+                             help="Jika scraping sebelumnya terputus dalam 24 jam terakhir, institusi yang "
+                                  "sudah diambil tidak di-scrape ulang")
+        use_cache = st.checkbox("Gunakan cache halaman", value=True,
+                                help="Halaman disimpan di disk dan divalidasi ulang dengan ETag/Last-Modified")
+        # Slider, bukan number_input: number_input di-patch main.py dan nilainya masuk ke SINTA_DB
+        cache_ttl_hours = st.slider("Masa berlaku cache (jam)", 0.0, 168.0, DEFAULT_TTL / 3600, 1.0,
+                                    help="Dalam rentang ini halaman dari cache dipakai tanpa request sama sekali",
+                                    disabled=not use_cache)
+        max_retries = st.slider("Percobaan ulang per institusi", 0, 6, DEFAULT_MAX_RETRIES, 1,
+                                help="Untuk HTTP 429/5xx dan timeout, dengan jeda eksponensial dan Retry-After")
+        
+        # Refresh inkremental terhadap hasil scraping terakhir
+        previous_output = latest_output()
+        incremental = st.checkbox("Refresh inkremental (hanya data baru/berubah/kedaluwarsa)",
+                                  value=previous_output is not None,
+                                  help=f"Dibandingkan dengan {previous_output or 'hasil scraping terakhir'}; "
+                                       "institusi lain disalin dari hasil tersebut")
+        max_age_days = st.slider("Umur maksimum data (hari)", 1, 90, DEFAULT_MAX_AGE.days, 1,
+                                 disabled=not incremental)
+        priority_names = st.multiselect("Institusi prioritas (diambil lebih dulu)",
+                                        sorted(df['Nama Institusi'].unique()), disabled=not incremental)
+        priority_ids = df.loc[df['Nama Institusi'].isin(priority_names), 'Sinta ID Link'].tolist()
         
         # Start scraping
         if st.button(" Mulai Scraping Data", type="primary"):
             with st.spinner("Sedang melakukan scraping... Proses ini mungkin memakan waktu beberapa menit."):
-                output_filename, results = perform_scraping(csv_input, delay)
-                
-                if results:
-                    st.success(f"Scraping selesai! Data telah disimpan ke {output_filename}")
-                    
-                    # Show download link
-                    with open(output_filename, 'r', encoding='utf-8') as f:
-                        st.download_button(
-                            label="📥 Download Hasil Scraping",
-                            data=f.read(),
-                            file_name=output_filename,
-                            mime="application/json"
-                        )
-                
-                else:
-                    st.error("Tidak ada data yang berhasil diambil")
+                output_filename, record_count = perform_scraping(df, delay, max_workers, burst, resume,
+                                                            parse_workers=parse_workers, use_cache=use_cache,
+                                                            cache_ttl=cache_ttl_hours * 3600,
+                                                            max_retries=max_retries, incremental=incremental,
+                                                            previous_output=previous_output,
+                                                            max_age=timedelta(days=max_age_days),
+                                                            priority_ids=priority_ids)
+                show_scraping_result(output_filename, record_count)
+
+        # Institusi yang gagal bisa diambil ulang tanpa scraping penuh
+        queued_count = len(RetryQueue())
+        if queued_count and st.button(f"🔁 Ambil Ulang Institusi yang Gagal ({queued_count})"):
+            with st.spinner("Mengambil ulang institusi yang gagal..."):
+                output_filename, record_count = drain_retry_queue(delay, max_workers, burst,
+                                                                  parse_workers=parse_workers, use_cache=use_cache,
+                                                                  cache_ttl=cache_ttl_hours * 3600,
+                                                                  max_retries=max_retries)
+                show_scraping_result(output_filename, record_count)
     
     else:
         st.warning("Silakan upload file CSV atau gunakan file hasil_sinta_metric.csv yang sudah ada")
@@ -202,5 +389,10 @@ def scraping_page():
     - File CSV harus memiliki kolom: `Kode PT`, `Nama Institusi`, `Sinta ID Link`, `Klaster`
     - Jika menggunakan file default, pastikan `hasil_sinta_metric.csv` tersedia di direktori utama
     - Gunakan delay yang cukup untuk menghindari pemblokiran dari server SINTA
-    - Hasil akan disimpan dalam file JSON dengan penamaan otomatis berdasarkan tanggal dan waktu
+    - Delay berlaku sebagai batas laju global; request paralel hanya menutupi waktu tunggu jaringan tanpa melampaui batas tersebut
+    - Hasil akan disimpan dalam file JSONL (satu institusi per baris) dengan penamaan otomatis berdasarkan tanggal dan waktu
+    - Progres dicatat di `sinta_scrape_journal.jsonl`; jika scraping terputus, jalankan lagi untuk melanjutkan sisa institusi
+    - Halaman yang sudah pernah diambil disimpan di folder `.sinta_cache`; halaman yang tidak berubah tidak diunduh maupun di-parse ulang
+    - Refresh inkremental hanya mengambil institusi baru, yang halamannya berubah sejak data terakhir, atau yang datanya lebih tua dari umur maksimum; sisanya disalin dari hasil terakhir
+    - Institusi yang tetap gagal setelah percobaan ulang dicatat di `sinta_retry_queue.jsonl` dan bisa diambil ulang dengan tombol "Ambil Ulang"
     """)
\ No newline at end of file
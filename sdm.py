@@ -4,6 +4,7 @@ import plotly.express as px
 
 # Import our enhanced modules
 from data_manager import get_val, set_val
+from indicator_registry import get_component
 
 def main():
     # Set page config without conflicting with main app
@@ -17,21 +18,9 @@ def main():
     st.markdown("Masukkan data kualifikasi SDM pada tabel di kiri. Perhitungan mencakup Reviewer dan Jabatan Fungsional.")
     st.divider()
 
-    # --- KONSTANTA RUMUS ---
-    PEMBAGI_NORMALISASI_SDM = 2.443   # Angka pembagi sesuai request
-
     # --- DATA SDM ---
-    # Format: (Kode, Nama Item, Bobot, Nilai Default from UPN Veteran Yogyakarta profile)
-    data_sdm = [
-        ("R1", "REVIEWER JURNAL INTERNASIONAL (ORANG)", 2, 0.0),
-        ("R2", "REVIEWER JURNAL NASIONAL SINTA 1 & 2 (ORANG)", 1, 0.0),
-        ("R3", "REVIEWER JURNAL NASIONAL SINTA 3 S.D. 6 (ORANG)", 0.5, 0.0),
-        ("DOS1", "DOSEN PROFESSOR", 4, 0.024),
-        ("DOS2", "DOSEN LEKTOR KEPALA", 3, 0.178),
-        ("DOS3", "DOSEN LEKTOR", 2, 0.481),
-        ("DOS4", "DOSEN ASISTEN AHLI", 1, 0.242),
-        ("DOS5", "DOSEN NON JAFA", 0, 0.076),
-    ]
+    # Kode, nama, bobot, nilai default dan pembagi normalisasi dari indicator_registry
+    component = get_component("SDM")
 
     # --- LAYOUT SETUP ---
     col_left, col_right = st.columns([1.6, 1], gap="large")
@@ -54,7 +43,7 @@ def main():
         h5.markdown("**Total**")
         st.markdown("---")
 
-        for kode, nama, bobot, default_val in data_sdm:
+        for _, kode, nama, bobot, default_val in component.rows:
             r1, r2, r3, r4, r5 = st.columns([0.6, 3.5, 0.6, 1.2, 1])
 
             with r1: st.write(f"**{kode}**")
@@ -67,7 +56,7 @@ def main():
                 val = st.number_input(
                     f"v_{kode}",
                     value=float(current_val),
-                    step=0.001,
+                    step=component.step(kode),
                     format="%.3f",
                     label_visibility="collapsed"
                 )
@@ -88,11 +77,8 @@ def main():
         st.markdown("### 📊 Analisis Skor")
 
         # --- RUMUS PERHITUNGAN ---
-        # (Total Score / 2.44) * 100
-        if total_score_raw > 0:
-            score_ternormal = (total_score_raw / max(total_score_raw, PEMBAGI_NORMALISASI_SDM)) * 100
-        else:
-            score_ternormal = 0.0
+        # (Total Score / max(pembagi normalisasi, Total Score)) * 100
+        score_ternormal = component.normalize(component.adjusted(total_score_raw))
 
         # --- TAMPILAN KARTU SKOR ---
 
@@ -115,8 +101,8 @@ def main():
         # Card 3: Ternormalisasi (Hasil Akhir)
         st.markdown(f"""
         <div style="background-color: #e6fffa; padding: 15px; border-radius: 8px; border: 1px solid #4fd1c5; margin-bottom: 20px;">
-            <h2 style="color: #234e52; margin:0;">{score_ternormal * 0.15:,.2f}</h2>
-            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal (15%)</b></p>
+            <h2 style="color: #234e52; margin:0;">{score_ternormal * component.weight:,.2f}</h2>
+            <p style="margin:0; font-size: 14px; color: #234e52;"><b>Total Score Ternormal ({component.weight:.0%})</b></p>
         </div>
         """, unsafe_allow_html=True)
 
@@ -0,0 +1,98 @@
+"""
+Sensitivity Module for SINTA Cluster Predictor
+
+This module measures how much the total score moves per unit of every
+indicator at the current state. A component's score is capped at 100 by
+max(raw, normalizer), so once a component is saturated its indicators add
+nothing; below the cap one unit of an indicator adds weight x adjustment x
+component weight x 100 / normalizer points. The gains of all indicators are
+computed in one matrix product and ranked, and the strategic
+recommendations follow that ranking.
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from indicator_registry import IndicatorRegistry, get_registry
+
+
+def marginal_gains(values: np.ndarray, registry: Optional[IndicatorRegistry] = None) -> np.ndarray:
+    """
+    Total-score gain per unit of every indicator.
+
+    Args:
+        values: Indicator values in registry code order, one vector or a
+            matrix of shape (n, len(codes)).
+        registry: Indicator registry (default the global registry).
+
+    Returns:
+        Gains with the same shape as values; 0 for indicators of a
+        saturated component.
+    """
+    registry = registry or get_registry()
+    raw = np.asarray(values, dtype=float) @ registry.weight_matrix
+    # Poin total per satuan skor mentah, 0 bila komponen sudah mencapai batas normalisasi
+    per_raw_point = np.where(raw < registry.normalizers,
+                             registry.component_weights * 100 / registry.normalizers, 0.0)
+    return per_raw_point @ registry.weight_matrix.T
+
+
+class SensitivityAnalyzer:
+    """Ranks indicators by their marginal effect on the total score."""
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None):
+        """
+        Args:
+            registry: Indicator registry (default the global registry).
+        """
+        self.registry = registry or get_registry()
+        self.component_of = [name for name in self.registry.names for _ in self.registry.component(name).codes]
+        self.indicator_names = [n for name in self.registry.names for n in self.registry.component(name).names]
+        self.steps = np.array([self.registry.component(name).step(code)
+                               for code, name in zip(self.registry.codes, self.component_of)])
+
+    def ranking(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        Rank every indicator by its gain per unit at the given state.
+
+        Args:
+            values: Current indicator values, in registry code order.
+
+        Returns:
+            DataFrame with Kode, Nama, Komponen, Nilai, Kenaikan per Unit,
+            Kenaikan per Langkah (one input step) and Jenuh, best first.
+        """
+        values = np.asarray(values, dtype=float)
+        gains = marginal_gains(values, self.registry)
+        saturated = (values @ self.registry.weight_matrix) >= self.registry.normalizers
+        df = pd.DataFrame({
+            "Kode": self.registry.codes,
+            "Nama": self.indicator_names,
+            "Komponen": self.component_of,
+            "Nilai": values,
+            "Kenaikan per Unit": gains,
+            "Kenaikan per Langkah": gains * self.steps,
+            "Jenuh": [bool(saturated[self.registry.names.index(name)]) for name in self.component_of]
+        })
+        return df.sort_values("Kenaikan per Unit", ascending=False, kind="stable").reset_index(drop=True)
+
+
+# Global instance of the sensitivity analyzer
+sensitivity_analyzer = SensitivityAnalyzer()
+
+
+def get_sensitivity_analyzer() -> SensitivityAnalyzer:
+    """Get the global sensitivity analyzer instance."""
+    return sensitivity_analyzer
+
+
+def indicator_ranking(get: Callable[[str, float], float]) -> pd.DataFrame:
+    """
+    Convenience function: rank the indicators at the current simulation values.
+
+    Args:
+        get: Lookup function such as data_manager.get_val(key, default).
+    """
+    return sensitivity_analyzer.ranking(sensitivity_analyzer.registry.read_values(get))
@@ -0,0 +1,125 @@
+"""
+SINTA Parser Module for SINTA Cluster Predictor
+
+This module parses the "Metrics Cluster" profile page of an institution into
+the sections dictionary used by the scraper. Only the part of the page that
+holds the tables is tokenized, and only <table> elements are built into the
+tree (SoupStrainer). The parser is still BeautifulSoup's html.parser, so
+malformed markup (unclosed rows and cells) is repaired exactly as in the
+original full-page implementation.
+"""
+
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Hanya elemen <table> yang di-parse, sisa halaman dilewati. Filter class
+# dilakukan setelah parse karena SoupStrainer bs4 >= 4.13 mencocokkan atribut
+# class sebagai string utuh ("table table-bordered"), bukan per kelas.
+TABLES_ONLY = SoupStrainer('table')
+
+
+def _table_region(html_content: str) -> Optional[str]:
+    """
+    Cut the page down to the span between the first <table and the last </table>.
+
+    Returns None when the page contains no table at all, and the whole page
+    when the cut would start inside a comment or a <script>/<style> block,
+    where a literal "<table" is not a real tag.
+    """
+    lower = html_content.lower()
+    start = lower.find('<table')
+    if start < 0:
+        return None
+    end = lower.rfind('</table>')
+    if end < start:
+        return html_content
+
+    head = lower[:start]
+    if (head.rfind('<!--') > head.rfind('-->')
+            or head.rfind('<script') > head.rfind('</script')
+            or head.rfind('<style') > head.rfind('</style')):
+        return html_content
+
+    return html_content[start:end + len('</table>')]
+
+
+def _first_th(ths, marker: str, need_colspan: bool = False):
+    """Return the first <th> whose style contains marker (like row.find with a style predicate)."""
+    for th in ths:
+        style = th.get('style')
+        if style and marker in style and (not need_colspan or th.get('colspan') is not None):
+            return th
+    return None
+
+
+def parse_metrics_page(html_content: str) -> Optional[Dict]:
+    """
+    Parse the metrics page HTML content and extract data.
+
+    Args:
+        html_content: HTML of the Metrics Cluster profile page.
+
+    Returns:
+        Dictionary of sections ('Score in ...' lists, their '(subtotal)'
+        lists and 'TOTAL ALL SCORE'), or None if the page has no metrics table.
+    """
+    region = _table_region(html_content)
+    if region is None:
+        return None
+
+    table = BeautifulSoup(region, 'html.parser', parse_only=TABLES_ONLY).find('table', class_='table')
+    if table is None:
+        return None
+
+    sections = {}
+    current_section = None
+
+    for row in table.find_all('tr'):
+        ths = row.find_all('th')
+
+        # Deteksi header section
+        header = _first_th(ths, 'border-left: 3px solid', need_colspan=True)
+        if header is not None and 'Total' not in header.get_text():
+            section_text = header.get_text(strip=True)
+            if 'Score in' in section_text:
+                current_section = section_text
+                sections[current_section] = []
+            continue
+
+        # Deteksi total akhir (TOTAL ALL SCORE)
+        total_all = _first_th(ths, '#FF6B1A')
+        if total_all is not None and 'TOTAL ALL SCORE' in total_all.get_text():
+            sections['TOTAL ALL SCORE'] = ths[-1].get_text(strip=True)
+            continue
+
+        # Deteksi subtotal section (Total Score Publication Ternormal, dll)
+        italic_total = _first_th(ths, 'font-style: italic')
+        if italic_total is not None:
+            label = italic_total.get_text(strip=True)
+            if 'Total Score' in label:
+                sections.setdefault(current_section + ' (subtotal)', []).append({
+                    'label': label,
+                    'value': ths[-1].get_text(strip=True)
+                })
+            continue
+
+        # Ambil data baris biasa (AI1, AN2, dll)
+        cols = row.find_all(['th', 'td'])
+        if len(cols) >= 5 and cols[0].get('style') and 'border-left: 3px solid' in cols[0].get('style'):
+            code = cols[1].get_text(strip=True)
+            name = cols[2].get_text(strip=True)
+            weight = cols[3].get_text(strip=True)
+            value = cols[4].get_text(strip=True).replace(',', '.')
+            total = cols[5].get_text(strip=True).replace(',', '.')
+
+            if current_section:
+                sections[current_section].append({
+                    'code': code,
+                    'name': name,
+                    'weight': weight,
+                    'value': value,
+                    'total': total
+                })
+
+    return sections
@@ -0,0 +1,32 @@
+"""Shared pytest setup: the app modules live flat in the repository root."""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scrape_output import JsonlRecordWriter, make_record, output_filename  # noqa: E402
+
+
+def write_scrape_output(directory, timestamp, count=30, seed=0):
+    """Write a JSONL scrape output of count institutions built from the metrics page fixture."""
+    with open(os.path.join(FIXTURES, "metrics_page.json"), encoding='utf-8') as f:
+        metrics = json.load(f)
+    rng = np.random.default_rng(seed)
+    path = os.path.join(directory, output_filename(timestamp=timestamp))
+    with JsonlRecordWriter(path) as writer:
+        for i in range(count):
+            page = json.loads(json.dumps(metrics))
+            for item in page["Score in Publication"]:
+                item["value"] = f"{rng.uniform(0, 5):.3f}"
+            row = {"Sinta ID Link": 1000 + i, "Kode PT": 2000 + i, "Nama Institusi": f"Institusi {i}",
+                   "Klaster": ["Pratama", "Madya", "Utama"][i % 3], "Sinta Score Overall": float(i)}
+            writer.write(make_record(row, page, timestamp))
+    return path
@@ -0,0 +1,100 @@
+"""Tests for batch_scoring: number parsing and vectorized scoring against ClusterPredictor."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from batch_scoring import BatchScorer, Cohort, parse_number, record_values
+from cluster_prediction import get_cluster_predictor
+from conftest import FIXTURES
+from data_manager import reset_sinta_data, restore_sinta_db
+from indicator_registry import COMPONENTS, get_registry
+
+
+def reference_scores(values):
+    """Score one institution indicator by indicator, the way the original ClusterPredictor did."""
+    components = {}
+    for name, spec in COMPONENTS.items():
+        total = sum(values.get(code, 0.0) * weight for _, code, _, weight, _ in spec["indicators"])
+        adjusted = total * spec["adjustment"]
+        components[name] = min(adjusted / spec["normalizer"], 1.0) * 100
+    total = sum(score * COMPONENTS[name]["weight"] for name, score in components.items())
+    return total, components
+
+
+@pytest.fixture
+def session_values():
+    """Yield a setter for SINTA_DB and restore the defaults afterwards."""
+    yield restore_sinta_db
+    reset_sinta_data()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12", 12.0),
+    ("0.136", 0.136),
+    ("1.776.69", 1776.69),           # "1.776,69" setelah koma desimal diganti titik
+    ("37.077.71", 37077.71),
+    (" 1 234.5 ", 1234.5),
+    (7, 7.0),
+    (2.5, 2.5),
+    ("", 0.0),
+    ("-", 0.0),
+    (None, 0.0),
+])
+def test_parse_number(text, expected):
+    assert parse_number(text) == pytest.approx(expected)
+
+
+def test_record_values_from_parsed_page():
+    with open(os.path.join(FIXTURES, "metrics_page.json"), encoding='utf-8') as f:
+        metrics = json.load(f)
+    values = record_values({"Metrics": metrics})
+    assert set(values) == set(get_registry().codes)
+    assert all(value >= 0 for value in values.values())
+
+
+def test_batch_scorer_matches_reference():
+    rng = np.random.default_rng(11)
+    registry = get_registry()
+    matrix = rng.uniform(0, 50, size=(40, len(registry.codes)))
+    matrix[:5] *= 1000  # beberapa institusi melewati batas normalisasi
+
+    scores = BatchScorer(registry).score_matrix(matrix)
+    for i in range(len(matrix)):
+        total, components = reference_scores(dict(zip(registry.codes, matrix[i])))
+        assert scores["total"][i] == pytest.approx(total)
+        assert scores["normalized"][i] == pytest.approx([components[name] for name in registry.names])
+
+
+def test_batch_scorer_matches_cluster_predictor(session_values):
+    registry = get_registry()
+    predictor = get_cluster_predictor()
+    rng = np.random.default_rng(5)
+    scorer = BatchScorer(registry)
+
+    for _ in range(5):
+        values = rng.uniform(0, 20, size=len(registry.codes))
+        session_values(dict(zip(registry.storage_keys, values.tolist())))
+        total, components = predictor.calculate_detailed_scores()
+
+        scores = scorer.score_matrix(values[np.newaxis, :])
+        assert scores["total"][0] == pytest.approx(total)
+        assert scores["normalized"][0] == pytest.approx([components[name] for name in registry.names])
+
+
+def test_cohort_columns_are_aligned():
+    registry = get_registry()
+    records = [
+        {"Sinta ID": 1, "Metrics": {"Score in Publication": [{"code": "AI1", "value": "2"}]}},
+        {"Sinta ID": 2, "Metrics": {"Score in Research": [{"code": "P1", "value": "1.5"}]}},
+    ]
+    cohort = Cohort.from_records(records, codes=["P1", "AI1"])
+    scorer = BatchScorer(registry)
+    aligned = scorer.score_matrix(cohort.matrix, cohort.codes)
+
+    full = np.zeros((2, len(registry.codes)))
+    full[0, registry.index["AI1"]] = 2
+    full[1, registry.index["P1"]] = 1.5
+    assert aligned["total"] == pytest.approx(scorer.score_matrix(full)["total"])
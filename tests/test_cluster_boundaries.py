@@ -0,0 +1,93 @@
+"""Tests for cluster_boundaries: fitting and the cached model lookup."""
+
+import os
+from datetime import datetime
+
+import pytest
+
+import cluster_boundaries
+import cohort_index
+from cluster_boundaries import BoundaryStore, fit_boundaries
+from cohort_index import CohortIndexManager
+from indicator_registry import get_registry
+from scrape_output import JsonlRecordWriter, output_filename
+
+# Nilai AI1 per klaster; skor total naik bersama nilainya
+LEVELS = {"Pratama": 1.0, "Madya": 4.0, "Utama": 8.0, "Mandiri": 14.0}
+
+
+def _write_output(directory, timestamp, shift=0.0):
+    path = os.path.join(directory, output_filename(timestamp=timestamp))
+    with JsonlRecordWriter(path) as writer:
+        for klaster, level in LEVELS.items():
+            for i in range(5):
+                writer.write({
+                    "Sinta ID": f"{klaster}-{i}",
+                    "Nama Institusi": f"{klaster} {i}",
+                    "Klaster": klaster,
+                    "Metrics": {"Score in Publication": [{"code": "AI1", "value": str(level + shift + i * 0.1)}]}
+                })
+    return path
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    manager = CohortIndexManager(str(tmp_path))
+    monkeypatch.setattr(cohort_index, "cohort_index_manager", manager)
+    monkeypatch.setattr(cluster_boundaries, "cohort_index_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def store(tmp_path, manager):
+    return BoundaryStore(str(tmp_path / "boundaries.json"))
+
+
+def test_fit_boundaries_separates_clusters():
+    totals = [1, 2, 3, 10, 11, 12, 20, 21]
+    labels = ["Pratama"] * 3 + ["Madya"] * 3 + ["Utama"] * 2
+    model = fit_boundaries(totals, labels)
+    assert model.clusters == ["Pratama", "Madya", "Utama"]
+    assert model.accuracy == 1.0
+    assert [model.lookup(t) for t in (0, 6, 15, 50)] == ["Pratama", "Pratama", "Madya", "Utama"]
+
+
+def test_model_is_cached_until_invalidated(tmp_path, store, monkeypatch):
+    _write_output(str(tmp_path), datetime(2000, 1, 1))
+    model = store.get_model()
+    assert model is not None and model.clusters == list(LEVELS)
+
+    calls = []
+    monkeypatch.setattr(cluster_boundaries, "latest_cohort_path", lambda *a: calls.append(a) or None)
+    for _ in range(100):
+        assert store.get_model() is model
+    assert calls == []  # tidak ada listdir/stat pada jalur panas
+
+
+def test_invalidate_picks_up_new_scrape(tmp_path, store, manager):
+    _write_output(str(tmp_path), datetime(2000, 1, 1))
+    first = store.get_model()
+    index = manager.get_index()
+
+    store.invalidate()
+    assert store.get_model() is first  # output sama: tidak di-fit ulang
+
+    _write_output(str(tmp_path), datetime(2000, 1, 2), shift=100.0)
+    assert store.get_model() is first  # scrape baru belum dicatat
+    assert manager.get_index() is index
+    manager.invalidate()
+    store.invalidate()
+    second = store.get_model()
+    assert second is not first
+    assert second.cuts[0] > first.cuts[0]
+
+
+def test_normalizer_change_refits(tmp_path, store):
+    registry = get_registry()
+    _write_output(str(tmp_path), datetime(2000, 1, 1))
+    first = store.get_model()
+    try:
+        registry.set_normalizers({"Publikasi": 10.0})
+        assert store.get_model() is not first
+    finally:
+        registry.reset_normalizers()
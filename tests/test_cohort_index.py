@@ -0,0 +1,92 @@
+"""Tests for cohort_index: the sorted arrays must always mirror the current cohort."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import cohort_index
+from batch_scoring import BatchScorer
+from cohort_index import CohortIndex, CohortIndexManager
+from conftest import write_scrape_output
+from indicator_registry import IndicatorRegistry
+
+
+def _record(sinta_id, value, klaster="Madya"):
+    return {
+        "Sinta ID": sinta_id,
+        "Nama Institusi": f"Institusi {sinta_id}",
+        "Klaster": klaster,
+        "Metrics": {"Score in Publication": [{"code": "AI1", "value": str(value)}]}
+    }
+
+
+def _assert_consistent(index):
+    totals = sorted(entry["total"] for entry in index.entries.values())
+    assert index.sorted_totals.tolist() == pytest.approx(totals)
+    assert sorted(index.sorted_ids.tolist()) == sorted(index.entries)
+    for k, name in enumerate(index.components):
+        column = sorted(entry["components"][k] for entry in index.entries.values())
+        assert index.sorted_components[name].tolist() == pytest.approx(column)
+
+
+@pytest.fixture
+def index():
+    return CohortIndex(BatchScorer(IndicatorRegistry()))
+
+
+@pytest.mark.parametrize("dropped", [2, 30])  # sedikit: hapus inkremental, banyak: urut ulang penuh
+def test_replace_removes_missing_institutions(index, dropped):
+    records = [_record(i, i) for i in range(50)]
+    index.upsert(records, replace=True)
+    assert len(index) == 50
+
+    remaining = records[dropped:]
+    assert index.upsert(remaining, replace=True) == dropped
+    assert len(index) == 50 - dropped
+    assert not set(index.entries) & {str(i) for i in range(dropped)}
+    _assert_consistent(index)
+    assert index.rank(index.sorted_totals[-1]) == 1
+    assert index.percentile(index.sorted_totals[0]) == pytest.approx(100 / (50 - dropped))
+
+
+def test_upsert_without_replace_keeps_others(index):
+    index.upsert([_record(i, i) for i in range(20)])
+    index.upsert([_record(100, 5)])
+    assert len(index) == 21
+    _assert_consistent(index)
+
+
+def test_changed_and_removed_together(index):
+    index.upsert([_record(i, i) for i in range(40)], replace=True)
+    records = [_record(i, i) for i in range(1, 40)]
+    records[0] = _record(1, 500)  # nilai berubah
+    assert index.upsert(records, replace=True) == 2
+    assert "0" not in index.entries
+    assert index.sorted_ids[-1] == "1"
+    _assert_consistent(index)
+
+
+def test_unchanged_records_only_update_labels(index):
+    index.upsert([_record(i, i) for i in range(10)], replace=True)
+    totals = np.array(index.sorted_totals)
+    assert index.upsert([_record(i, i, "Utama") for i in range(10)], replace=True) == 0
+    assert index.entries["3"]["klaster"] == "Utama"
+    assert np.array_equal(index.sorted_totals, totals)
+
+
+def test_manager_skips_disk_until_invalidated(tmp_path, monkeypatch):
+    write_scrape_output(str(tmp_path), datetime(2000, 1, 1))
+    manager = CohortIndexManager(str(tmp_path), BatchScorer(IndicatorRegistry()))
+    first = manager.get_index()
+    assert len(first) == 30
+
+    calls = []
+    monkeypatch.setattr(cohort_index, "latest_cohort_path", lambda *a: calls.append(a) or None)
+    for _ in range(100):
+        assert manager.get_index() is first
+    assert calls == []  # tidak ada listdir/stat pada setiap rerun
+
+    manager.invalidate()
+    manager.get_index()
+    assert len(calls) == 1
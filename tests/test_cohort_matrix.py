@@ -0,0 +1,67 @@
+"""Tests for cohort_matrix: the memory-mapped matrix file and the index built from it."""
+
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import cohort_index
+from batch_scoring import BatchScorer, Cohort
+from cohort_index import CohortIndex, CohortIndexManager
+from conftest import write_scrape_output
+from cohort_matrix import ALIGNMENT, MatrixStore, get_matrix_store, open_matrix, read_header, write_matrix
+from indicator_registry import IndicatorRegistry
+from scrape_output import iter_records
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
+
+
+def test_matrix_round_trip(tmp_path):
+    cohort = Cohort(["1", "2", "3"], ["A", "B", "C"], ["Madya", "Utama", None], ["AI1", "P1"],
+                    np.array([[1.5, 0.0], [2.25, 3.0], [0.0, 1e6]]))
+    path = write_matrix(str(tmp_path / "cohort.f32mat"), cohort, "v1", "source.jsonl")
+
+    header, offset = read_header(path)
+    assert offset % ALIGNMENT == 0
+    assert header["source_version"] == "v1" and header["codes"] == ["AI1", "P1"]
+    header, matrix = open_matrix(path)
+    assert isinstance(matrix, np.memmap) and not matrix.flags.writeable
+    np.testing.assert_array_equal(matrix, cohort.matrix.astype(np.float32))
+    assert header["ids"] == ["1", "2", "3"] and header["klaster"] == ["Madya", "Utama", None]
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.f32mat"
+    path.write_bytes(b"not a matrix")
+    with pytest.raises(ValueError):
+        read_header(str(path))
+
+
+def test_stale_matrix_is_not_used(workdir):
+    source = write_scrape_output(workdir, datetime(2000, 1, 1))
+    store = MatrixStore()
+    store.write(source)
+    assert store.is_fresh(source)
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write("\n")
+    assert not store.is_fresh(source)
+
+
+def test_index_is_built_from_matrix_without_parsing(workdir, monkeypatch):
+    source = write_scrape_output(workdir, datetime(2000, 1, 1))
+    scorer = BatchScorer(IndicatorRegistry())
+    expected = CohortIndex(scorer)
+    expected.upsert(iter_records(source), replace=True)
+
+    get_matrix_store().write(source)
+    monkeypatch.setattr(cohort_index, "iter_records", lambda path: pytest.fail("JSONL parsed"))
+    index = CohortIndexManager(workdir, scorer).get_index()
+
+    assert sorted(index.entries) == sorted(expected.entries)
+    np.testing.assert_allclose(index.sorted_totals, expected.sorted_totals, rtol=1e-5)
+    assert os.path.exists(get_matrix_store().matrix_path(source))
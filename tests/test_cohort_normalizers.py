@@ -0,0 +1,70 @@
+"""Tests for cohort-derived normalizers: caching, new scrapes and per-session use."""
+
+import threading
+from datetime import datetime
+
+import cohort_normalizers
+from conftest import write_scrape_output
+from cohort_normalizers import METHOD_DEFAULT, METHOD_MAX, CohortNormalizers
+from indicator_registry import IndicatorRegistry
+
+
+def _normalizers(tmp_path):
+    return CohortNormalizers(str(tmp_path / "normalizers.json"), str(tmp_path), IndicatorRegistry())
+
+
+def test_apply_skips_disk_until_invalidated(tmp_path, monkeypatch):
+    write_scrape_output(str(tmp_path), datetime(2000, 1, 1))
+    normalizers = _normalizers(tmp_path)
+    entry = normalizers.apply(METHOD_MAX)
+    assert normalizers.registry.component("Publikasi").normalizer == entry["normalizers"]["Publikasi"]
+
+    calls = []
+    monkeypatch.setattr(cohort_normalizers, "latest_cohort_path", lambda *a: calls.append(a) or None)
+    monkeypatch.setattr(normalizers, "_load", lambda: calls.append("load") or {"entries": {}})
+    for _ in range(100):
+        assert normalizers.apply(METHOD_MAX) is entry
+    assert calls == []  # tidak ada listdir/stat/baca JSON pada setiap rerun
+
+
+def test_invalidate_picks_up_new_scrape(tmp_path):
+    write_scrape_output(str(tmp_path), datetime(2000, 1, 1))
+    normalizers = _normalizers(tmp_path)
+    first = normalizers.apply(METHOD_MAX)
+
+    write_scrape_output(str(tmp_path), datetime(2000, 1, 2), seed=1)
+    assert normalizers.apply(METHOD_MAX) is first  # scrape baru belum dicatat
+    normalizers.invalidate()
+    second = normalizers.apply(METHOD_MAX)
+    assert second["version"] != first["version"]
+    assert normalizers.registry.component("Publikasi").normalizer == second["normalizers"]["Publikasi"]
+
+
+def test_sessions_keep_their_own_normalizers(tmp_path):
+    write_scrape_output(str(tmp_path), datetime(2000, 1, 1))
+    normalizers = _normalizers(tmp_path)
+    registry = normalizers.registry
+    base = registry.base_normalizers["Publikasi"]
+    seen = {}
+
+    def session():
+        # Sesi lain (thread skrip Streamlit lain) memilih pembagi kohort
+        entry = normalizers.apply(METHOD_MAX)
+        seen["other"] = (registry.component("Publikasi").normalizer, registry.version, entry)
+
+    thread = threading.Thread(target=session)
+    thread.start()
+    thread.join()
+
+    normalizer, version, entry = seen["other"]
+    assert normalizer == entry["normalizers"]["Publikasi"] != base
+    assert version != 0
+    # Sesi ini tetap memakai pembagi bawaan
+    assert registry.component("Publikasi").normalizer == base
+    assert registry.version == 0
+
+    # Pembagi yang sama di sesi lain mendapat versi yang sama (cache bersama tetap berlaku)
+    normalizers.apply(METHOD_MAX)
+    assert registry.version == version
+    normalizers.apply(METHOD_DEFAULT)
+    assert registry.version == 0 and registry.component("Publikasi").normalizer == base
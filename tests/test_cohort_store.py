@@ -0,0 +1,79 @@
+"""Tests for cohort_store: snapshot read paths must match parsing the scrape output."""
+
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from batch_scoring import BatchScorer, Cohort
+from cohort_index import CohortIndex, CohortIndexManager
+from cohort_store import CohortStore, get_cohort_store
+from conftest import write_scrape_output
+from indicator_registry import IndicatorRegistry
+from score_history import ScoreHistory
+from scrape_output import iter_records
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Toko global memakai direktori relatif (cohort_store/)
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
+
+
+def test_snapshot_cohort_matches_records(workdir):
+    source = write_scrape_output(workdir, datetime(2000, 1, 1))
+    store = CohortStore()
+    assert not store.is_fresh(source)
+    store.write_snapshot(source)
+    assert store.is_fresh(source)
+
+    expected = Cohort.from_records(iter_records(source))
+    cohort = store.load_cohort(source)
+    assert [str(i) for i in expected.ids] == cohort.ids
+    assert cohort.klaster == expected.klaster
+    np.testing.assert_allclose(cohort.matrix, expected.matrix)
+
+    labels = store.read_labels(source)
+    record = next(iter_records(source))
+    assert labels[str(record["Sinta ID"])] == {
+        "Nama Institusi": record["Nama Institusi"], "Klaster": record["Klaster"],
+        "Content Hash": record["Content Hash"], "Sinta Score Overall": record["Sinta Score Overall"],
+        "Sinta Score 3Yr": None
+    }
+
+
+def test_index_from_snapshot_matches_records(workdir):
+    source = write_scrape_output(workdir, datetime(2000, 1, 1))
+    get_cohort_store().write_snapshot(source)
+    scorer = BatchScorer(IndicatorRegistry())
+
+    manager = CohortIndexManager(workdir, scorer)
+    from_snapshot = manager.get_index()
+    from_records = CohortIndex(scorer)
+    from_records.upsert(iter_records(source), replace=True)
+
+    assert from_snapshot.sorted_ids.tolist() == from_records.sorted_ids.tolist()
+    np.testing.assert_allclose(from_snapshot.sorted_totals, from_records.sorted_totals)
+
+    # Scrape berikutnya dengan institusi lebih sedikit: snapshot baru menyinkronkan indeks
+    newer = write_scrape_output(workdir, datetime(2000, 1, 2), count=20, seed=1)
+    get_cohort_store().write_snapshot(newer)
+    assert len(manager.get_index()) == 30  # scrape baru belum dicatat
+    manager.invalidate()
+    assert len(manager.get_index()) == 20
+
+
+def test_history_from_snapshot_matches_records(workdir):
+    source = write_scrape_output(workdir, datetime(2000, 1, 1))
+    from_records = ScoreHistory(os.path.join(workdir, "json.db"))
+    assert from_records.ingest(source) == 30
+
+    get_cohort_store().write_snapshot(source)
+    from_snapshot = ScoreHistory(os.path.join(workdir, "parquet.db"))
+    assert from_snapshot.ingest(source) == 30
+
+    for sinta_id in (1000, 1017):
+        a, b = from_records.trend(sinta_id), from_snapshot.trend(sinta_id)
+        assert a.to_dict("records") == b.to_dict("records")
@@ -0,0 +1,71 @@
+"""Tests for incremental_scoring: delta updates must match a full recomputation."""
+
+import numpy as np
+import pytest
+
+from data_manager import get_val, reset_sinta_data, restore_sinta_db, set_val
+from incremental_scoring import get_incremental_evaluator
+from indicator_registry import get_registry
+
+
+def full_scores():
+    """Score the current session values from scratch."""
+    registry = get_registry()
+    scores = registry.score_vector(registry.read_values(get_val))
+    return float(scores["total"]), scores["normalized"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    reset_sinta_data()
+    yield
+    get_registry().reset_normalizers()
+    reset_sinta_data()
+
+
+def test_single_edits_match_full_recompute():
+    evaluator = get_incremental_evaluator()
+    registry = get_registry()
+    rng = np.random.default_rng(3)
+    evaluator.scores(get_val)
+    stats = evaluator.stats()
+
+    for _ in range(300):
+        key = registry.storage_keys[rng.integers(len(registry.storage_keys))]
+        # Sesekali nilai sangat besar supaya komponen melewati batas normalisasi lalu turun lagi
+        value = float(rng.uniform(0, 5)) if rng.random() < 0.9 else float(rng.uniform(1e3, 1e6))
+        set_val(key, value)
+
+        total, components = evaluator.scores(get_val)
+        expected_total, expected_components = full_scores()
+        assert total == pytest.approx(expected_total, rel=1e-9, abs=1e-9)
+        assert [components[name] for name in registry.names] == pytest.approx(expected_components.tolist())
+
+    after = evaluator.stats()
+    assert after["updates"] > stats["updates"]
+    assert after["rebuilds"] == stats["rebuilds"]  # tidak ada hitung ulang penuh selama edit tunggal
+
+
+def test_new_key_starts_from_its_default():
+    evaluator = get_incremental_evaluator()
+    registry = get_registry()
+    key = registry.storage_keys[0]
+    values = registry.default_values()
+    del values[key]
+    restore_sinta_db(values)
+    evaluator.scores(get_val)
+
+    set_val(key, 3.0)
+    assert evaluator.scores(get_val)[0] == pytest.approx(full_scores()[0])
+
+
+def test_bulk_change_and_normalizer_change_rebuild():
+    evaluator = get_incremental_evaluator()
+    registry = get_registry()
+    evaluator.scores(get_val)
+
+    restore_sinta_db({key: 1.0 for key in registry.storage_keys})
+    assert evaluator.scores(get_val)[0] == pytest.approx(full_scores()[0])
+
+    registry.set_normalizers({name: 10.0 for name in registry.names})
+    assert evaluator.scores(get_val)[0] == pytest.approx(full_scores()[0])
@@ -0,0 +1,68 @@
+"""Tests for incremental refresh planning."""
+
+import json
+from datetime import datetime, timedelta
+
+from conftest import write_scrape_output
+from http_cache import ResponseCache
+from refresh_planner import REASON_CHANGED, REASON_NEW, REASON_STALE, plan_refresh, row_key
+from scrape_output import JsonlRecordWriter, make_record, output_filename
+from scraper_engine import profile_url
+
+SCRAPED = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _rows(path):
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    return [{"Sinta ID Link": record["Sinta ID"], "Kode PT": record["Kode PT"],
+             "Nama Institusi": record["Nama Institusi"], "Klaster": record["Klaster"],
+             "Sinta Score Overall": 0.0} for record in records]
+
+
+def test_unchanged_rows_are_carried_over(tmp_path):
+    path = write_scrape_output(str(tmp_path), SCRAPED, count=5)
+    # Skor CSV yang konstan (0 untuk semua baris) tidak memicu scraping ulang
+    plan = plan_refresh(_rows(path), path, now=SCRAPED + timedelta(days=1))
+    assert plan.to_scrape == []
+    assert len(plan.carried) == 5
+
+
+def test_stale_and_new_rows_are_scheduled(tmp_path):
+    path = write_scrape_output(str(tmp_path), SCRAPED, count=3)
+    rows = _rows(path) + [{"Sinta ID Link": 9999, "Kode PT": 1, "Nama Institusi": "Baru", "Klaster": "Mandiri"}]
+
+    plan = plan_refresh(rows, path, max_age=timedelta(days=7), now=SCRAPED + timedelta(days=8))
+    assert plan.counts()[REASON_STALE] == 3
+    assert plan.to_scrape[0]["Sinta ID Link"] == 9999
+    assert plan.reasons[row_key(rows[-1])] == REASON_NEW
+
+
+def test_duplicate_sinta_ids_are_matched_by_kode_pt(tmp_path):
+    path = str(tmp_path / output_filename(timestamp=SCRAPED))
+    rows = [{"Sinta ID Link": 27, "Kode PT": 1008, "Nama Institusi": "Universitas Diponegoro", "Klaster": "Mandiri"},
+            {"Sinta ID Link": 27, "Kode PT": 61008, "Nama Institusi": "Universitas Muhammadiyah Surakarta",
+             "Klaster": "Utama"}]
+    with JsonlRecordWriter(path) as writer:
+        writer.write(make_record(rows[0], {"Score in Publication": []}, SCRAPED))
+
+    plan = plan_refresh(rows, path, now=SCRAPED + timedelta(hours=1))
+    assert [row["Kode PT"] for row in plan.carried] == [1008]
+    assert [row["Kode PT"] for row in plan.to_scrape] == [61008]
+    assert next(plan.carried_records())["Nama Institusi"] == "Universitas Diponegoro"
+
+
+def test_newer_cached_page_with_other_metrics_is_changed(tmp_path):
+    path = write_scrape_output(str(tmp_path), SCRAPED, count=2)
+    rows = _rows(path)
+    cache = ResponseCache(str(tmp_path / "cache"))
+    # Halaman diambil (mis. oleh retry) setelah record ditulis, dengan isi yang berbeda
+    cache.put(profile_url(rows[0]["Sinta ID Link"]), "<html></html>", metrics={"Score in Publication": []})
+    # Halaman yang isinya sama dengan record tidak dianggap berubah
+    with open(path, encoding='utf-8') as f:
+        unchanged = json.loads(f.readlines()[1])["Metrics"]
+    cache.put(profile_url(rows[1]["Sinta ID Link"]), "<html></html>", metrics=unchanged)
+
+    plan = plan_refresh(rows, path, now=datetime.now(), max_age=timedelta(days=100000), cache=cache)
+    assert [row["Sinta ID Link"] for row in plan.to_scrape] == [rows[0]["Sinta ID Link"]]
+    assert plan.reasons[row_key(rows[0])] == REASON_CHANGED
@@ -0,0 +1,88 @@
+"""Tests for scenario_store: diff-only saves, versions and listing."""
+
+import sqlite3
+
+import pytest
+
+from indicator_registry import get_registry
+from scenario_store import ScenarioStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScenarioStore(str(tmp_path / "scenarios.db"))
+
+
+@pytest.fixture
+def defaults():
+    return get_registry().default_values()
+
+
+def _rows(store, table):
+    with sqlite3.connect(store.path) as connection:
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_save_writes_only_changed_keys(store, defaults):
+    assert store.save("Utama", defaults, "awal") == (1, len(defaults))
+
+    edited = dict(defaults, AI1=defaults["AI1"] + 1)
+    assert store.save("Utama", edited, "satu edit") == (2, 1)
+    assert _rows(store, "scenario_changes") == len(defaults) + 1
+
+    # Tanpa perubahan: tidak ada versi baru dan tidak ada baris yang ditulis
+    assert store.save("Utama", edited) == (2, 0)
+    assert _rows(store, "scenario_versions") == 2
+
+
+def test_load_current_and_earlier_versions(store, defaults):
+    first = dict(defaults)
+    second = dict(defaults, AI1=9.0, v_P1=3.0)
+    third = {key: value for key, value in second.items() if key != "v_P1"}
+    third["AI2"] = 7.5
+    for values in (first, second, third):
+        store.save("Skenario", values)
+
+    assert store.load("Skenario") == third
+    assert store.load("Skenario", version=3) == third
+    assert store.load("Skenario", version=2) == second
+    assert store.load("Skenario", version=1) == first
+    assert store.load("Skenario", version=4) is None
+    assert store.load("Tidak Ada") is None
+
+
+def test_non_numeric_values_are_skipped(store, defaults):
+    store.save("Campuran", dict(defaults, catatan="teks"))
+    assert "catatan" not in store.load("Campuran")
+
+
+def test_list_and_query_without_values(store, defaults):
+    registry = get_registry()
+    results = store.upsert_many({f"S{i}": dict(defaults, AI1=float(i)) for i in range(5)}, "impor")
+    assert all(result == (1, len(defaults)) for result in results.values())
+
+    listing = store.list_scenarios()
+    assert sorted(listing["Nama"]) == [f"S{i}" for i in range(5)]
+    expected = float(registry.score_vector(registry.read_values(dict(defaults, AI1=4.0).get))["total"])
+    assert listing.set_index("Nama").loc["S4", "Total"] == pytest.approx(expected)
+    assert (listing["Jumlah Input"] == len(defaults)).all()
+
+    assert list(store.list_scenarios(name_like="S3")["Nama"]) == ["S3"]
+    assert len(store.list_scenarios(limit=2)) == 2
+    high = store.list_scenarios(min_total=expected)
+    assert "S4" in set(high["Nama"]) and "S0" not in set(high["Nama"])
+
+
+def test_versions_and_delete(store, defaults):
+    store.save("Hapus", defaults, "awal")
+    store.save("Hapus", dict(defaults, AI1=5.0), "naik")
+    history = store.versions("Hapus")
+    assert list(history["Versi"]) == [2, 1]
+    assert list(history["Catatan"]) == ["naik", "awal"]
+    assert list(history["Input Berubah"]) == [1, len(defaults)]
+
+    assert store.delete("Hapus")
+    assert not store.delete("Hapus")
+    assert store.load("Hapus") is None
+    assert _rows(store, "scenario_values") == 0
+    assert _rows(store, "scenario_changes") == 0
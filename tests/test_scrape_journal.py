@@ -0,0 +1,61 @@
+"""Tests for the checkpoint journal and how perform_scraping resumes from it."""
+
+import pandas as pd
+import pytest
+
+import scraping_module
+from scrape_journal import CheckpointJournal
+
+
+def _row(sinta_id, kode_pt, nama):
+    return {"Sinta ID Link": sinta_id, "Kode PT": kode_pt, "Nama Institusi": nama, "Klaster": "Mandiri"}
+
+
+def _journal_with_entry(path):
+    journal = CheckpointJournal(str(path))
+    journal.append({"Sinta ID": 428, "Nama Institusi": "Institut Pertanian Bogor", "Metrics": {}})
+    return journal
+
+
+def test_compact_keeps_latest_entry_per_institution(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = _journal_with_entry(path)
+    journal.append({"Sinta ID": 428, "Nama Institusi": "Institut Pertanian Bogor", "Metrics": {"x": 1}})
+
+    reloaded = CheckpointJournal(str(path))
+    assert reloaded.load() == 1
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 1
+    assert reloaded.restore(428, {"Kode PT": 2003})["Metrics"] == {"x": 1}
+
+
+def test_completed_run_clears_journal(tmp_path, monkeypatch):
+    path = tmp_path / "journal.jsonl"
+    _journal_with_entry(path)
+    seen = []
+    monkeypatch.setattr(scraping_module, "_scrape_rows",
+                        lambda rows, journal, *args: seen.append(journal.is_finished(428)) or ("out.jsonl", 1))
+
+    frame = pd.DataFrame([_row(428, 2003, "Institut Pertanian Bogor")])
+    scraping_module.perform_scraping(frame, journal_path=str(path),
+                                     retry_queue_path=str(tmp_path / "queue.jsonl"))
+
+    # Run ini melanjutkan checkpoint, run berikutnya mengambil ulang semuanya
+    assert seen == [True]
+    assert not path.exists()
+    assert CheckpointJournal(str(path)).load() == 0
+
+
+def test_interrupted_run_stays_resumable(tmp_path, monkeypatch):
+    path = tmp_path / "journal.jsonl"
+    _journal_with_entry(path)
+
+    def interrupted(*args):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(scraping_module, "_scrape_rows", interrupted)
+    frame = pd.DataFrame([_row(428, 2003, "Institut Pertanian Bogor")])
+    with pytest.raises(KeyboardInterrupt):
+        scraping_module.perform_scraping(frame, journal_path=str(path),
+                                         retry_queue_path=str(tmp_path / "queue.jsonl"))
+
+    assert CheckpointJournal(str(path)).load() == 1
@@ -0,0 +1,70 @@
+"""Tests for the scrape retry queue."""
+
+from scrape_retry import RetryQueue
+
+
+def _row(sinta_id, kode_pt, nama):
+    return {"Sinta ID Link": sinta_id, "Kode PT": kode_pt, "Nama Institusi": nama}
+
+
+def test_duplicate_sinta_ids_keep_every_row(tmp_path):
+    queue = RetryQueue(str(tmp_path / "queue.jsonl"))
+    # Sinta ID 27 dipakai dua institusi berbeda di hasil_sinta_metric.csv
+    queue.add(27, _row(27, 1008, "Universitas Diponegoro"), "HTTP 503")
+    queue.add(27, _row(27, 61008, "Universitas Muhammadiyah Surakarta"), "timeout")
+    queue.add(428, _row(428, 2003, "Institut Pertanian Bogor"), "HTTP 429")
+
+    assert len(queue) == 3
+    rows = queue.rows()
+    assert sorted(row["Kode PT"] for row in rows) == [1008, 2003, 61008]
+
+    queue.resolve(27, _row(27, 1008, "Universitas Diponegoro"))
+    assert sorted(row["Kode PT"] for row in queue.rows()) == [2003, 61008]
+
+
+def test_repeated_failure_keeps_latest_entry(tmp_path):
+    queue = RetryQueue(str(tmp_path / "queue.jsonl"))
+    queue.add(27, _row(27, 1008, "Universitas Diponegoro"), "HTTP 503")
+    queue.add(27, _row(27, 1008, "Universitas Diponegoro"), "timeout")
+
+    entries = queue.entries()
+    assert len(entries) == 1
+    assert entries[0]["error"] == "timeout"
+
+
+def test_unreadable_lines_are_skipped(tmp_path):
+    path = tmp_path / "queue.jsonl"
+    queue = RetryQueue(str(path))
+    queue.add(428, _row(428, 2003, "Institut Pertanian Bogor"), "HTTP 429")
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"row": \n')
+
+    assert [entry["Sinta ID"] for entry in queue.entries()] == [428]
+
+
+def test_rows_stay_queued_until_resolved(tmp_path):
+    path = tmp_path / "queue.jsonl"
+    queue = RetryQueue(str(path))
+    queue.add(27, _row(27, 1008, "Universitas Diponegoro"), "HTTP 503")
+    queue.add(428, _row(428, 2003, "Institut Pertanian Bogor"), "HTTP 429")
+
+    # Drain yang terputus setelah satu institusi berhasil
+    RetryQueue(str(path)).resolve(428, _row(428, 2003, "Institut Pertanian Bogor"))
+
+    reopened = RetryQueue(str(path))
+    assert [row["Kode PT"] for row in reopened.rows()] == [1008]
+    reopened.compact()
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 1
+    assert len(RetryQueue(str(path))) == 1
+
+
+def test_resolving_unqueued_rows_writes_nothing(tmp_path):
+    path = tmp_path / "queue.jsonl"
+    queue = RetryQueue(str(path))
+    queue.resolve(428, _row(428, 2003, "Institut Pertanian Bogor"))
+    assert not path.exists()
+
+    queue.add(27, _row(27, 1008, "Universitas Diponegoro"), "HTTP 503")
+    queue.resolve(27, _row(27, 1008, "Universitas Diponegoro"))
+    queue.compact()
+    assert not path.exists()
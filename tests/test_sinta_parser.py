@@ -0,0 +1,62 @@
+"""Tests for sinta_parser against golden outputs of the original html.parser implementation."""
+
+import json
+import os
+
+import pytest
+
+from conftest import FIXTURES, ROOT
+from sinta_parser import parse_metrics_page
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _real_page():
+    # Halaman profil SINTA asli yang ikut di repositori
+    with open(os.path.join(ROOT, "sinta.html"), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("page", ["metrics_page", "metrics_page_malformed"])
+def test_matches_golden_output(page):
+    expected = json.loads(_fixture(page + ".json"))
+    assert parse_metrics_page(_fixture(page + ".html")) == expected
+
+
+def test_real_page_matches_golden_output():
+    # sinta.html hanya memuat tabel statistik tanpa baris metrics, jadi hasilnya kosong (bukan None)
+    assert parse_metrics_page(_real_page()) == json.loads(_fixture("sinta.json"))
+
+
+def test_metrics_table_inside_real_page():
+    # Tabel metrics disisipkan ke halaman asli sebelum tabel statistik: potongan
+    # wilayah tabel harus melewati komentar, script dan markup lain di sekitarnya
+    page = _real_page()
+    metrics = _fixture("metrics_page.html")
+    table = metrics[metrics.find('<table'):metrics.rfind('</table>') + len('</table>')]
+    position = page.find('<table class="table table-borderless')
+    page = page[:position] + table + page[position:]
+    assert parse_metrics_page(page) == json.loads(_fixture("metrics_page.json"))
+
+
+def test_metrics_page_sections():
+    sections = parse_metrics_page(_fixture("metrics_page.html"))
+    publication = sections["Score in Publication"]
+    assert [item["code"] for item in publication[:3]] == ["AI1", "AI2", "AI3"]
+    assert len(sections["Score in Publication (subtotal)"]) == 2
+    assert sections["TOTAL ALL SCORE"]
+
+
+def test_malformed_rows_keep_html_parser_nesting():
+    # html.parser tidak menutup <th>/<td> otomatis, jadi teks baris berikutnya ikut masuk ke header
+    sections = parse_metrics_page(_fixture("metrics_page_malformed.html"))
+    assert "Score in X" not in sections
+    assert any(key.startswith("Score in XaK1n123") for key in sections)
+
+
+def test_page_without_metrics_table():
+    assert parse_metrics_page("<html><body><p>Tidak ada data</p></body></html>") is None
+    assert parse_metrics_page(_fixture("metrics_page.html").replace('class="table table-bordered', 'class="grid')) is None